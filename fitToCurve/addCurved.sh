@@ -1,5 +1,3 @@
 #!/bin/bash
-for i in {1..117}
-do 
-	python fitToCurve.py $i
-done
+# refits every filter in one process, see fitToCurve.py for fitting only new filters
+python fitToCurve.py --all
@@ -0,0 +1,118 @@
+"""
+Micro-benchmark of IModel.CalculateAllDataFittingTarget(), the objective simplex and DE call for every
+set of coefficients. The compiled fitting target is timed against the code it replaced (uncompiledFittingTarget()
+below: fixed coefficients applied in a loop, CalculateModelErrors() allocating the prediction, absolute, relative
+and percent error arrays, then a chain of fitting target comparisons) for a double exponential on curves of
+10, 100 and 1000 points. Both give the same values, the benchmark stops if they do not.
+
+	python benchmarkFittingTarget.py [number of calls per test]
+"""
+import os
+import sys
+import timeit
+
+import numpy
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import pyeq2
+import scipy.odr.odrpack
+
+
+def uncompiledFittingTarget(self, inCoeffs):
+	"""IModel.CalculateAllDataFittingTarget() before the fitting targets were compiled"""
+	if not self.AreCoefficientsWithinBounds(inCoeffs):
+		return 1.0E300
+	try:
+		try:
+			if self.fixedCoefficients != []:
+				self._canLinearSolverBeUsedForSSQABS = False
+				for i in range(len(inCoeffs)):
+					if self.fixedCoefficients[i]:
+						inCoeffs[i] = self.fixedCoefficients[i]
+		except:
+			pass
+		self.CalculateModelErrors(inCoeffs, self.dataCache.allDataCacheDictionary)
+		error = self.modelAbsoluteError
+		if len(self.dataCache.allDataCacheDictionary['Weights']):
+			error = error * self.dataCache.allDataCacheDictionary['Weights']
+		if self.fittingTarget == "SSQABS":
+			val = numpy.sum(numpy.square(error))
+		elif self.fittingTarget == "SSQREL":
+			val = numpy.sum(numpy.square(error / self.dataCache.allDataCacheDictionary['DependentData']))
+		elif self.fittingTarget == "ABSABS":
+			val = numpy.sum(numpy.abs(error))
+		elif self.fittingTarget == "ABSREL":
+			val = numpy.sum(numpy.abs(error / self.dataCache.allDataCacheDictionary['DependentData']))
+		elif self.fittingTarget == "PEAKABS":
+			val = numpy.max(numpy.abs(error))
+		elif self.fittingTarget == "PEAKREL":
+			val = numpy.max(numpy.abs(error / self.dataCache.allDataCacheDictionary['DependentData']))
+		elif self.fittingTarget == "ODR":
+			model = scipy.odr.odrpack.Model(self.WrapperForODR)
+			data = scipy.odr.odrpack.Data(self.dataCache.allDataCacheDictionary['IndependentData'],  self.dataCache.allDataCacheDictionary['DependentData'])
+			myodr = scipy.odr.odrpack.ODR(data, model, beta0=inCoeffs, maxit=0)
+			myodr.set_job(fit_type=2)
+			val = myodr.run().sum_square
+		else:
+			ncoef = 1.0 * len(inCoeffs)
+			nobs = 1.0 * len(self.dataCache.allDataCacheDictionary['DependentData'])
+			ll = -(nobs*0.5)*(1.0 + numpy.log(2.0*numpy.pi)) - (nobs*0.5)*numpy.log(numpy.dot(error,error)/nobs)
+			if self.fittingTarget == "AIC":
+				val = -2.0*ll/nobs + (2.0*ncoef/nobs)
+			else:
+				val = -2.0*ll/nobs + (ncoef*numpy.log(nobs))/nobs
+		if numpy.isfinite(val):
+			return val
+		return 1.0E300
+	except:
+		return 1.0E300
+
+
+def makeEquation(fittingTarget, points):
+	"""A double exponential with the data of a synthetic activity curve"""
+	random = numpy.random.RandomState(points)
+	deltaT = numpy.linspace(0.1, 5.0, points)
+	activity = 900.0 * numpy.exp(-0.8 * deltaT) + 150.0 * numpy.exp(-0.05 * deltaT) + random.normal(0.0, 5.0, points)
+	equation = pyeq2.Models_2D.Exponential.DoubleExponential(fittingTarget)
+	pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((deltaT, activity)), equation, False)
+	equation.dataCache.FindOrCreateAllDataCache(equation)
+	return equation
+
+
+def callsPerSecond(function, coefficients):
+	"""The best of three passes over the coefficients"""
+	best = None
+	for run in range(3):
+		start = timeit.default_timer()
+		for coeffs in coefficients:
+			function(coeffs)
+		elapsed = timeit.default_timer() - start
+		if best is None or elapsed < best:
+			best = elapsed
+	return len(coefficients) / best
+
+
+def benchmark(callCount):
+	print "%-8s %7s %16s %16s %8s" % ('target', 'points', 'before (call/s)', 'after (call/s)', 'speedup')
+	for fittingTarget in sorted(pyeq2.IModel.IModel.fittingTargetDictionary.keys()):
+		for points in [10, 100, 1000]:
+			equation = makeEquation(fittingTarget, points)
+			calls = callCount
+			if fittingTarget == 'ODR':
+				calls = max(1, callCount / 50)
+			coefficients = numpy.random.RandomState(1).uniform([800.0, -1.0, 100.0, -0.1], [1000.0, -0.6, 200.0, 0.0], (calls, 4))
+			for coeffs in coefficients[:10]:
+				before = uncompiledFittingTarget(equation, coeffs.copy())
+				after = equation.CalculateAllDataFittingTarget(coeffs.copy())
+				if before != after:
+					raise ValueError('%s gives %r instead of %r' % (fittingTarget, after, before))
+			before = callsPerSecond(lambda coeffs: uncompiledFittingTarget(equation, coeffs), coefficients)
+			after = callsPerSecond(equation.CalculateAllDataFittingTarget, coefficients)
+			print "%-8s %7d %16.0f %16.0f %7.1fx" % (fittingTarget, points, before, after, after / before)
+
+
+if __name__ == "__main__":
+	if len(sys.argv) > 1:
+		benchmark(int(sys.argv[1]))
+	else:
+		benchmark(20000)
@@ -0,0 +1,84 @@
+"""
+Benchmark of the strategies DataCache uses to draw the reduced data set that DE searches on (see
+DataCache.reducedDataStrategyDictionary). For each strategy a double exponential is fitted to synthetic activity
+curves, DE running from its random population without an estimate, which would seed it or skip DE, then refined by
+Levenberg-Marquardt and the simplex on all data as IModel.Solve() does. Reported per strategy, summed over the curves:
+	DE time      seconds spent in SolverService.SolveUsingDE()
+	SSQ gen 5    the all data SSQ of DE's best coefficients after 5 generations, how fast DE converges
+	DE SSQ       the all data SSQ at the coefficients DE returns
+	refine time  seconds spent in Levenberg-Marquardt and the simplex after DE
+	final SSQ    the all data SSQ after Levenberg-Marquardt and the simplex
+	best         curves on which the strategy's final SSQ is the lowest of all strategies (ties count for each)
+
+	python benchmarkReducedDataStrategies.py [number of curves]
+"""
+import os
+import sys
+import timeit
+
+import numpy
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import pyeq2
+from pyeq2.Services import diffev
+
+
+class RecordingDiffEvolver(diffev.DiffEvolver):
+	"""A DiffEvolver that keeps the last instance, for the history of its best coefficients"""
+	last = None
+
+	def __init__(self, *args, **kwargs):
+		super(RecordingDiffEvolver, self).__init__(*args, **kwargs)
+		RecordingDiffEvolver.last = self
+
+
+def makeEquation(strategy, seed):
+	"""A double exponential with the data of a synthetic activity curve, a fast decay onto a slow one"""
+	random = numpy.random.RandomState(seed)
+	deltaT = numpy.linspace(0.1, 5.0, 300)
+	activity = random.uniform(500.0, 1500.0) * numpy.exp(-random.uniform(1.0, 4.0) * deltaT) + random.uniform(50.0, 200.0) * numpy.exp(-random.uniform(0.01, 0.1) * deltaT)
+	activity += random.normal(0.0, 0.01, 300) * activity
+	equation = pyeq2.Models_2D.Exponential.DoubleExponential('SSQABS')
+	equation.reducedDataStrategy = strategy
+	pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((deltaT, activity)), equation, False)
+	equation.dataCache.FindOrCreateAllDataCache(equation)
+	return equation
+
+
+def fit(strategy, seed, generation):
+	"""Returns [DE time, all data SSQ after generation, DE SSQ, refine time, final SSQ]"""
+	equation = makeEquation(strategy, seed)
+	solver = pyeq2.solverService()
+	start = timeit.default_timer()
+	equation.estimatedCoefficients = solver.SolveUsingDE(equation)
+	deTime = timeit.default_timer() - start
+	history = RecordingDiffEvolver.last.best_vec_history
+	generationSSQ = equation.CalculateAllDataFittingTarget(numpy.array(history[min(generation, len(history)) - 1], dtype = float))
+	deSSQ = equation.CalculateAllDataFittingTarget(numpy.array(equation.estimatedCoefficients, dtype = float))
+	start = timeit.default_timer()
+	equation.estimatedCoefficients = solver.SolveUsingLevenbergMarquardt(equation)
+	coefficients = solver.SolveUsingSimplex(equation)
+	refineTime = timeit.default_timer() - start
+	return [deTime, generationSSQ, deSSQ, refineTime, equation.CalculateAllDataFittingTarget(numpy.array(coefficients, dtype = float))]
+
+
+def benchmark(curves):
+	strategies = sorted(pyeq2.DataCache.DataCache.DataCache.reducedDataStrategyDictionary.keys())
+	diffev.DiffEvolver, DiffEvolver = RecordingDiffEvolver, diffev.DiffEvolver
+	try:
+		results = dict((strategy, [fit(strategy, seed, 5) for seed in range(curves)]) for strategy in strategies)
+	finally:
+		diffev.DiffEvolver = DiffEvolver
+	lowest = [min(results[strategy][seed][4] for strategy in strategies) for seed in range(curves)]
+	print "%-10s %8s %12s %12s %12s %12s %8s" % ('strategy', 'DE time', 'SSQ gen 5', 'DE SSQ', 'refine time', 'final SSQ', 'best')
+	for strategy in strategies:
+		totals = numpy.sum(results[strategy], axis = 0)
+		best = len([seed for seed in range(curves) if results[strategy][seed][4] <= lowest[seed] * (1.0 + 1.0E-9)])
+		print "%-10s %7.3fs %12.4g %12.4g %11.3fs %12.6g %5d/%d" % (strategy, totals[0], totals[1], totals[2], totals[3], totals[4], best, curves)
+
+
+if __name__ == "__main__":
+	if len(sys.argv) > 1:
+		benchmark(int(sys.argv[1]))
+	else:
+		benchmark(20)
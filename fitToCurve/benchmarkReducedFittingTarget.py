@@ -0,0 +1,93 @@
+"""
+Benchmark of DE on the reduced data with the model's own fitting target against DE on the reduced data sum of
+squares, which SolveUsingDE() used for every fitting target before. For each fitting target a double exponential
+is fitted to synthetic activity curves (weighted and unweighted). No estimate is made, so DE runs from its random
+population: a matrix pencil estimate would seed the population, or skip DE if it reaches DE's stopping value.
+Reported per target, summed over the curves:
+	DE time    seconds spent in SolverService.SolveUsingDE()
+	DE value   the all data fitting target at the coefficients DE returns
+	fmin calls function evaluations of the simplex that starts from them
+	final      the all data fitting target after the simplex
+Lower is better for all of them.
+
+	python benchmarkReducedFittingTarget.py [number of curves]
+"""
+import os
+import sys
+import timeit
+
+import numpy
+import scipy.optimize
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import pyeq2
+
+
+def makeEquation(fittingTarget, seed, weighted):
+	"""A double exponential with the data of a synthetic activity curve, weighted by 1/sqrt(activity) if asked"""
+	random = numpy.random.RandomState(seed)
+	deltaT = numpy.linspace(0.1, 5.0, 100)
+	activity = random.uniform(500.0, 1500.0) * numpy.exp(-random.uniform(0.5, 1.5) * deltaT) + random.uniform(50.0, 200.0) * numpy.exp(-random.uniform(0.01, 0.1) * deltaT)
+	activity += random.normal(0.0, 0.01, 100) * activity
+	equation = pyeq2.Models_2D.Exponential.DoubleExponential(fittingTarget)
+	if weighted:
+		pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((deltaT, activity, 1.0 / numpy.sqrt(activity))), equation, True)
+	else:
+		pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((deltaT, activity)), equation, False)
+	equation.dataCache.FindOrCreateAllDataCache(equation)
+	return equation
+
+
+def solveUsingDE(equation, deFittingTarget):
+	"""SolveUsingDE() with DE on deFittingTarget, returns (coefficients, seconds)"""
+	fittingTarget = equation.fittingTarget
+	equation.fittingTarget = deFittingTarget
+	try:
+		start = timeit.default_timer()
+		coefficients = pyeq2.solverService().SolveUsingDE(equation)
+		elapsed = timeit.default_timer() - start
+	finally:
+		equation.fittingTarget = fittingTarget
+	return numpy.array(coefficients, dtype = float), elapsed
+
+
+def simplex(equation, coefficients):
+	"""SolveUsingSimplex() from coefficients, returns (coefficients, function evaluations)"""
+	solver = pyeq2.solverService()
+	results = scipy.optimize.fmin(equation.GetAllDataFittingTarget(), coefficients, maxiter = len(coefficients) * solver.fminIterationLimit, maxfun = len(coefficients) * 2500, disp = 0, xtol = 1.0E-16, ftol = 1.0E-16, full_output = 1)
+	return results[0], results[3]
+
+
+def benchmark(curves):
+	print "%-8s %-8s %10s %16s %10s %16s %16s" % ('target', 'DE on', 'DE time', 'DE value', 'fmin calls', 'final', 'curves better')
+	for fittingTarget in sorted(pyeq2.IModel.IModel.fittingTargetDictionary.keys()):
+		results = {}
+		for deFittingTarget in ['SSQABS', fittingTarget]:
+			totals = [0.0, 0.0, 0, 0.0]
+			finals = []
+			for curve in range(curves):
+				equation = makeEquation(fittingTarget, curve, curve % 2 == 1)
+				coefficients, elapsed = solveUsingDE(equation, deFittingTarget)
+				deValue = equation.CalculateAllDataFittingTarget(coefficients.copy())
+				coefficients, calls = simplex(equation, coefficients)
+				final = equation.CalculateAllDataFittingTarget(coefficients.copy())
+				finals.append(final)
+				totals[0] += elapsed
+				totals[1] += deValue
+				totals[2] += calls
+				totals[3] += final
+			results[deFittingTarget] = (totals, finals)
+		for deFittingTarget in ['SSQABS', fittingTarget]:
+			if deFittingTarget == fittingTarget and fittingTarget == 'SSQABS':
+				continue
+			totals, finals = results[deFittingTarget]
+			other = results['SSQABS' if deFittingTarget != 'SSQABS' else fittingTarget][1]
+			better = len([i for i in range(curves) if finals[i] < other[i] - 1.0E-9 * abs(other[i])])
+			print "%-8s %-8s %9.3fs %16.6g %10d %16.6g %13d/%d" % (fittingTarget, deFittingTarget, totals[0], totals[1], totals[2], totals[3], better, curves)
+
+
+if __name__ == "__main__":
+	if len(sys.argv) > 1:
+		benchmark(int(sys.argv[1]))
+	else:
+		benchmark(10)
@@ -0,0 +1,73 @@
+"""
+Benchmark of the data cache columns shared between models (pyeq2.DataCache.SharedColumnCache). Every named 2D
+equation, as the fit-all examples go through them, gets its own instance with the same data and calculates
+its data cache columns, once with every instance calculating its own columns and once sharing them whatever the
+number of points. Only the columns are timed, not converting the data. By default a DataCache only shares the
+columns of data with at least DataCache.minimumPointsForSharedColumns points.
+
+	python benchmarkSharedDataCache.py [number of data points]
+"""
+import inspect
+import os
+import sys
+import timeit
+
+import numpy
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import pyeq2
+
+
+def equationClasses():
+	"""The named 2D equations, without splines, user selectable and user defined equations"""
+	classes = []
+	for submodule in inspect.getmembers(pyeq2.Models_2D):
+		if inspect.ismodule(submodule[1]):
+			for equationClass in inspect.getmembers(submodule[1]):
+				if inspect.isclass(equationClass[1]) and issubclass(equationClass[1], pyeq2.IModel.IModel):
+					equation = equationClass[1]
+					if equation.splineFlag or equation.userSelectablePolynomialFlag or equation.userSelectablePolyfunctionalFlag or equation.userSelectableRationalFlag or equation.userDefinedFunctionFlag:
+						continue
+					classes.append(equation)
+	return classes
+
+
+def cacheColumns(classes, rawData, shared):
+	"""Returns (seconds, number of equations) to calculate the data cache of every equation, converting the data is not timed"""
+	equations = 0
+	elapsed = 0.0
+	for equationClass in classes:
+		equation = equationClass('SSQABS')
+		if shared:
+			equation.dataCache.minimumPointsForSharedColumns = 0
+		else:
+			equation.dataCache.sharedColumnCache = None
+		try:
+			pyeq2.dataConvertorService().ConvertNumpyArrays(rawData, equation, False)
+		except:
+			continue # the equation cannot accept this data set
+		start = timeit.default_timer()
+		equation.dataCache.FindOrCreateAllDataCache(equation)
+		elapsed += timeit.default_timer() - start
+		equations += 1
+	return elapsed, equations
+
+
+def benchmark(points):
+	x = numpy.linspace(0.5, 5.0, points)
+	rawData = numpy.column_stack((x, 900.0 * numpy.exp(-0.8 * x) + 150.0 * numpy.exp(-0.05 * x)))
+	classes = equationClasses()
+	sharedColumnCache = pyeq2.dataCache.sharedColumnCache
+	sharedColumnCache.Clear()
+	unshared, equations = cacheColumns(classes, rawData, False)
+	shared = cacheColumns(classes, rawData, True)[0]
+	print "%d equations, %d points" % (equations, points)
+	print "own columns     %8.3f s" % unshared
+	print "shared columns  %8.3f s   %.1fx, %d hits, %d misses, %.1f MB cached" % (shared, unshared / shared, sharedColumnCache.hits, sharedColumnCache.misses, sharedColumnCache.numberOfBytes / 1.0E6)
+
+
+if __name__ == "__main__":
+	if len(sys.argv) > 1:
+		benchmark(int(sys.argv[1]))
+	else:
+		benchmark(100000)
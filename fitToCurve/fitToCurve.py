@@ -1,20 +1,64 @@
 """ 
 This python program takes data from the full *Activity files generated by the calculate.c program and calculates the coefficients for a double exponential function using that data. It will print the numbers to screen as well as appending the data to two files: alphaCoefficients and betaCoefficients.
+
+	python fitToCurve.py [FilterID ...]   fits these filters
+	python fitToCurve.py                  fits the curves that are missing or whose Activity data changed
+	python fitToCurve.py --all            refits every filter
+The batch modes take -j [processes] first to set the size of the worker pool (default: one per core).
 """
 
-import os, sys, inspect,sqlite3,datetime
+import os, sys, inspect,datetime,itertools,multiprocessing,hashlib
+import numpy
 
 # ensure pyeq2 can be imported
 if os.path.join(sys.path[0][:sys.path[0].rfind(os.sep)], '../..') not in sys.path:
     sys.path.append(os.path.join(sys.path[0][:sys.path[0].rfind(os.sep)], '../..'))
 import pyeq2
 
-def fitToCurve(filterID):
+# radnetDB lives next to the schema in ../sql
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'sql'))
+import radnetDB
+
+# bump this when a change to the fitting code changes the fitted curves, every curve is then refitted on the next run
+FITVERSION = 5
+
+def fitSettings():
+	"""Describes how curves are fitted, part of every InputHash"""
+	equation = pyeq2.Models_2D.Exponential.DoubleExponential()
+	return '%d %s %s %s' % (FITVERSION, equation.__class__.__name__, equation.fittingTarget, equation.extendedVersionHandler.__class__.__name__)
+
+FITSETTINGS = fitSettings()
+
+
+def inputHash(data):
+	"""Returns the InputHash of a curve: a hash of its (DeltaT, activity) rows, whatever order they come in, and FITSETTINGS"""
+	data = numpy.ascontiguousarray(data[numpy.lexsort(data.T[::-1])], dtype = float)
+	return hashlib.sha1(FITSETTINGS + data.tostring()).hexdigest()
+
+
+def solveCurve(data):
+	"""Fits a double exponential to an array of (DeltaT, activity) rows and returns the solved equation"""
+	# a new equation for every curve, the data cache of a solved equation still holds the data it was solved with
 	equation = pyeq2.Models_2D.Exponential.DoubleExponential()
+	#get coefficients from zunzun, the arrays go to pyeq2 as they are (no text formatting and parsing)
+	pyeq2.dataConvertorService().ConvertNumpyArrays(data, equation, False)
+	equation.Solve()
+	return equation
+
+
+def printCurve(equation):
+	#print coeff to screen
+	print equation.GetDisplayName(), str(equation.GetDimensionality()) + "D"
+	print equation.fittingTargetDictionary[equation.fittingTarget], '=', equation.CalculateAllDataFittingTarget(equation.solvedCoefficients)
+	print "Fitted Parameters:"
+
+	for i in range(len(equation.solvedCoefficients)):
+		print "    %s = %-.16E" % (equation.GetCoefficientDesignators()[i], equation.solvedCoefficients[i])
+
 
-	#establish connection to database file
-	conn = sqlite3.connect("../sql/radnet.db")
-	cur = conn.cursor()
+def fitToCurve(filterID, database = None):
+	#shared connection to the database file (radnetDB.databasePath() decides which one if database is None)
+	conn = radnetDB.getConnection(database)
 
 	#get filterid if filterNum was entered
 	"""
@@ -26,70 +70,125 @@ def fitToCurve(filterID):
 	"""
 	filterID = int(filterID)
 
-	# What this section does is reads the data from the file given from the initial argument and formats it so the zunzun.com code can read it. We need two separate Strings so we can have two equations found.
-	alpha = 'X\tY\n'
-	beta = 'X\tY\n'
-	""" reference old code
-	alpha = alpha + data1 + "\t" + data2 + "\n"
-	beta = beta + data3 + "\t" + data4 + "\n"
-	"""
-	#get all the data from sql
-	cur.execute("""SELECT DeltaT, AlphaAct, BetaAct FROM Activity WHERE FilterID = ?""",(filterID,))
-	wholeDate =  cur.fetchall()
-	for dataPoint in wholeDate:
-		alpha = alpha + str(dataPoint[0]) + "\t" + str(dataPoint[1]) + "\n"
-		beta = beta + str(dataPoint[0]) + "\t" + str(dataPoint[2]) + "\n"
+	#get all the data from sql as one array with the columns DeltaT, AlphaAct, BetaAct
+	wholeData = numpy.array(radnetDB.filterActivity(conn, filterID), dtype = float).reshape(-1, 3)
 
 	#fit plot to alpha data 
-
-	#get coefficients from zunzun
-	data = alpha
-	pyeq2.dataConvertorService().ConvertAndSortColumnarASCII(data, equation, False)
-	equation.Solve()
-    
-	#print coeff to screen
+	data = wholeData[:, [0, 1]]
+	equation = solveCurve(data)
 	print("This is for alpha data:\n")
-	print equation.GetDisplayName(), str(equation.GetDimensionality()) + "D"
-	print equation.fittingTargetDictionary[equation.fittingTarget], '=', equation.CalculateAllDataFittingTarget(equation.solvedCoefficients)
-	print "Fitted Parameters:"
-
-	for i in range(len(equation.solvedCoefficients)):
-		print "    %s = %-.16E" % (equation.GetCoefficientDesignators()[i], equation.solvedCoefficients[i])
+	printCurve(equation)
 
-	#change the coefficients to float type
-	alphaInitial1 = float(equation.solvedCoefficients[0])
-	alphaLam1 = float(equation.solvedCoefficients[1])
-	alphaInitial2 = float(equation.solvedCoefficients[2])
-	alphaLam2 = float(equation.solvedCoefficients[3])
-
-	# put data into database
-	for i in [(filterID,alphaInitial1,alphaLam1, alphaInitial2, alphaLam2)]:
-		cur.execute("""INSERT INTO AlphaCurve (FilterID, Alpha1, Alpha1Lambda, Alpha2, Alpha2Lambda) VALUES (?,?,?,?,?)""", i)
+	# put data into database, replacing the filter's old curve
+	radnetDB.saveAlphaCurves(conn, [[filterID] + [float(c) for c in equation.solvedCoefficients] + [inputHash(data)]])
 	conn.commit()
 
 
 	#fit plot to beta data
-	data = beta
-	pyeq2.dataConvertorService().ConvertAndSortColumnarASCII(data, equation, False)
-	equation.Solve()
-    
+	data = wholeData[:, [0, 2]]
+	equation = solveCurve(data)
 	print("\nThis is for beta data:\n")
-	print equation.GetDisplayName(), str(equation.GetDimensionality()) + "D"
-	print equation.fittingTargetDictionary[equation.fittingTarget], '=', equation.CalculateAllDataFittingTarget(equation.solvedCoefficients)
-	print "Fitted Parameters:"
+	printCurve(equation)
 
-	for i in range(len(equation.solvedCoefficients)):
-		print "    %s = %-.16E" % (equation.GetCoefficientDesignators()[i], equation.solvedCoefficients[i])
+	radnetDB.saveBetaCurves(conn, [[filterID] + [float(c) for c in equation.solvedCoefficients] + [inputHash(data)]])
+	conn.commit()
 
-	betaInitial1 = float(equation.solvedCoefficients[0])
-	betaLam1 = float(equation.solvedCoefficients[1])
-	betaInitial2 = float(equation.solvedCoefficients[2])
-	betaLam2 = float(equation.solvedCoefficients[3])
 
-	for i in [(filterID, betaInitial1, betaLam1, betaInitial2, betaLam2)]:
-		cur.execute("""INSERT INTO BetaCurve (FilterID, Beta1, Beta1Lambda, Beta2, Beta2Lambda) VALUES (?,?,?,?,?)""", i)
-	conn.commit()
-	conn.close()
+def fitTask(task):
+	"""Pool worker: fits one (FilterID, 'alpha' or 'beta', data, InputHash) task and returns (FilterID, curve, coefficients, InputHash, error)"""
+	filterID, curve, data, dataHash = task
+	# the error goes back as text, a failed fit must not stop the pool
+	try:
+		return (filterID, curve, [float(c) for c in solveCurve(data).solvedCoefficients], dataHash, None)
+	except Exception, e:
+		return (filterID, curve, None, dataHash, str(e))
+
+
+def writeCurves(conn, alphaRows, betaRows):
+	"""Adds or replaces the curves in alphaRows/betaRows in one transaction"""
+	with conn:
+		radnetDB.saveAlphaCurves(conn, alphaRows)
+		radnetDB.saveBetaCurves(conn, betaRows)
+
+
+def fitAll(database = None, refitAll = False, processes = None, batchSize = 32):
+	"""
+	Batch mode: fits every curve that is missing or stale, i.e. its InputHash doesn't match the filter's
+	current Activity data and FITSETTINGS (every curve if refitAll). pyeq2 and scipy are only imported once and
+	the readings come from one query. Every alpha and beta curve is a task for a pool of worker processes, the
+	results come back in order to this process, which is the only one writing to the database, and are
+	written every batchSize curves. Returns the number of curves fitted.
+	"""
+	begin = datetime.datetime.now()
+	conn = radnetDB.getConnection(database)
+	alphaHashes, betaHashes = radnetDB.curveHashes(conn)
+	if processes is None:
+		processes = multiprocessing.cpu_count()
+
+	tasks = []
+	upToDate = 0
+	for filterID, rows in radnetDB.activityByFilter(conn):
+		wholeData = numpy.array(rows, dtype = float)
+		for curve, columns, hashes in [('alpha', [0, 1], alphaHashes), ('beta', [0, 2], betaHashes)]:
+			data = wholeData[:, columns]
+			dataHash = inputHash(data)
+			if refitAll or hashes.get(filterID) != dataHash:
+				tasks.append((filterID, curve, data, dataHash))
+			else:
+				upToDate += 1
+	print "Fitting %d curves with %d processes, %d curves are up to date" % (len(tasks), processes, upToDate)
+
+	pool = None
+	if processes > 1:
+		pool = multiprocessing.Pool(processes)
+		# imap keeps the results in task order, so reruns write the curves in the same order
+		results = pool.imap(fitTask, tasks, max(1, len(tasks) / (4 * processes)))
+	else:
+		results = itertools.imap(fitTask, tasks)
+
+	fitted = 0
+	rows = {'alpha': [], 'beta': []}
+	try:
+		for filterID, curve, coefficients, dataHash, error in results:
+			# a curve that can't be fitted is reported and tried again on the next run
+			if error is not None:
+				print "Filter %d %s could not be fitted: %s" % (filterID, curve, error)
+				continue
+			rows[curve].append([filterID] + coefficients + [dataHash])
+			print "Filter %d %s: %s" % (filterID, curve, ', '.join('%-.6E' % c for c in coefficients))
+			if len(rows['alpha']) + len(rows['beta']) >= batchSize:
+				writeCurves(conn, rows['alpha'], rows['beta'])
+				fitted += len(rows['alpha']) + len(rows['beta'])
+				rows = {'alpha': [], 'beta': []}
+		writeCurves(conn, rows['alpha'], rows['beta'])
+		fitted += len(rows['alpha']) + len(rows['beta'])
+		if pool is not None:
+			pool.close()
+	except:
+		if pool is not None:
+			pool.terminate()
+		raise
+	finally:
+		if pool is not None:
+			pool.join()
+
+	elapsed = (datetime.datetime.now() - begin).total_seconds()
+	print "Fitted %d of %d curves in %.1f s" % (fitted, len(tasks), elapsed)
+	return fitted
+
 
 if __name__ == "__main__":
-	fitToCurve(sys.argv[1])
+	args = sys.argv[1:]
+	processes = None
+	if args[0:1] == ['-j']:
+		processes = int(args[1])
+		args = args[2:]
+	if not args:
+		# batch mode, only the missing and stale curves
+		fitAll(processes = processes)
+	elif args[0] == '--all':
+		fitAll(refitAll = True, processes = processes)
+	else:
+		# several filters reuse the same connection
+		for filterID in args:
+			fitToCurve(filterID)
@@ -14,6 +14,7 @@ import sys, os, unittest
 if os.path.join(sys.path[0][:sys.path[0].rfind(os.sep)], '..') not in sys.path:
     sys.path.append(os.path.join(sys.path[0][:sys.path[0].rfind(os.sep)], '..'))
 import pyeq2
+import SharedColumnCache
 
 import numpy
 numpy.seterr(over = 'raise', divide = 'raise', invalid = 'raise', under = 'ignore') # numpy raises warnings, convert to exceptions to trap them
@@ -21,81 +22,207 @@ numpy.seterr(over = 'raise', divide = 'raise', invalid = 'raise', under = 'ignor
 
 
 class DataCache(object):
+
+    # the strategies for drawing the points of the reduced data set besides the extrema, a model selects one
+    # by name with its reducedDataStrategy attribute.  Each method returns about inModel.numberOfReducedDataPoints
+    # indices into the all data cache, duplicates are allowed.  The data are sorted by dependent value
+    reducedDataStrategyDictionary = {'Even':      'ReducedDataIndices_Even',      # evenly spaced in data order, so evenly spaced quantiles of the dependent data
+                                     'Curvature': 'ReducedDataIndices_Curvature', # half evenly spaced along the first independent variable, half where the curve bends
+                                     'ArcLength': 'ReducedDataIndices_ArcLength', # evenly spaced along the length of the curve
+                                     'QuantileY': 'ReducedDataIndices_QuantileY', # nearest to evenly spaced dependent values
+                                     'Random':    'ReducedDataIndices_Random'     # random, repeatable with the model's reducedDataRandomSeed
+                                    }
+    
+    # columns shared with every other DataCache, set to None on an instance to calculate all of its own columns
+    sharedColumnCache = SharedColumnCache.SharedColumnCache()
+
+    # data with fewer points calculate their own columns, below about 5000 points the key, the comparison and the
+    # copy of the data take longer than the columns they save (see benchmarkSharedDataCache.py)
+    minimumPointsForSharedColumns = 10000
+
+    # data cache functions whose columns depend on the model and not only on the data, these are never shared
+    modelDependentDataCacheFunctions = ['Polyfunctional2D', 'Rational2D', 'Polyfunctional3D']
     
     def __init__(self):
         self.reducedDataCacheDictionary = {}
         self.allDataCacheDictionary = {}
+        self.sharedColumnCacheReferences = {} # 'all' or 'reduced': (shared column cache, the reference this holds to the key of that cache), see SharedColumnCache.Acquire()
         
 
+    # releases the keys of the shared columns, when the data change.  They are released anyway when this is garbage collected
+    def ReleaseSharedColumns(self):
+        for sharedColumnCache, reference in self.sharedColumnCacheReferences.values():
+            sharedColumnCache.Release(reference)
+        self.sharedColumnCacheReferences = {}
+
+
+    # the key of the shared columns of inCacheDictionary, or None if its columns are not shared.  The key is
+    # kept in the dictionary with the independent data it is for, and this holds a reference to the
+    # keys of its all data and reduced data caches
+    def GetSharedColumnCacheKey(self, inCacheDictionary):
+        if self.sharedColumnCache is None or len(inCacheDictionary['IndependentData'][0]) < self.minimumPointsForSharedColumns:
+            return None
+        if inCacheDictionary.has_key('SharedColumnCacheKey'):
+            if inCacheDictionary['SharedColumnCacheKey'] is None: # see IModel.WrapperForODR()
+                return None
+            if inCacheDictionary['SharedColumnCacheKey'][0] is inCacheDictionary['IndependentData']:
+                return inCacheDictionary['SharedColumnCacheKey'][1]
+        key = self.sharedColumnCache.Key(inCacheDictionary['IndependentData'])
+        inCacheDictionary['SharedColumnCacheKey'] = (inCacheDictionary['IndependentData'], key)
+        if key is None:
+            return None
+
+        if inCacheDictionary is self.allDataCacheDictionary:
+            slot = 'all'
+        else:
+            slot = 'reduced'
+        reference = self.sharedColumnCache.Acquire(key, self)
+        if self.sharedColumnCacheReferences.has_key(slot):
+            sharedColumnCache, oldReference = self.sharedColumnCacheReferences[slot]
+            sharedColumnCache.Release(oldReference)
+        self.sharedColumnCacheReferences[slot] = (self.sharedColumnCache, reference)
+        return key
+
+
+    def GetReducedDataStrategy(self, inModel):
+        strategy = getattr(inModel, 'reducedDataStrategy', 'Even')
+        if strategy not in self.reducedDataStrategyDictionary.keys():
+            raise Exception, str(strategy) + ' is not in the DataCache class reduced data strategy dictionary.'
+        if strategy == 'Random':
+            return (strategy, getattr(inModel, 'reducedDataRandomSeed', 3))
+        return (strategy, None)
+
+
     def GenerateReducedRawData(self, inModel):
-        # find the array indices for the max and min values of each data dimension in the full data set
-        minXindex = 0
-        maxXindex = 0
-        minYindex = 0
-        maxYindex = 0
-        minZindex = 0
-        maxZindex = 0
-        for i in range(len(self.allDataCacheDictionary['DependentData'])):
-            if self.allDataCacheDictionary['IndependentData'][0][i] < self.allDataCacheDictionary['IndependentData'][0][minXindex]:
-                minXindex = i
-            if self.allDataCacheDictionary['IndependentData'][0][i] > self.allDataCacheDictionary['IndependentData'][0][maxXindex]:
-                maxXindex = i
-            if inModel.GetDimensionality() == 3:
-                if self.allDataCacheDictionary['IndependentData'][1][i] < self.allDataCacheDictionary['IndependentData'][1][minYindex]:
-                    minYindex = i
-                if self.allDataCacheDictionary['IndependentData'][1][i] > self.allDataCacheDictionary['IndependentData'][1][maxYindex]:
-                    maxYindex = i
-            if self.allDataCacheDictionary['DependentData'][i] < self.allDataCacheDictionary['DependentData'][minZindex]:
-                minZindex = i
-            if self.allDataCacheDictionary['DependentData'][i] > self.allDataCacheDictionary['DependentData'][maxZindex]:
-                maxZindex = i
-
-        # now make an array of the *indices* we will use in the reduced data set.
-        # NO duplicate entries desired, so use "if value X not in list Y" logic
-        indexList = []
-        if minXindex not in indexList:
-            indexList.append(minXindex)
-        if maxXindex not in indexList:
-            indexList.append(maxXindex)
+        independentData = self.allDataCacheDictionary['IndependentData']
+        dependentData = self.allDataCacheDictionary['DependentData']
+        numberOfDataPoints = len(dependentData)
+        strategy = self.GetReducedDataStrategy(inModel)
+
+        # the array indices for the max and min values of each data dimension in the full data set,
+        # argmin() and argmax() return the first of equal values
+        extremeIndices = [numpy.argmin(independentData[0]), numpy.argmax(independentData[0])]
         if inModel.GetDimensionality() == 3:
-            if minYindex not in indexList:
-                indexList.append(minYindex)
-            if maxYindex not in indexList:
-                indexList.append(maxYindex)
-        if minZindex not in indexList:
-            indexList.append(minZindex)
-        if maxZindex not in indexList:
-            indexList.append(maxZindex)
+            extremeIndices += [numpy.argmin(independentData[1]), numpy.argmax(independentData[1])]
+        extremeIndices += [numpy.argmin(dependentData), numpy.argmax(dependentData)]
 
         # if we have have not selected all data points, draw more data point indices
-        if len(self.allDataCacheDictionary['DependentData']) > len(indexList):
-            for i in range(inModel.numberOfReducedDataPoints):
-                index = i * len(self.allDataCacheDictionary['DependentData']) / inModel.numberOfReducedDataPoints
-                if index not in indexList:
-                    indexList.append(index)
-        indexList.sort()
-                    
+        # using the model's strategy. numpy.unique() discards duplicates and sorts
+        indices = numpy.array(extremeIndices, dtype = int)
+        if numberOfDataPoints > len(numpy.unique(indices)):
+            indices = numpy.append(indices, getattr(self, self.reducedDataStrategyDictionary[strategy[0]])(inModel))
+        indices = numpy.unique(indices)
+
         # now that we have all the locations (indices) of the data points in the reduced
         # data set, draw those points from the full data set and make our reduced data cache
-        independentData = [[],[]]
-        dependentData = []
-        for i in indexList:
-            independentData[0].append(self.allDataCacheDictionary['IndependentData'][0][i])
-            if inModel.GetDimensionality() == 3:
-                independentData[1].append(self.allDataCacheDictionary['IndependentData'][1][i])
-            dependentData.append(self.allDataCacheDictionary['DependentData'][i])
+        independentData1 = numpy.asarray(independentData[0], dtype = float)[indices]
         if inModel.GetDimensionality() == 2:
-            self.reducedDataCacheDictionary['IndependentData'] = numpy.array([independentData[0], numpy.ones_like(independentData[0])])
+            self.reducedDataCacheDictionary['IndependentData'] = numpy.array([independentData1, numpy.ones_like(independentData1)])
+        else:
+            self.reducedDataCacheDictionary['IndependentData'] = numpy.array([independentData1, numpy.asarray(independentData[1], dtype = float)[indices]])
+        self.reducedDataCacheDictionary['DependentData'] = numpy.asarray(dependentData, dtype = float)[indices]
+        if len(self.allDataCacheDictionary['Weights']) > 0:
+            self.reducedDataCacheDictionary['Weights'] = numpy.asarray(self.allDataCacheDictionary['Weights'], dtype = float)[indices]
         else:
-            self.reducedDataCacheDictionary['IndependentData'] = numpy.array(independentData)
-        self.reducedDataCacheDictionary['DependentData'] = numpy.array(dependentData)
+            self.reducedDataCacheDictionary['Weights'] = []
+        self.reducedDataCacheDictionary['ReducedDataStrategy'] = strategy
+
+
+    def ReducedDataIndices_Even(self, inModel):
+        return numpy.arange(inModel.numberOfReducedDataPoints, dtype = int) * len(self.allDataCacheDictionary['DependentData']) // inModel.numberOfReducedDataPoints
+
+
+    # the data in the order of the first independent variable scaled to the range 0 to 1, for the strategies that
+    # follow the curve.  The dependent data are smoothed over the spacing of the reduced data points so that noise
+    # does not add length or curvature.  Returns (order, [scaled data, ...], smoothing window), every row of scaled
+    # data in that order
+    def ScaledCurveData(self, inModel):
+        order = numpy.argsort(self.allDataCacheDictionary['IndependentData'][0], kind = 'mergesort')
+        rows = [self.allDataCacheDictionary['IndependentData'][0]]
+        if inModel.GetDimensionality() == 3:
+            rows.append(self.allDataCacheDictionary['IndependentData'][1])
+        rows.append(self.allDataCacheDictionary['DependentData'])
+
+        scaledRows = []
+        for row in rows:
+            row = numpy.asarray(row, dtype = float)[order]
+            valueRange = row.max() - row.min()
+            if valueRange > 0.0:
+                scaledRows.append((row - row.min()) / valueRange)
+            else:
+                scaledRows.append(numpy.zeros(len(row)))
+
+        window = max(1, len(order) // (2 * inModel.numberOfReducedDataPoints))
+        padded = numpy.concatenate((numpy.repeat(scaledRows[-1][0], window // 2), scaledRows[-1], numpy.repeat(scaledRows[-1][-1], window - 1 - window // 2)))
+        scaledRows[-1] = numpy.convolve(padded, numpy.ones(window) / window, mode = 'valid')
+        return order, scaledRows, window
+
+
+    # indices of the points where the running total of inDensity (in the order of inOrder)
+    # passes the midpoints of inModel.numberOfReducedDataPoints equal shares of its sum
+    def IndicesOfEqualShares(self, inModel, inOrder, inDensity):
+        cumulative = numpy.cumsum(inDensity)
+        shares = (numpy.arange(inModel.numberOfReducedDataPoints) + 0.5) * (cumulative[-1] / inModel.numberOfReducedDataPoints)
+        positions = numpy.minimum(numpy.searchsorted(cumulative, shares), len(inOrder) - 1)
+        return inOrder[positions]
+
+
+    def ReducedDataIndices_Curvature(self, inModel):
+        order, scaledRows, window = self.ScaledCurveData(inModel)
+        # second differences of the dependent data across the smoothing window, further
+        # apart than neighbouring points the bend of the curve grows faster than the noise
+        curvature = numpy.zeros(len(order))
+        if len(order) > 2 * window:
+            smoothed = scaledRows[-1]
+            curvature[window:-window] = numpy.abs(smoothed[2 * window:] - 2.0 * smoothed[window:-window] + smoothed[:-2 * window])
+        total = curvature.sum()
+        if not total > 0.0:
+            return order[self.ReducedDataIndices_Even(inModel)]
+        # half of the points evenly spaced, so that flat parts of the curve are not left empty
+        density = 0.5 / len(order) + 0.5 * curvature / total
+        return self.IndicesOfEqualShares(inModel, order, density)
+
+
+    def ReducedDataIndices_ArcLength(self, inModel):
+        order, scaledRows, window = self.ScaledCurveData(inModel)
+        steps = numpy.zeros(len(order))
+        for row in scaledRows:
+            steps[1:] += numpy.square(numpy.diff(row))
+        steps = numpy.sqrt(steps)
+        if not steps.sum() > 0.0:
+            return order[self.ReducedDataIndices_Even(inModel)]
+        steps[0] = steps[1:].min() # the first point starts the curve and is taken first
+        return self.IndicesOfEqualShares(inModel, order, steps)
+
+
+    def ReducedDataIndices_QuantileY(self, inModel):
+        dependentData = numpy.asarray(self.allDataCacheDictionary['DependentData'], dtype = float)
+        levels = numpy.linspace(dependentData.min(), dependentData.max(), inModel.numberOfReducedDataPoints)
+        # the data are sorted by dependent value, the nearest point is on one side of each level
+        above = numpy.minimum(numpy.searchsorted(dependentData, levels), len(dependentData) - 1)
+        below = numpy.maximum(above - 1, 0)
+        return numpy.where(numpy.abs(dependentData[below] - levels) <= numpy.abs(dependentData[above] - levels), below, above)
+
+
+    def ReducedDataIndices_Random(self, inModel):
+        numberOfDataPoints = len(self.allDataCacheDictionary['DependentData'])
+        return numpy.random.RandomState(self.GetReducedDataStrategy(inModel)[1]).permutation(numberOfDataPoints)[:inModel.numberOfReducedDataPoints]
 
 
     def FindOrCreateCache_CommonCode(self, inCacheDictionary, inModel):
         returnCacheDataList = []
+        sharedColumnCacheKey = None
         for dataCacheFunction in inModel.GetDataCacheFunctions():
-            # if this item is not in the inCacheDictionary, create it and add it to the inCacheDictionary
+            # if this item is not in the inCacheDictionary, take it from the shared columns or create it and add it to the inCacheDictionary
             if not inCacheDictionary.has_key(dataCacheFunction[0]):
+                if sharedColumnCacheKey is None:
+                    sharedColumnCacheKey = self.GetSharedColumnCacheKey(inCacheDictionary)
+                if sharedColumnCacheKey is not None:
+                    cacheItem = self.sharedColumnCache.Get(sharedColumnCacheKey, dataCacheFunction[0])
+                    if cacheItem is not None:
+                        inCacheDictionary[dataCacheFunction[0]] = cacheItem
+                        returnCacheDataList.append(cacheItem)
+                        continue
                 # strip any numbers from the end of the string
                 s = dataCacheFunction[0] # name, including any ending name info
                 found = 1
@@ -107,6 +234,8 @@ class DataCache(object):
                         s = s[:-1]
                 cacheItem = getattr(pyeq2.DataCache.DataCacheFunctions, s)(inCacheDictionary['IndependentData'], dataCacheFunction[1], inModel)
                 inCacheDictionary[dataCacheFunction[0]] = cacheItem
+                if sharedColumnCacheKey is not None and s not in self.modelDependentDataCacheFunctions:
+                    self.sharedColumnCache.Put(sharedColumnCacheKey, dataCacheFunction[0], cacheItem)
             returnCacheDataList.append(inCacheDictionary[dataCacheFunction[0]])
         return numpy.array(returnCacheDataList)
 
@@ -131,6 +260,11 @@ class DataCache(object):
         if len(self.allDataCacheDictionary['DependentData']) == inModel.numberOfReducedDataPoints:
             self.reducedDataCacheDictionary = self.allDataCacheDictionary
 
+        # a reduced data cache drawn with another strategy is drawn again
+        if self.reducedDataCacheDictionary is not self.allDataCacheDictionary and self.reducedDataCacheDictionary.has_key('ReducedDataStrategy'):
+            if self.reducedDataCacheDictionary['ReducedDataStrategy'] != self.GetReducedDataStrategy(inModel):
+                self.reducedDataCacheDictionary = {}
+
         # if the reduced data cache does not yet have reduced raw data, generate it and add to the cache
         if not self.reducedDataCacheDictionary.has_key('DependentData'):
             self.GenerateReducedRawData(inModel)
@@ -0,0 +1,133 @@
+#    pyeq2 is a collection of equations expressed as Python classes
+#
+#    Copyright (C) 2012 James R. Phillips
+#    2548 Vera Cruz Drive
+#    Birmingham, AL 35235 USA
+#
+#    email: zunzun@zunzun.com
+#    web: http://zunzun.com
+#
+#    License: BSD-style (see LICENSE.txt in main source directory)
+#    Version info: $Id: SharedColumnCache.py 1 2012-01-07 22:20:43Z zunzun.com@gmail.com $
+
+import zlib, collections, weakref
+
+import numpy
+numpy.seterr(over = 'raise', divide = 'raise', invalid = 'raise', under = 'ignore') # numpy raises warnings, convert to exceptions to trap them
+
+
+
+class SharedColumnCache(object):
+    # Data cache columns (X, LogX, PowX_2.0 ...) shared by every DataCache, so that models fitted to the same
+    # data calculate each column only once.  Columns are found by the shape and checksum of the independent
+    # data they were calculated from and the name of the data cache function.  A DataCache holds a reference
+    # to the key of each of its data caches until its data change or it is garbage collected, see Acquire() and
+    # DataCache.GetSharedColumnCacheKey().  When the columns and
+    # the copies of the independent data take more than maximumBytes the least recently used columns of keys
+    # that nothing refers to are dropped, the columns of keys in use are kept.  Shared columns are read only,
+    # every model sees the same array
+
+    numberOfSampledValues = 4096 # for Key()
+
+    def __init__(self, inMaximumBytes = 128 * 1024 * 1024):
+        self.maximumBytes = inMaximumBytes
+        self.columns = collections.OrderedDict() # (key, name): column, least recently used first
+        self.independentData = {} # key: a read only copy of the independent data, to tell data with the same checksum apart
+        self.numberOfColumns = {} # key: number of columns
+        self.referenceCounts = {} # key: number of references
+        self.references = {} # id of a weak reference to the owner of a reference: (the weak reference, key)
+        self.numberOfBytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+    # the key of the independent data, equal for equal values whatever array they are in.  It is the checksum of
+    # at most numberOfSampledValues values, the data of a key are compared in full with the data they are for.
+    # Returns None for data that have the same key as other cached data, their columns are not shared
+    def Key(self, inIndependentData):
+        data = numpy.ascontiguousarray(inIndependentData, dtype = float)
+        values = data.ravel()
+        if len(values) > self.numberOfSampledValues:
+            values = numpy.ascontiguousarray(values[::len(values) // self.numberOfSampledValues])
+        key = (data.shape, zlib.crc32(values.data) & 0xffffffff)
+        if not self.independentData.has_key(key):
+            data = data.copy() # the caller may change its own array later
+            data.flags.writeable = False
+            self.independentData[key] = data
+            self.numberOfBytes += data.nbytes
+        elif not numpy.array_equal(self.independentData[key], data):
+            return None
+        return key
+
+
+    # a reference to inKey for inOwner, released by Release() or when inOwner is garbage collected.  Returns the
+    # reference, a weak reference to inOwner.  The weak references are kept here and not by their owners, so
+    # that their callbacks run even when an owner is collected with a reference cycle it is part of
+    def Acquire(self, inKey, inOwner):
+        reference = weakref.ref(inOwner, self.Release)
+        self.references[id(reference)] = (reference, inKey)
+        self.referenceCounts[inKey] = self.referenceCounts.get(inKey, 0) + 1
+        return reference
+
+
+    def Release(self, inReference):
+        if not self.references.has_key(id(inReference)): # released already
+            return
+        inKey = self.references.pop(id(inReference))[1]
+        self.referenceCounts[inKey] -= 1
+        if self.referenceCounts[inKey] <= 0:
+            del self.referenceCounts[inKey]
+            self.Forget(inKey)
+            self.Evict()
+
+
+    # the column, or None if it is not cached
+    def Get(self, inKey, inName):
+        column = self.columns.pop((inKey, inName), None)
+        if column is None:
+            self.misses += 1
+            return None
+        self.columns[(inKey, inName)] = column # now the most recently used
+        self.hits += 1
+        return column
+
+
+    def Put(self, inKey, inName, inColumn):
+        if not isinstance(inColumn, numpy.ndarray) or self.columns.has_key((inKey, inName)):
+            return
+        inColumn.flags.writeable = False
+        self.columns[(inKey, inName)] = inColumn
+        self.numberOfColumns[inKey] = self.numberOfColumns.get(inKey, 0) + 1
+        self.numberOfBytes += inColumn.nbytes
+        self.Evict()
+
+
+    # drops the independent data of a key that has neither columns nor references
+    def Forget(self, inKey):
+        if not self.numberOfColumns.has_key(inKey) and not self.referenceCounts.has_key(inKey) and self.independentData.has_key(inKey):
+            self.numberOfBytes -= self.independentData.pop(inKey).nbytes
+
+
+    def Evict(self):
+        if self.numberOfBytes <= self.maximumBytes:
+            return
+        for keyAndName in self.columns.keys(): # least recently used first
+            key = keyAndName[0]
+            if self.referenceCounts.has_key(key):
+                continue
+            self.numberOfBytes -= self.columns.pop(keyAndName).nbytes
+            self.numberOfColumns[key] -= 1
+            if self.numberOfColumns[key] == 0:
+                del self.numberOfColumns[key]
+                self.Forget(key)
+            if self.numberOfBytes <= self.maximumBytes:
+                return
+
+
+    def Clear(self):
+        for column in self.columns.itervalues():
+            self.numberOfBytes -= column.nbytes
+        self.columns.clear()
+        self.numberOfColumns.clear()
+        for key in self.independentData.keys():
+            self.Forget(key)
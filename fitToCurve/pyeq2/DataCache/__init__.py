@@ -10,5 +10,6 @@
 #    License: BSD-style (see LICENSE.txt in main source directory)
 #    Version info: $Id: __init__.py 1 2012-01-07 22:20:43Z zunzun.com@gmail.com $
 
+import SharedColumnCache
 import DataCache
 import DataCacheFunctions
@@ -46,6 +46,20 @@ class ExtendedVersionHandler_Default(IExtendedVersionHandler.IExtendedVersionHan
         return inBaseModelCalculation
 
 
+    def GetAdditionalModelJacobian(self, inBaseModelCalculation, inBaseModelJacobian, inCoeffs, inDataCacheDictionary, inModel):
+        return inBaseModelJacobian
+
+
     # overridden from abstract parent class
     def CanLinearSolverBeUsedForSSQABS(self, inModelFlag):
         return inModelFlag
+
+
+    # overridden from abstract parent class
+    def GetLinearCoefficientIndices(self, inModel):
+        return inModel._linearCoefficientIndices
+
+
+    # overridden from abstract parent class
+    def GetExponentialRateIndices(self, inModel):
+        return inModel._exponentialRateIndices
@@ -92,3 +92,18 @@ class ExtendedVersionHandler_ExponentialDecay(IExtendedVersionHandler.IExtendedV
                 return inBaseModelCalculation / inDataCacheDictionary['ExpXY']
             else:
                 return inBaseModelCalculation / (inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['ExpXY'])
+
+
+    def GetAdditionalModelJacobian(self, inBaseModelCalculation, inBaseModelJacobian, inCoeffs, inDataCacheDictionary, inModel):
+        if inModel.GetDimensionality() == 2:
+            if inModel.baseEquationHasGlobalMultiplierOrDivisor_UsedInExtendedVersions:
+                return inBaseModelJacobian / inDataCacheDictionary['ExpX'][:, numpy.newaxis]
+            else:
+                return numpy.column_stack((inBaseModelJacobian / (inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['ExpX'])[:, numpy.newaxis],
+                                           -inBaseModelCalculation / (inCoeffs[len(inCoeffs)-1] * inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['ExpX'])))
+        else:
+            if inModel.baseEquationHasGlobalMultiplierOrDivisor_UsedInExtendedVersions:
+                return inBaseModelJacobian / inDataCacheDictionary['ExpXY'][:, numpy.newaxis]
+            else:
+                return numpy.column_stack((inBaseModelJacobian / (inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['ExpXY'])[:, numpy.newaxis],
+                                           -inBaseModelCalculation / (inCoeffs[len(inCoeffs)-1] * inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['ExpXY'])))
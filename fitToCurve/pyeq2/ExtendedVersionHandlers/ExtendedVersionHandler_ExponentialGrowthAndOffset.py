@@ -92,3 +92,18 @@ class ExtendedVersionHandler_ExponentialGrowthAndOffset(IExtendedVersionHandler.
                 return inBaseModelCalculation * inDataCacheDictionary['ExpXY'] + inCoeffs[len(inCoeffs)-1]
             else:
                 return inBaseModelCalculation * (inCoeffs[len(inCoeffs)-2] * inDataCacheDictionary['ExpXY']) + inCoeffs[len(inCoeffs)-1]
+
+
+    def GetAdditionalModelJacobian(self, inBaseModelCalculation, inBaseModelJacobian, inCoeffs, inDataCacheDictionary, inModel):
+        if inModel.GetDimensionality() == 2:
+            if inModel.baseEquationHasGlobalMultiplierOrDivisor_UsedInExtendedVersions:
+                return numpy.column_stack((inBaseModelJacobian * inDataCacheDictionary['ExpX'][:, numpy.newaxis], numpy.ones(len(inBaseModelCalculation))))
+            else:
+                return numpy.column_stack((inBaseModelJacobian * (inCoeffs[len(inCoeffs)-2] * inDataCacheDictionary['ExpX'])[:, numpy.newaxis],
+                                           inBaseModelCalculation * inDataCacheDictionary['ExpX'], numpy.ones(len(inBaseModelCalculation))))
+        else:
+            if inModel.baseEquationHasGlobalMultiplierOrDivisor_UsedInExtendedVersions:
+                return numpy.column_stack((inBaseModelJacobian * inDataCacheDictionary['ExpXY'][:, numpy.newaxis], numpy.ones(len(inBaseModelCalculation))))
+            else:
+                return numpy.column_stack((inBaseModelJacobian * (inCoeffs[len(inCoeffs)-2] * inDataCacheDictionary['ExpXY'])[:, numpy.newaxis],
+                                           inBaseModelCalculation * inDataCacheDictionary['ExpXY'], numpy.ones(len(inBaseModelCalculation))))
@@ -13,6 +13,9 @@
 import pyeq2
 import IExtendedVersionHandler
 
+import numpy
+numpy.seterr(over = 'raise', divide = 'raise', invalid = 'raise', under = 'ignore') # numpy raises warnings, convert to exceptions to trap them
+
 
 class ExtendedVersionHandler_Inverse(IExtendedVersionHandler.IExtendedVersionHandler):
     
@@ -47,3 +50,10 @@ class ExtendedVersionHandler_Inverse(IExtendedVersionHandler.IExtendedVersionHan
             return inDataCacheDictionary['X'] / inBaseModelCalculation
         else:
             return inDataCacheDictionary['XY'] / inBaseModelCalculation
+
+
+    def GetAdditionalModelJacobian(self, inBaseModelCalculation, inBaseModelJacobian, inCoeffs, inDataCacheDictionary, inModel):
+        if inModel.GetDimensionality() == 2:
+            return -inBaseModelJacobian * (inDataCacheDictionary['X'] / numpy.square(inBaseModelCalculation))[:, numpy.newaxis]
+        else:
+            return -inBaseModelJacobian * (inDataCacheDictionary['XY'] / numpy.square(inBaseModelCalculation))[:, numpy.newaxis]
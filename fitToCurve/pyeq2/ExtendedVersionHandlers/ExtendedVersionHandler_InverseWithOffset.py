@@ -13,6 +13,9 @@
 import pyeq2
 import IExtendedVersionHandler
 
+import numpy
+numpy.seterr(over = 'raise', divide = 'raise', invalid = 'raise', under = 'ignore') # numpy raises warnings, convert to exceptions to trap them
+
 
 class ExtendedVersionHandler_InverseWithOffset(IExtendedVersionHandler.IExtendedVersionHandler):
     
@@ -47,3 +50,10 @@ class ExtendedVersionHandler_InverseWithOffset(IExtendedVersionHandler.IExtended
             return (inDataCacheDictionary['X'] / inBaseModelCalculation) + inCoeffs[len(inCoeffs)-1]
         else:
             return (inDataCacheDictionary['XY'] / inBaseModelCalculation) + inCoeffs[len(inCoeffs)-1]
+
+
+    def GetAdditionalModelJacobian(self, inBaseModelCalculation, inBaseModelJacobian, inCoeffs, inDataCacheDictionary, inModel):
+        if inModel.GetDimensionality() == 2:
+            return numpy.column_stack((-inBaseModelJacobian * (inDataCacheDictionary['X'] / numpy.square(inBaseModelCalculation))[:, numpy.newaxis], numpy.ones(len(inBaseModelCalculation))))
+        else:
+            return numpy.column_stack((-inBaseModelJacobian * (inDataCacheDictionary['XY'] / numpy.square(inBaseModelCalculation))[:, numpy.newaxis], numpy.ones(len(inBaseModelCalculation))))
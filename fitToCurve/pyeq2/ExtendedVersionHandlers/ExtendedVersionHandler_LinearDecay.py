@@ -13,6 +13,9 @@
 import pyeq2
 import IExtendedVersionHandler
 
+import numpy
+numpy.seterr(over = 'raise', divide = 'raise', invalid = 'raise', under = 'ignore') # numpy raises warnings, convert to exceptions to trap them
+
 
 class ExtendedVersionHandler_LinearDecay(IExtendedVersionHandler.IExtendedVersionHandler):
     
@@ -88,3 +91,18 @@ class ExtendedVersionHandler_LinearDecay(IExtendedVersionHandler.IExtendedVersio
                 return inBaseModelCalculation / inDataCacheDictionary['XY']
             else:
                 return inBaseModelCalculation / (inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['XY'])
+
+
+    def GetAdditionalModelJacobian(self, inBaseModelCalculation, inBaseModelJacobian, inCoeffs, inDataCacheDictionary, inModel):
+        if inModel.GetDimensionality() == 2:
+            if inModel.baseEquationHasGlobalMultiplierOrDivisor_UsedInExtendedVersions:
+                return inBaseModelJacobian / inDataCacheDictionary['X'][:, numpy.newaxis]
+            else:
+                return numpy.column_stack((inBaseModelJacobian / (inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['X'])[:, numpy.newaxis],
+                                           -inBaseModelCalculation / (inCoeffs[len(inCoeffs)-1] * inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['X'])))
+        else:
+            if inModel.baseEquationHasGlobalMultiplierOrDivisor_UsedInExtendedVersions:
+                return inBaseModelJacobian / inDataCacheDictionary['XY'][:, numpy.newaxis]
+            else:
+                return numpy.column_stack((inBaseModelJacobian / (inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['XY'])[:, numpy.newaxis],
+                                           -inBaseModelCalculation / (inCoeffs[len(inCoeffs)-1] * inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['XY'])))
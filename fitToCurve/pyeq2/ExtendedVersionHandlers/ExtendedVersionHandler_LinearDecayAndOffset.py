@@ -13,6 +13,9 @@
 import pyeq2
 import IExtendedVersionHandler
 
+import numpy
+numpy.seterr(over = 'raise', divide = 'raise', invalid = 'raise', under = 'ignore') # numpy raises warnings, convert to exceptions to trap them
+
 
 class ExtendedVersionHandler_LinearDecayAndOffset(IExtendedVersionHandler.IExtendedVersionHandler):
     
@@ -88,6 +91,18 @@ class ExtendedVersionHandler_LinearDecayAndOffset(IExtendedVersionHandler.IExten
                 return inBaseModelCalculation / inDataCacheDictionary['XY'] + inCoeffs[len(inCoeffs)-1]
             else:
                 return inBaseModelCalculation / (inCoeffs[len(inCoeffs)-2] * inDataCacheDictionary['XY']) + inCoeffs[len(inCoeffs)-1]
-    
-    
 
+
+    def GetAdditionalModelJacobian(self, inBaseModelCalculation, inBaseModelJacobian, inCoeffs, inDataCacheDictionary, inModel):
+        if inModel.GetDimensionality() == 2:
+            if inModel.baseEquationHasGlobalMultiplierOrDivisor_UsedInExtendedVersions:
+                return numpy.column_stack((inBaseModelJacobian / inDataCacheDictionary['X'][:, numpy.newaxis], numpy.ones(len(inBaseModelCalculation))))
+            else:
+                return numpy.column_stack((inBaseModelJacobian / (inCoeffs[len(inCoeffs)-2] * inDataCacheDictionary['X'])[:, numpy.newaxis],
+                                           -inBaseModelCalculation / (inCoeffs[len(inCoeffs)-2] * inCoeffs[len(inCoeffs)-2] * inDataCacheDictionary['X']), numpy.ones(len(inBaseModelCalculation))))
+        else:
+            if inModel.baseEquationHasGlobalMultiplierOrDivisor_UsedInExtendedVersions:
+                return numpy.column_stack((inBaseModelJacobian / inDataCacheDictionary['XY'][:, numpy.newaxis], numpy.ones(len(inBaseModelCalculation))))
+            else:
+                return numpy.column_stack((inBaseModelJacobian / (inCoeffs[len(inCoeffs)-2] * inDataCacheDictionary['XY'])[:, numpy.newaxis],
+                                           -inBaseModelCalculation / (inCoeffs[len(inCoeffs)-2] * inCoeffs[len(inCoeffs)-2] * inDataCacheDictionary['XY']), numpy.ones(len(inBaseModelCalculation))))
@@ -13,6 +13,9 @@
 import pyeq2
 import IExtendedVersionHandler
 
+import numpy
+numpy.seterr(over = 'raise', divide = 'raise', invalid = 'raise', under = 'ignore') # numpy raises warnings, convert to exceptions to trap them
+
 
 class ExtendedVersionHandler_LinearGrowth(IExtendedVersionHandler.IExtendedVersionHandler):
     
@@ -69,3 +72,18 @@ class ExtendedVersionHandler_LinearGrowth(IExtendedVersionHandler.IExtendedVersi
                 return inBaseModelCalculation * inDataCacheDictionary['XY']
             else:
                 return inBaseModelCalculation * (inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['XY'])
+
+
+    def GetAdditionalModelJacobian(self, inBaseModelCalculation, inBaseModelJacobian, inCoeffs, inDataCacheDictionary, inModel):
+        if inModel.GetDimensionality() == 2:
+            if inModel.baseEquationHasGlobalMultiplierOrDivisor_UsedInExtendedVersions:
+                return inBaseModelJacobian * inDataCacheDictionary['X'][:, numpy.newaxis]
+            else:
+                return numpy.column_stack((inBaseModelJacobian * (inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['X'])[:, numpy.newaxis],
+                                           inBaseModelCalculation * inDataCacheDictionary['X']))
+        else:
+            if inModel.baseEquationHasGlobalMultiplierOrDivisor_UsedInExtendedVersions:
+                return inBaseModelJacobian * inDataCacheDictionary['XY'][:, numpy.newaxis]
+            else:
+                return numpy.column_stack((inBaseModelJacobian * (inCoeffs[len(inCoeffs)-1] * inDataCacheDictionary['XY'])[:, numpy.newaxis],
+                                           inBaseModelCalculation * inDataCacheDictionary['XY']))
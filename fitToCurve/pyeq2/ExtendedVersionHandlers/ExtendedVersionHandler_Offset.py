@@ -13,6 +13,9 @@
 import pyeq2
 import IExtendedVersionHandler
 
+import numpy
+numpy.seterr(over = 'raise', divide = 'raise', invalid = 'raise', under = 'ignore') # numpy raises warnings, convert to exceptions to trap them
+
 
 class ExtendedVersionHandler_Offset(IExtendedVersionHandler.IExtendedVersionHandler):
     
@@ -49,3 +52,18 @@ class ExtendedVersionHandler_Offset(IExtendedVersionHandler.IExtendedVersionHand
     def CanLinearSolverBeUsedForSSQABS(self, inModelFlag):
         return False
 
+
+    def GetAdditionalModelJacobian(self, inBaseModelCalculation, inBaseModelJacobian, inCoeffs, inDataCacheDictionary, inModel):
+        return numpy.column_stack((inBaseModelJacobian, numpy.ones(len(inBaseModelCalculation))))
+
+
+    # overridden from abstract parent class, the offset is linear too
+    def GetLinearCoefficientIndices(self, inModel):
+        if inModel._linearCoefficientIndices == []:
+            return []
+        return inModel._linearCoefficientIndices + [len(inModel._coefficientDesignators)]
+
+
+    # overridden from abstract parent class, the offset does not change the rates
+    def GetExponentialRateIndices(self, inModel):
+        return inModel._exponentialRateIndices
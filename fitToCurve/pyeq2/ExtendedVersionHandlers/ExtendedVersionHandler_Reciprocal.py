@@ -13,6 +13,9 @@
 import pyeq2
 import IExtendedVersionHandler
 
+import numpy
+numpy.seterr(over = 'raise', divide = 'raise', invalid = 'raise', under = 'ignore') # numpy raises warnings, convert to exceptions to trap them
+
 
 class ExtendedVersionHandler_Reciprocal(IExtendedVersionHandler.IExtendedVersionHandler):
     
@@ -43,3 +46,7 @@ class ExtendedVersionHandler_Reciprocal(IExtendedVersionHandler.IExtendedVersion
 
     def GetAdditionalModelPredictions(self, inBaseModelCalculation, inCoeffs, inDataCacheDictionary, inModel):
         return 1.0 / inBaseModelCalculation
+
+
+    def GetAdditionalModelJacobian(self, inBaseModelCalculation, inBaseModelJacobian, inCoeffs, inDataCacheDictionary, inModel):
+        return -inBaseModelJacobian / numpy.square(inBaseModelCalculation)[:, numpy.newaxis]
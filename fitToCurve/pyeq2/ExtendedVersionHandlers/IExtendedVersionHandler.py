@@ -74,5 +74,25 @@ class IExtendedVersionHandler(object):
         raise NotImplementedError, 'The IExtendedVersionHandler abstract base class does not implement ' + inspect.stack()[0][3]
 
 
+    # inBaseModelJacobian is the (data points, base coefficients) Jacobian of inBaseModelCalculation,
+    # returns the Jacobian of GetAdditionalModelPredictions() with a column for every coefficient
+    @abc.abstractmethod
+    def GetAdditionalModelJacobian(self, inBaseModelCalculation, inBaseModelJacobian, inCoeffs, inDataCacheDictionary, inModel):
+        raise NotImplementedError, 'The IExtendedVersionHandler abstract base class does not implement ' + inspect.stack()[0][3]
+
+
     def CanLinearSolverBeUsedForSSQABS(self, inModelFlag):
         return False
+
+
+    def GetLinearCoefficientIndices(self, inModel):
+        return []
+
+
+    def GetExponentialRateIndices(self, inModel):
+        return []
+
+
+    # every GetAdditionalModelPredictions() broadcasts, inCoeffs[len(inCoeffs)-1] is an (n, 1) column in a batch
+    def CanCalculateModelPredictionsInBatches(self, inModelFlag):
+        return inModelFlag
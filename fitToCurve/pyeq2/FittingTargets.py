@@ -0,0 +1,206 @@
+#    pyeq2 is a collection of equations expressed as Python classes
+#
+#    Copyright (C) 2012 James R. Phillips
+#    2548 Vera Cruz Drive
+#    Birmingham, AL 35235 USA
+#
+#    email: zunzun@zunzun.com
+#    web: http://zunzun.com
+#
+#    License: BSD-style (see LICENSE.txt in main source directory)
+#    Version info: $Id: FittingTargets.py 1 2012-01-07 22:20:43Z zunzun.com@gmail.com $
+
+import pyeq2
+
+import math, weakref
+import numpy, scipy.odr.odrpack
+numpy.seterr(over = 'raise', divide = 'raise', invalid = 'raise', under = 'ignore') # numpy raises warnings, convert to exceptions to trap them
+
+
+
+# The reductions of the errors to the value of a fitting target.  inErrors are the (weighted, and for
+# the relative targets relative) errors in the buffer of the compiled fitting target, they may be overwritten.
+# The ufuncs are called directly with positional output arrays, on the few points of a typical curve the
+# argument parsing of numpy.sum() and of keyword arguments costs more than the arithmetic.  The reductions
+# in rowReductions also reduce each row of a 2D array of errors, see CompiledFittingTarget.CalculateBatch()
+
+def SumOfSquares(inErrors, inCoeffs, inFittingTarget):
+    numpy.multiply(inErrors, inErrors, inErrors)
+    return numpy.add.reduce(inErrors, -1)
+
+
+def SumOfAbsoluteValues(inErrors, inCoeffs, inFittingTarget):
+    numpy.absolute(inErrors, inErrors)
+    return numpy.add.reduce(inErrors, -1)
+
+
+def PeakAbsoluteValue(inErrors, inCoeffs, inFittingTarget):
+    numpy.absolute(inErrors, inErrors)
+    return numpy.maximum.reduce(inErrors, -1)
+
+
+def LogLikelihood(inErrors):
+    nobs = 1.0 * len(inErrors)
+    return -(nobs*0.5)*(1.0 + numpy.log(2.0*numpy.pi)) - (nobs*0.5)*numpy.log(numpy.dot(inErrors,inErrors)/nobs)
+
+
+def AkaikeInformationCriterion(inErrors, inCoeffs, inFittingTarget):
+    ncoef = 1.0 * len(inCoeffs)
+    nobs = 1.0 * len(inErrors)
+    return -2.0*LogLikelihood(inErrors)/nobs + (2.0*ncoef/nobs)
+
+
+def BayesianInformationCriterion(inErrors, inCoeffs, inFittingTarget):
+    ncoef = 1.0 * len(inCoeffs)
+    nobs = 1.0 * len(inErrors)
+    return -2.0*LogLikelihood(inErrors)/nobs + (ncoef*numpy.log(nobs))/nobs
+
+
+def OrthogonalDistance(inErrors, inCoeffs, inFittingTarget): # this is inefficient but works for every possible case
+    dataCacheDictionary = inFittingTarget.dataCacheDictionary
+    model = scipy.odr.odrpack.Model(inFittingTarget.modelReference().WrapperForODR)
+    if inFittingTarget.weightedFlag:
+        data = scipy.odr.odrpack.Data(dataCacheDictionary['IndependentData'],  dataCacheDictionary['DependentData'], we = dataCacheDictionary['Weights'])
+    else:
+        data = scipy.odr.odrpack.Data(dataCacheDictionary['IndependentData'],  dataCacheDictionary['DependentData'])
+    myodr = scipy.odr.odrpack.ODR(data, model, beta0=inCoeffs, maxit=0)
+    myodr.set_job(fit_type=2)
+    out = myodr.run()
+    return out.sum_square
+
+
+# fitting target: (reduction, errors are relative)
+reductionDictionary = {'SSQABS':  (SumOfSquares, False),
+                       'SSQREL':  (SumOfSquares, True),
+                       'ODR':     (OrthogonalDistance, False),
+                       'ABSABS':  (SumOfAbsoluteValues, False),
+                       'ABSREL':  (SumOfAbsoluteValues, True),
+                       'PEAKABS': (PeakAbsoluteValue, False),
+                       'PEAKREL': (PeakAbsoluteValue, True),
+                       'AIC':     (AkaikeInformationCriterion, False),
+                       'BIC':     (BayesianInformationCriterion, False)
+                      }
+
+rowReductions = (SumOfSquares, SumOfAbsoluteValues, PeakAbsoluteValue)
+
+# closed forms of fitting targets that are slow to calculate, equal to them up to rounding.  With maxit = 0 and
+# fit_type = 2 (ordinary least squares) the sum of squares of scipy.odr is the sum of the squared errors times
+# the weights, so the errors are multiplied by the square roots of the weights.
+# fitting target: (reduction, errors are relative, errors are multiplied by the square roots of the weights)
+closedFormDictionary = {'ODR': (SumOfSquares, False, True)}
+
+
+
+class CompiledFittingTarget(object):
+    # The fitting target of a model on one data cache, with everything that does not change from one set
+    # of coefficients to the next worked out once: the reduction for the fitting target, the indices
+    # and values of the fixed coefficients and the weights.  The errors are calculated in a buffer that
+    # is allocated once instead of in new arrays on every call.  Calling it gives the same values as the
+    # chain of fitting target comparisons in IModel did, see IModel.GetAllDataFittingTarget() and
+    # IModel.GetReducedDataFittingTarget().  inFittingTarget overrides the fitting target of the model,
+    # inClosedFormFlag uses the closed form of the fitting target if it has one.  The model keeps its
+    # compiled fitting targets, they hold the model weakly so that the model is freed once it is not used
+
+    def __init__(self, inModel, inDataCacheDictionary, inFittingTarget = None, inClosedFormFlag = False):
+        if inFittingTarget is None:
+            inFittingTarget = inModel.fittingTarget
+        self.modelReference = weakref.ref(inModel)
+        self.dataCacheDictionary = inDataCacheDictionary
+        self.fittingTarget = inFittingTarget
+        self.reduction, self.relativeFlag = reductionDictionary[inFittingTarget]
+
+        self.dependentData = inDataCacheDictionary['DependentData']
+        self.weights = inDataCacheDictionary['Weights']
+        self.weightedFlag = len(self.weights) > 0
+        self.errorWeights = self.weights
+        if inClosedFormFlag and closedFormDictionary.has_key(inFittingTarget):
+            self.reduction, self.relativeFlag, rootFlag = closedFormDictionary[inFittingTarget]
+            if rootFlag and self.weightedFlag:
+                self.errorWeights = numpy.sqrt(self.weights)
+        self.errorsFlag = self.reduction is not OrthogonalDistance
+        self.errors = numpy.empty(len(self.dependentData))
+
+        self.fixedCoefficients = list(inModel.fixedCoefficients)
+        self.fixedIndices = numpy.array([i for i in range(len(self.fixedCoefficients)) if self.fixedCoefficients[i]], dtype = int) # use None as a flag for coefficients that are not fixed
+        self.fixedValues = numpy.array([self.fixedCoefficients[i] for i in self.fixedIndices], dtype = float)
+        self.fixedFlag = len(self.fixedIndices) > 0
+        if self.fixedFlag:
+            inModel._canLinearSolverBeUsedForSSQABS = False
+
+
+    # True if nothing this was compiled from has changed
+    def IsCompiledFor(self, inModel, inDataCacheDictionary):
+        return self.modelReference() is inModel and \
+               self.dataCacheDictionary is inDataCacheDictionary and \
+               self.fittingTarget == inModel.fittingTarget and \
+               self.dependentData is inDataCacheDictionary['DependentData'] and \
+               self.weights is inDataCacheDictionary['Weights'] and \
+               self.fixedCoefficients == inModel.fixedCoefficients
+
+
+    def SetFixedCoefficients(self, inCoeffs):
+        try:
+            if isinstance(inCoeffs, numpy.ndarray):
+                inCoeffs[self.fixedIndices] = self.fixedValues
+            else:
+                for i in range(len(self.fixedIndices)):
+                    inCoeffs[self.fixedIndices[i]] = self.fixedValues[i]
+        except:
+            pass
+
+
+    def __call__(self, inCoeffs):
+        #save time by checking bounds first
+        model = self.modelReference()
+        if not model.AreCoefficientsWithinBounds(inCoeffs):
+            return 1.0E300
+
+        try:
+            if self.fixedFlag:
+                self.SetFixedCoefficients(inCoeffs)
+
+            if self.errorsFlag:
+                numpy.subtract(model.CalculateModelPredictions(inCoeffs, self.dataCacheDictionary), self.dependentData, self.errors)
+                if self.weightedFlag:
+                    numpy.multiply(self.errors, self.errorWeights, self.errors)
+                if self.relativeFlag:
+                    numpy.divide(self.errors, self.dependentData, self.errors)
+
+            val = self.reduction(self.errors, inCoeffs, self)
+        except:
+            return 1.0E300
+
+        if math.isinf(val) or math.isnan(val):
+            return 1.0E300
+        else:
+            return val
+
+
+    # the fitting target of every row of inCoeffsArray, with the predictions of all rows from one call of
+    # IModel.CalculateModelPredictionsBatch().  Each row gets the value that calling this with the row would give,
+    # the caller checks bounds, see IModel.CalculateReducedDataFittingTargetBatch()
+    def CalculateBatch(self, inCoeffsArray):
+        if self.fixedFlag:
+            inCoeffsArray[:,self.fixedIndices] = self.fixedValues
+
+        if not self.errorsFlag:
+            return numpy.array([self(coeffs) for coeffs in inCoeffsArray])
+
+        try:
+            predictions = self.modelReference().CalculateModelPredictionsBatch(inCoeffsArray, self.dataCacheDictionary)
+        except:
+            return numpy.ones(len(inCoeffsArray)) * 1.0E300
+
+        # a row that would raise an exception in __call__() ends up infinite or nan instead
+        with numpy.errstate(over = 'ignore', divide = 'ignore', invalid = 'ignore'):
+            errors = predictions - self.dependentData
+            if self.weightedFlag:
+                errors *= self.errorWeights
+            if self.relativeFlag:
+                errors /= self.dependentData
+            if self.reduction in rowReductions:
+                values = self.reduction(errors, inCoeffsArray, self)
+            else:
+                values = numpy.array([self.reduction(errors[i], inCoeffsArray[i], self) for i in range(len(errors))])
+        values[~numpy.isfinite(values)] = 1.0E300
+        return values
@@ -24,6 +24,25 @@ class IModel(object):
     userSelectableRationalFlag = False
     userDefinedFunctionFlag = False
 
+    # indices of the coefficients the model is linear in, for SolverService.SolveUsingVariableProjection()
+    _linearCoefficientIndices = []
+
+    # indices of the rates b of a sum of exponentials a * exp(bx) + ..., for SolverService.EstimateCoefficientsUsingMatrixPencil()
+    _exponentialRateIndices = []
+
+    # set in models whose CalculateModelPredictions() also calculates a whole population of coefficients at
+    # once, every inCoeffs[i] then being an (n, 1) column, see CalculateReducedDataFittingTargetBatch()
+    _canCalculateModelPredictionsInBatches = False
+
+    # set in models that override CalculateModelJacobian(), models whose base equation is linear
+    # in its coefficients have an analytic Jacobian without it, see HasAnalyticJacobian()
+    _hasAnalyticJacobian = False
+
+    # how the points of the reduced data set for DE are drawn, a key of DataCache.reducedDataStrategyDictionary.
+    # Models can set another one, callers can set it on an instance before solving
+    reducedDataStrategy = 'Even'
+    reducedDataRandomSeed = 3 # for the 'Random' strategy
+
     # "e" is removed so it is not mistaken for Euler's constant "e"
     # "l" is removed so it is not mistaken for the number "1" - some fonts make these appear the same or very similar
     # "o" is removed so it is not mistaken for the number "0" - some fonts make these appear the same or very similar
@@ -65,6 +84,8 @@ class IModel(object):
         self.rationalNumeratorFlags = []
         self.rationalDenominatorFlags = []
         self.fittingTarget = inFittingTarget
+        self.allDataFittingTarget = None
+        self.reducedDataFittingTarget = None
         
         self.independentData1CannotContainZeroFlag = False
         self.independentData1CannotContainPositiveFlag = False
@@ -230,135 +251,130 @@ class IModel(object):
             self.modelPercentError = []
 
 
-    def CalculateReducedDataFittingTarget(self, inCoeffs):
-        #save time by checking constraints and bounds first
-        if not self.AreCoefficientsWithinBounds(inCoeffs):
-            return 1.0E300
+    # the predictions for every row of inCoeffsArray, one row each in the returned 2D array, the same as
+    # CalculateModelPredictions() row by row.  Models that can calculate predictions in batches do all rows
+    # in one CalculateModelPredictions() call if none fails, the others are calculated one row at a time
+    def CalculateModelPredictionsBatch(self, inCoeffsArray, inDataCacheDictionary):
+        inCoeffsArray = numpy.asarray(inCoeffsArray, dtype = float)
+        if self.CanCalculateModelPredictionsInBatches():
+            predictions = self.CalculateModelPredictionsOfRows(inCoeffsArray, inDataCacheDictionary)
+            if predictions is not None:
+                return predictions
+
+            # rows that give inf or nan are found in one call...
+            with numpy.errstate(over = 'ignore', divide = 'ignore', invalid = 'ignore'):
+                predictions = self.CalculateModelPredictionsOfRows(inCoeffsArray, inDataCacheDictionary)
+            if predictions is not None:
+                failed = ~numpy.all(numpy.isfinite(predictions), axis = 1)
+                predictions[failed] = 1.0E300
+                # ...the others can still have failed on the way, for example 1.0 / exp(1000.0)
+                rows = numpy.flatnonzero(~failed)
+                predictions[rows] = self.CalculateModelPredictionsBySplittingRows(inCoeffsArray[rows], inDataCacheDictionary)
+                return predictions
+
+        predictions = numpy.empty((len(inCoeffsArray), len(inDataCacheDictionary['DependentData'])))
+        for i in range(len(inCoeffsArray)):
+            predictions[i] = self.CalculateModelPredictions(inCoeffsArray[i], inDataCacheDictionary)
+        return predictions
+
+
+    # one CalculateModelPredictions() call for all rows of inCoeffsArray, every inCoeffs[i] is an (n, 1) column.
+    # Returns None if the model returned its exception value instead of one row of predictions per row
+    def CalculateModelPredictionsOfRows(self, inCoeffsArray, inDataCacheDictionary):
+        predictions = self.CalculateModelPredictions(numpy.transpose(inCoeffsArray)[:,:,numpy.newaxis], inDataCacheDictionary)
+        if numpy.shape(predictions) != (len(inCoeffsArray), len(inDataCacheDictionary['DependentData'])):
+            return None
+        return numpy.array(predictions, dtype = float)
+
+
+    # halves the rows until the batches can be calculated, a single row that can't is calculated on its own
+    def CalculateModelPredictionsBySplittingRows(self, inCoeffsArray, inDataCacheDictionary):
+        if len(inCoeffsArray) == 0:
+            return numpy.empty((0, len(inDataCacheDictionary['DependentData'])))
+        predictions = self.CalculateModelPredictionsOfRows(inCoeffsArray, inDataCacheDictionary)
+        if predictions is not None:
+            return predictions
+        if len(inCoeffsArray) == 1:
+            return numpy.array([self.CalculateModelPredictions(inCoeffsArray[0], inDataCacheDictionary)], dtype = float)
+        half = len(inCoeffsArray) / 2
+        return numpy.vstack((self.CalculateModelPredictionsBySplittingRows(inCoeffsArray[:half], inDataCacheDictionary),
+                             self.CalculateModelPredictionsBySplittingRows(inCoeffsArray[half:], inDataCacheDictionary)))
+
+
+    # the derivatives of CalculateModelPredictions() with respect to every coefficient, one column per coefficient,
+    # or None if the model has no analytic Jacobian.  The base equation of a linear model is a sum of its data
+    # cache columns times its coefficients, so those columns are its Jacobian.  The extended version handler
+    # applies the chain rule, models with a nonlinear base equation override this
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        if not self.HasAnalyticJacobian():
+            return None
+
+        numberOfBaseCoefficients = len(self._coefficientDesignators)
+        try:
+            jacobian = numpy.transpose([inDataCacheDictionary[function[0]] for function in self.GetDataCacheFunctions()[:numberOfBaseCoefficients]])
+            temp = numpy.dot(jacobian, inCoeffs[:numberOfBaseCoefficients])
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
+    # the reduced data fitting target of every row of inCoeffsArray, for the vectorized mode of diffev.DiffEvolver
+    def CalculateReducedDataFittingTargetBatch(self, inCoeffsArray):
+        if (not self.CanCalculateModelPredictionsInBatches()) or self.upperCoefficientBounds != [] or self.lowerCoefficientBounds != []:
+            return numpy.array([self.CalculateReducedDataFittingTarget(coeffs) for coeffs in inCoeffsArray])
 
-        # return SSQ as we are only using this method for guessing initial coefficients
         try:
-            try: # set any fixed coefficients
-                if self.fixedCoefficients != []:
-                    self._canLinearSolverBeUsedForSSQABS = False
-                    for i in range(len(inCoeffs)):
-                        if self.fixedCoefficients[i]: # use None as a flag for coefficients that are not fixed
-                            inCoeffs[i] = self.fixedCoefficients[i]
-            except:
-                pass
-            
-            error = self.CalculateModelPredictions(inCoeffs, self.dataCache.reducedDataCacheDictionary) - self.dataCache.reducedDataCacheDictionary['DependentData']
-            ssq = numpy.sum(numpy.square(error))
+            fittingTarget = self.GetReducedDataFittingTarget()
         except:
-            return 1.0E300
-        if numpy.isfinite(ssq):
-            return ssq
-        else:
-            return 1.0E300
+            return numpy.ones(len(inCoeffsArray)) * 1.0E300
+        return fittingTarget.CalculateBatch(inCoeffsArray)
 
 
-    def CalculateAllDataFittingTarget(self, inCoeffs):
-        #save time by checking bounds first
-        if not self.AreCoefficientsWithinBounds(inCoeffs):
+    # the model's fitting target on the reduced data, used for guessing initial coefficients
+    def CalculateReducedDataFittingTarget(self, inCoeffs):
+        try:
+            fittingTarget = self.GetReducedDataFittingTarget()
+        except:
             return 1.0E300
+        return fittingTarget(inCoeffs)
+
 
+    def CalculateAllDataFittingTarget(self, inCoeffs):
         try:
-            try: # set any fixed coefficients
-                if self.fixedCoefficients != []:
-                    self._canLinearSolverBeUsedForSSQABS = False
-                    for i in range(len(inCoeffs)):
-                        if self.fixedCoefficients[i]: # use None as a flag for coefficients that are not fixed
-                            inCoeffs[i] = self.fixedCoefficients[i]
-            except:
-                pass
-            
-            self.CalculateModelErrors(inCoeffs, self.dataCache.allDataCacheDictionary)
-            error = self.modelAbsoluteError
-            
-            if len(self.dataCache.allDataCacheDictionary['Weights']):
-                error = error * self.dataCache.allDataCacheDictionary['Weights']
-                
-            if self.fittingTarget == "SSQABS":
-                val = numpy.sum(numpy.square(error))
-                if numpy.isfinite(val):
-                    return val
-                else:
-                    return 1.0E300
-                    
-            if self.fittingTarget == "SSQREL":
-                error = error / self.dataCache.allDataCacheDictionary['DependentData']
-                val = numpy.sum(numpy.square(error))
-                if numpy.isfinite(val):
-                    return val
-                else:
-                    return 1.0E300
-                    
-            if self.fittingTarget == "ABSABS":
-                val = numpy.sum(numpy.abs(error))
-                if numpy.isfinite(val):
-                    return val
-                else:
-                    return 1.0E300
-                    
-            if self.fittingTarget == "ABSREL":
-                
-                val = numpy.sum(numpy.abs(error / self.dataCache.allDataCacheDictionary['DependentData']))
-                if numpy.isfinite(val):
-                    return val
-                else:
-                    return 1.0E300
-                    
-            if self.fittingTarget == "PEAKABS":
-                val = numpy.max(numpy.abs(error))
-                if numpy.isfinite(val):
-                    return val
-                else:
-                    return 1.0E300
-                    
-            if self.fittingTarget == "PEAKREL":
-                val = numpy.max(numpy.abs(error / self.dataCache.allDataCacheDictionary['DependentData']))
-                if numpy.isfinite(val):
-                    return val
-                else:
-                    return 1.0E300
-
-            if self.fittingTarget == "ODR": # this is inefficient but works for every possible case
-                model = scipy.odr.odrpack.Model(self.WrapperForODR)
-                if self.dataCache.allDataCacheDictionary['Weights']:
-                    data = scipy.odr.odrpack.Data(self.dataCache.allDataCacheDictionary['IndependentData'],  self.dataCache.allDataCacheDictionary['DependentData'], we = self.dataCache.allDataCacheDictionary['Weights'])
-                else:
-                    data = scipy.odr.odrpack.Data(self.dataCache.allDataCacheDictionary['IndependentData'],  self.dataCache.allDataCacheDictionary['DependentData'])
-                myodr = scipy.odr.odrpack.ODR(data, model, beta0=inCoeffs, maxit=0)
-                myodr.set_job(fit_type=2)
-                out = myodr.run()
-                val = out.sum_square
-                if numpy.isfinite(val):
-                    return val
-                else:
-                    return 1.0E300
-                    
-            # remaining targets require these
-            ncoef = 1.0 * len(inCoeffs)
-            nobs = 1.0 * len(self.dataCache.allDataCacheDictionary['DependentData'])
-            ll = -(nobs*0.5)*(1.0 + numpy.log(2.0*numpy.pi)) - (nobs*0.5)*numpy.log(numpy.dot(error,error)/nobs)
-
-            if self.fittingTarget == "AIC":
-                val = -2.0*ll/nobs + (2.0*ncoef/nobs)
-                if numpy.isfinite(val):
-                    return val
-                else:
-                    return 1.0E300
-                    
-            if self.fittingTarget == "BIC":
-                val = -2.0*ll/nobs + (ncoef*numpy.log(nobs))/nobs
-                if numpy.isfinite(val):
-                    return val
-                else:
-                    return 1.0E300
+            fittingTarget = self.GetAllDataFittingTarget()
         except:
             return 1.0E300
+        return fittingTarget(inCoeffs)
+
+
+    # the fitting target on the all data cache as a pyeq2.FittingTargets.CompiledFittingTarget, compiled
+    # again only when the fitting target, the data or the fixed coefficients have changed
+    def GetAllDataFittingTarget(self):
+        if (self.allDataFittingTarget is None) or (not self.allDataFittingTarget.IsCompiledFor(self, self.dataCache.allDataCacheDictionary)):
+            self.allDataFittingTarget = pyeq2.FittingTargets.CompiledFittingTarget(self, self.dataCache.allDataCacheDictionary)
+        return self.allDataFittingTarget
 
 
+    # the fitting target on the reduced data cache, see GetAllDataFittingTarget().  It is only used for
+    # guessing initial coefficients, so a closed form of the fitting target is used if there is one
+    def GetReducedDataFittingTarget(self):
+        if (self.reducedDataFittingTarget is None) or (not self.reducedDataFittingTarget.IsCompiledFor(self, self.dataCache.reducedDataCacheDictionary)):
+            self.reducedDataFittingTarget = pyeq2.FittingTargets.CompiledFittingTarget(self, self.dataCache.reducedDataCacheDictionary, inClosedFormFlag = True)
+        return self.reducedDataFittingTarget
+
+
+    # The solvers start from estimatedCoefficients, Solve() sets it to the estimates it makes along the way.  The
+    # caller's estimatedCoefficients are put back afterwards, so that a model solved again with other data does
+    # not start from the estimates made for the last data
     def Solve(self):
+        callersEstimatedCoefficients = self.estimatedCoefficients
+        try:
+            return self.SolveFromEstimatedCoefficients()
+        finally:
+            self.estimatedCoefficients = callersEstimatedCoefficients
+
+
+    def SolveFromEstimatedCoefficients(self):
         solver = pyeq2.solverService()
         
         if self.splineFlag:
@@ -366,10 +382,15 @@ class IModel(object):
         
         if self.fixedCoefficients != []:
             self._canLinearSolverBeUsedForSSQABS = False
+
+        if len(self.estimatedCoefficients) == 0:
+            self.estimatedCoefficients = solver.EstimateCoefficientsUsingMatrixPencil(self)
             
         if self.fittingTarget == 'SSQABS':
             if self.CanLinearSolverBeUsedForSSQABS() == True:
                 return solver.SolveUsingLinear(self)
+            elif self.CanVariableProjectionBeUsedForSSQABS() == True:
+                return solver.SolveUsingVariableProjection(self)
             else:
                 self.estimatedCoefficients = solver.SolveUsingDE(self)
                 self.estimatedCoefficients = solver.SolveUsingLevenbergMarquardt(self)
@@ -410,6 +431,30 @@ class IModel(object):
         return self.extendedVersionHandler.CanLinearSolverBeUsedForSSQABS(self._canLinearSolverBeUsedForSSQABS)
 
 
+    def GetLinearCoefficientIndices(self):
+        return self.extendedVersionHandler.GetLinearCoefficientIndices(self)
+
+
+    def CanCalculateModelPredictionsInBatches(self):
+        return self.extendedVersionHandler.CanCalculateModelPredictionsInBatches(self._canCalculateModelPredictionsInBatches)
+
+
+    def HasAnalyticJacobian(self):
+        # the class flag, Solve() clears the instance's for fixed coefficients and user defined functions only set the instance's
+        return self._hasAnalyticJacobian or getattr(self.__class__, '_canLinearSolverBeUsedForSSQABS', False)
+
+
+    def GetExponentialRateIndices(self):
+        return self.extendedVersionHandler.GetExponentialRateIndices(self)
+
+
+    def CanVariableProjectionBeUsedForSSQABS(self):
+        # the variable projection solver does not handle fixed coefficients or coefficient bounds
+        if self.fixedCoefficients != [] or self.upperCoefficientBounds != [] or self.lowerCoefficientBounds != []:
+            return False
+        return self.GetLinearCoefficientIndices() != []
+
+
     def WrapperForScipyCurveFit(self, data, *inCoeffs):
         if self.fixedCoefficients != []:
             self._canLinearSolverBeUsedForSSQABS = False
@@ -419,6 +464,21 @@ class IModel(object):
         return self.CalculateModelPredictions(inCoeffs, self.dataCache.allDataCacheDictionary)
 
 
+    # the Jacobian of WrapperForScipyCurveFit(), fixed coefficients do not change the predictions
+    def WrapperForScipyCurveFitJacobian(self, data, *inCoeffs):
+        inCoeffs = list(inCoeffs)
+        if self.fixedCoefficients != []:
+            for i in range(len(inCoeffs)):
+                if self.fixedCoefficients[i]: # use None as a flag for coefficients that are not fixed
+                    inCoeffs[i] = self.fixedCoefficients[i]
+        jacobian = self.CalculateModelJacobian(numpy.array(inCoeffs), self.dataCache.allDataCacheDictionary)
+        if self.fixedCoefficients != []:
+            for i in range(len(inCoeffs)):
+                if self.fixedCoefficients[i]:
+                    jacobian[:,i] = 0.0
+        return jacobian
+
+
     def WrapperForODR(self, inCoeffs, data):
         if numpy.array_equal(data, self.dataCache.allDataCacheDictionary['IndependentData']):
             if self.fixedCoefficients != []:
@@ -431,14 +491,17 @@ class IModel(object):
             tempCache = self.dataCache.allDataCacheDictionary
             self.dataCache.allDataCacheDictionary = {}
             self.dataCache.allDataCacheDictionary['IndependentData'] = data
-            self.dataCache.FindOrCreateAllDataCache(self)
-            if self.fixedCoefficients != []:
-                self._canLinearSolverBeUsedForSSQABS = False
-                for i in range(len(inCoeffs)):
-                    if self.fixedCoefficients[i]: # use None as a flag for coefficients that are not fixed
-                        inCoeffs[i] = self.fixedCoefficients[i]
-            result = self.CalculateModelPredictions(inCoeffs, self.dataCache.allDataCacheDictionary)
-            self.dataCache.allDataCacheDictionary = tempCache
+            self.dataCache.allDataCacheDictionary['SharedColumnCacheKey'] = None # data perturbed by ODR are not worth sharing
+            try: # put the all data cache back even if the model raises an exception
+                self.dataCache.FindOrCreateAllDataCache(self)
+                if self.fixedCoefficients != []:
+                    self._canLinearSolverBeUsedForSSQABS = False
+                    for i in range(len(inCoeffs)):
+                        if self.fixedCoefficients[i]: # use None as a flag for coefficients that are not fixed
+                            inCoeffs[i] = self.fixedCoefficients[i]
+                result = self.CalculateModelPredictions(inCoeffs, self.dataCache.allDataCacheDictionary)
+            finally:
+                self.dataCache.allDataCacheDictionary = tempCache
         return result
 
     
@@ -30,6 +30,7 @@ class AsymptoticExponentialA(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -83,6 +84,7 @@ class AsymptoticExponentialA_Transform(pyeq2.Model_2D_BaseClass.Model_2D_BaseCla
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -133,6 +135,8 @@ class AsymptoticExponentialB(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -169,6 +173,21 @@ class AsymptoticExponentialB(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        a = inCoeffs[0]
+        b = inCoeffs[1]
+
+        try:
+            expBX = numpy.exp(b * x_in)
+            temp = a * (1.0 - expBX)
+            jacobian = numpy.column_stack((1.0 - expBX, -a * x_in * expBX))
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = a * (1.0 - exp(b * x_in));\n"
         return s
@@ -182,6 +201,9 @@ class BrunoTorremansQuadrupleExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseC
     _leftSideHTML = 'y'
     _coefficientDesignators = ['R1', 'R2', 'R3', 'R4', 'T1', 'T2', 'T3', 'T4', 'Offset']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
+    _linearCoefficientIndices = [0, 1, 2, 3, 8]
     
     webReferenceURL = ''
 
@@ -225,6 +247,33 @@ class BrunoTorremansQuadrupleExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseC
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_NegX = inDataCacheDictionary['NegX'] # only need to perform this dictionary look-up once
+        
+        R1 = inCoeffs[0]
+        R2 = inCoeffs[1]
+        R3 = inCoeffs[2]
+        R4 = inCoeffs[3]
+        T1 = inCoeffs[4]
+        T2 = inCoeffs[5]
+        T3 = inCoeffs[6]
+        T4 = inCoeffs[7]
+        Offset = inCoeffs[8]
+
+        try:
+            exp1 = numpy.exp(x_NegX/T1)
+            exp2 = numpy.exp(x_NegX/T2)
+            exp3 = numpy.exp(x_NegX/T3)
+            exp4 = numpy.exp(x_NegX/T4)
+            temp = Offset - R1*exp1 - R2*exp2 - R3*exp3 - R4*exp4
+            jacobian = numpy.column_stack((-exp1, -exp2, -exp3, -exp4,
+            R1*exp1*x_NegX/(T1*T1), R2*exp2*x_NegX/(T2*T2), R3*exp3*x_NegX/(T3*T3), R4*exp4*x_NegX/(T4*T4),
+            numpy.ones(len(x_NegX))))
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = Offset - R1*exp(-x_in/T1) - R2*exp(-x_in/T2) - R3*exp(-x_in/T3) - R4*exp(-x_in/T4);\n"
         return s
@@ -238,6 +287,10 @@ class DoubleExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _linearCoefficientIndices = [0, 2]
+    _exponentialRateIndices = [1, 3]
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -276,6 +329,24 @@ class DoubleExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        a = inCoeffs[0]
+        b = inCoeffs[1]
+        c = inCoeffs[2]
+        d = inCoeffs[3]
+
+        try:
+            expBX = numpy.exp(b*x_in)
+            expDX = numpy.exp(d*x_in)
+            temp = a * expBX + c * expDX
+            jacobian = numpy.column_stack((expBX, a * x_in * expBX, expDX, c * x_in * expDX))
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = a * exp(b*x_in) + c * exp(d*x_in);\n"
         return s
@@ -289,6 +360,10 @@ class Exponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _linearCoefficientIndices = [0]
+    _exponentialRateIndices = [1]
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -325,6 +400,21 @@ class Exponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        a = inCoeffs[0]
+        b = inCoeffs[1]
+
+        try:
+            expBX = numpy.exp(b*x_in)
+            temp = a * expBX
+            jacobian = numpy.column_stack((expBX, a * x_in * expBX))
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = a * exp(b*x_in);\n"
         return s
@@ -338,6 +428,7 @@ class Hocket_Sherby(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -389,6 +480,7 @@ class Hoerl(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -439,6 +531,7 @@ class Hoerl_Transform(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -489,6 +582,8 @@ class InvExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -525,6 +620,21 @@ class InvExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        a = inCoeffs[0]
+        b = inCoeffs[1]
+
+        try:
+            expBoverX = numpy.exp(b/x_in)
+            temp = a * expBoverX
+            jacobian = numpy.column_stack((expBoverX, a * expBoverX / x_in))
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = a * exp(b/x_in);\n"
         return s
@@ -538,6 +648,7 @@ class InvertedOffsetExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -588,6 +699,8 @@ class OffsetExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -625,12 +738,148 @@ class OffsetExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        a = inCoeffs[0]
+        b = inCoeffs[1]
+        c = inCoeffs[2]
+
+        try:
+            expBXC = numpy.exp(b*x_in + c)
+            temp = a * expBXC
+            jacobian = numpy.column_stack((expBXC, a * x_in * expBXC, temp))
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = a * exp(b*x_in + c);\n"
         return s
 
 
 
+class RadonProgenyAlpha(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
+    
+    _baseName = "Radon Progeny Alpha Activity"
+    _HTML = 'y = Po218 * A<sub>&alpha;,Po218</sub>(x) + Pb214 * A<sub>&alpha;,Pb214</sub>(x) + Bi214 * A<sub>&alpha;,Bi214</sub>(x), Po-218 and Po-214 activity from the Bateman equations, x in hours'
+    _leftSideHTML = 'y'
+    _coefficientDesignators = ['Po218', 'Pb214', 'Bi214']
+    _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
+    _linearCoefficientIndices = [0, 1, 2]
+    
+    webReferenceURL = ''
+
+    baseEquationHasGlobalMultiplierOrDivisor_UsedInExtendedVersions = False
+    autoGenerateOffsetForm = True
+    autoGenerateReciprocalForm = False
+    autoGenerateInverseForms = False
+    autoGenerateGrowthAndDecayForms = False
+
+    independentData1CannotContainZeroFlag = False
+    independentData1CannotContainPositiveFlag = False
+    independentData1CannotContainNegativeFlag = False
+    independentData2CannotContainZeroFlag = False
+    independentData2CannotContainPositiveFlag = False
+    independentData2CannotContainNegativeFlag = False
+    
+
+    def GetDataCacheFunctions(self):
+        functionList = []
+        functionList.append([pyeq2.DataCache.DataCacheFunctions.RadonProgenyAlpha(NameOrValueFlag=1, args=[0]), [0]])
+        functionList.append([pyeq2.DataCache.DataCacheFunctions.RadonProgenyAlpha(NameOrValueFlag=1, args=[1]), [1]])
+        functionList.append([pyeq2.DataCache.DataCacheFunctions.RadonProgenyAlpha(NameOrValueFlag=1, args=[2]), [2]])
+        return self.extendedVersionHandler.GetAdditionalDataCacheFunctions(self, functionList)
+
+
+    def CalculateModelPredictions(self, inCoeffs, inDataCacheDictionary):
+        x_Po218 = inDataCacheDictionary['RadonProgenyAlpha_0'] # only need to perform these dictionary look-ups once
+        x_Pb214 = inDataCacheDictionary['RadonProgenyAlpha_1']
+        x_Bi214 = inDataCacheDictionary['RadonProgenyAlpha_2']
+        
+        Po218 = inCoeffs[0]
+        Pb214 = inCoeffs[1]
+        Bi214 = inCoeffs[2]
+
+        try:
+            temp = Po218 * x_Po218 + Pb214 * x_Pb214 + Bi214 * x_Bi214
+            return self.extendedVersionHandler.GetAdditionalModelPredictions(temp, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
+
+
+    def SpecificCodeCPP(self):
+        s = ""
+        for source, designator in enumerate(self._coefficientDesignators):
+            coefficients = pyeq2.DataCache.DataCacheFunctions.RadonProgenyAlphaCoefficients(source)
+            terms = ["%-.16E * exp(-%-.16E * x_in)" % (c, l) for c, l in zip(coefficients, pyeq2.DataCache.DataCacheFunctions.RadonProgenyDecayConstants) if c != 0.0]
+            s += "\ttemp += " + designator + " * (" + " + ".join(terms) + ");\n"
+        return s
+
+
+
+class RadonProgenyBeta(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
+    
+    _baseName = "Radon Progeny Beta Activity"
+    _HTML = 'y = Po218 * A<sub>&beta;,Po218</sub>(x) + Pb214 * A<sub>&beta;,Pb214</sub>(x) + Bi214 * A<sub>&beta;,Bi214</sub>(x), Pb-214 and Bi-214 activity from the Bateman equations, x in hours'
+    _leftSideHTML = 'y'
+    _coefficientDesignators = ['Po218', 'Pb214', 'Bi214']
+    _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
+    _linearCoefficientIndices = [0, 1, 2]
+    
+    webReferenceURL = ''
+
+    baseEquationHasGlobalMultiplierOrDivisor_UsedInExtendedVersions = False
+    autoGenerateOffsetForm = True
+    autoGenerateReciprocalForm = False
+    autoGenerateInverseForms = False
+    autoGenerateGrowthAndDecayForms = False
+
+    independentData1CannotContainZeroFlag = False
+    independentData1CannotContainPositiveFlag = False
+    independentData1CannotContainNegativeFlag = False
+    independentData2CannotContainZeroFlag = False
+    independentData2CannotContainPositiveFlag = False
+    independentData2CannotContainNegativeFlag = False
+    
+
+    def GetDataCacheFunctions(self):
+        functionList = []
+        functionList.append([pyeq2.DataCache.DataCacheFunctions.RadonProgenyBeta(NameOrValueFlag=1, args=[0]), [0]])
+        functionList.append([pyeq2.DataCache.DataCacheFunctions.RadonProgenyBeta(NameOrValueFlag=1, args=[1]), [1]])
+        functionList.append([pyeq2.DataCache.DataCacheFunctions.RadonProgenyBeta(NameOrValueFlag=1, args=[2]), [2]])
+        return self.extendedVersionHandler.GetAdditionalDataCacheFunctions(self, functionList)
+
+
+    def CalculateModelPredictions(self, inCoeffs, inDataCacheDictionary):
+        x_Po218 = inDataCacheDictionary['RadonProgenyBeta_0'] # only need to perform these dictionary look-ups once
+        x_Pb214 = inDataCacheDictionary['RadonProgenyBeta_1']
+        x_Bi214 = inDataCacheDictionary['RadonProgenyBeta_2']
+        
+        Po218 = inCoeffs[0]
+        Pb214 = inCoeffs[1]
+        Bi214 = inCoeffs[2]
+
+        try:
+            temp = Po218 * x_Po218 + Pb214 * x_Pb214 + Bi214 * x_Bi214
+            return self.extendedVersionHandler.GetAdditionalModelPredictions(temp, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
+
+
+    def SpecificCodeCPP(self):
+        s = ""
+        for source, designator in enumerate(self._coefficientDesignators):
+            coefficients = pyeq2.DataCache.DataCacheFunctions.RadonProgenyBetaCoefficients(source)
+            terms = ["%-.16E * exp(-%-.16E * x_in)" % (c, l) for c, l in zip(coefficients, pyeq2.DataCache.DataCacheFunctions.RadonProgenyDecayConstants) if c != 0.0]
+            s += "\ttemp += " + designator + " * (" + " + ".join(terms) + ");\n"
+        return s
+
+
+
 class ScaledExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     
     _baseName = "Scaled Exponential"
@@ -638,6 +887,7 @@ class ScaledExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -686,6 +936,8 @@ class ShiftedExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -722,6 +974,21 @@ class ShiftedExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        a = inCoeffs[0]
+        b = inCoeffs[1]
+
+        try:
+            expXB = numpy.exp(x_in + b)
+            temp = a * expXB
+            jacobian = numpy.column_stack((expXB, temp))
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = a * exp(x_in + b);\n"
         return s
@@ -735,6 +1002,7 @@ class SimpleExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -788,6 +1056,7 @@ class SteveBattisonExponentialA(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -839,6 +1108,7 @@ class SteveBattisonExponentialB(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -891,6 +1161,7 @@ class Stirling(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -940,6 +1211,10 @@ class TripleExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g']
     _canLinearSolverBeUsedForSSQABS = False
+    _linearCoefficientIndices = [0, 2, 4]
+    _exponentialRateIndices = [1, 3, 5]
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -980,6 +1255,27 @@ class TripleExponential(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        a = inCoeffs[0]
+        b = inCoeffs[1]
+        c = inCoeffs[2]
+        d = inCoeffs[3]
+        f = inCoeffs[4]
+        g = inCoeffs[5]
+
+        try:
+            expBX = numpy.exp(b*x_in)
+            expDX = numpy.exp(d*x_in)
+            expGX = numpy.exp(g*x_in)
+            temp = a * expBX + c * expDX + f * expGX
+            jacobian = numpy.column_stack((expBX, a * x_in * expBX, expDX, c * x_in * expDX, expGX, f * x_in * expGX))
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = a * exp(b*x_in) + c * exp(d*x_in) + f * exp(g*x_in);\n"
         return s
@@ -993,6 +1289,7 @@ class VaporPressure(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
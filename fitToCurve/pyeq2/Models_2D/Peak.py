@@ -30,6 +30,7 @@ class Hamilton(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'Vb'
     _coefficientDesignators = ['Gb', 'mu', 'B', 'Vbmax', 'sigma_b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -87,6 +88,7 @@ class ArnoldCohenLogNormalShifted(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -140,6 +142,7 @@ class ArnoldCohenTwoParameterLogNormalShifted(pyeq2.Model_2D_BaseClass.Model_2D_
     _leftSideHTML = 'y'
     _coefficientDesignators = ['b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -193,6 +196,7 @@ class BoxLucasA(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -247,6 +251,7 @@ class BoxLucasAShifted(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -297,6 +302,7 @@ class BoxLucasB(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -346,6 +352,7 @@ class BoxLucasBShifted(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -396,6 +403,7 @@ class BoxLucasC(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -445,6 +453,7 @@ class BoxLucasCShifted(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -495,6 +504,7 @@ class ExtremeValue(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -545,6 +555,7 @@ class Gaussian(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -595,6 +606,7 @@ class Gaussian_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -646,6 +658,7 @@ class LogNormal(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -696,6 +709,7 @@ class LogNormalShifted(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -747,6 +761,7 @@ class LogNormal_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -798,6 +813,7 @@ class LogNormal_ModifiedShifted(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'e']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -850,6 +866,7 @@ class Logistic(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -900,6 +917,7 @@ class LorentzianModifiedPeakA(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -949,6 +967,7 @@ class LorentzianModifiedPeakB(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -999,6 +1018,7 @@ class LorentzianModifiedPeakC(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1050,6 +1070,7 @@ class LorentzianModifiedPeakD(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1100,6 +1121,7 @@ class LorentzianModifiedPeakE(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1151,6 +1173,7 @@ class LorentzianModifiedPeakF(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1203,6 +1226,7 @@ class LorentzianPeakA(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1251,6 +1275,7 @@ class LorentzianPeakB(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1300,6 +1325,7 @@ class LorentzianPeakC(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1350,6 +1376,7 @@ class LorentzianPeakD(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1399,6 +1426,7 @@ class LorentzianPeakE(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1449,6 +1477,7 @@ class LorentzianPeakF(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1500,6 +1529,7 @@ class PseudoVoight(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1553,6 +1583,7 @@ class PseudoVoight_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1607,6 +1638,7 @@ class Pulse(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1658,6 +1690,7 @@ class WeibullPeak(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1708,6 +1741,7 @@ class WeibullPeakShifted(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1759,6 +1793,7 @@ class WeibullPeak_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1810,6 +1845,7 @@ class WeibullPeak_ModifiedShifted(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'e']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
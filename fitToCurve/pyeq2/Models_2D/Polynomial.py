@@ -30,6 +30,7 @@ class Quintic(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -92,6 +93,7 @@ class Quartic(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -151,6 +153,7 @@ class Cubic(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -207,6 +210,7 @@ class Linear(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -257,6 +261,7 @@ class MarcPlanteQuadratic(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -307,6 +312,7 @@ class Quadratic(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -357,6 +363,7 @@ class UserSelectablePolynomial(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     userSelectablePolynomialFlag = True
     _baseName = "User-Selectable Polynomial"
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
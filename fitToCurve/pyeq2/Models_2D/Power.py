@@ -30,6 +30,7 @@ class Geometric_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -79,6 +80,8 @@ class PowerA_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -120,6 +123,21 @@ class PowerA_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        a = inCoeffs[0]
+        b = inCoeffs[1]
+
+        try:
+            powBX = numpy.power(b, x_in)
+            temp = a * powBX
+            jacobian = numpy.column_stack((powBX, a * x_in * numpy.power(b, x_in - 1.0)))
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = a * pow(b, x_in);\n"
         return s
@@ -133,6 +151,7 @@ class PowerA_Modified_Transform(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -184,6 +203,7 @@ class PowerB_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -232,6 +252,7 @@ class PowerB_Modified_Transform(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -282,6 +303,8 @@ class PowerC_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -318,6 +341,20 @@ class PowerC_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        a = inCoeffs[0]
+        b = inCoeffs[1]
+
+        try:
+            temp = numpy.power(a + x_in, b)
+            jacobian = numpy.column_stack((b * numpy.power(a + x_in, b - 1.0), temp * numpy.log(a + x_in)))
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = pow(a + x_in, b);\n"
         return s
@@ -331,6 +368,7 @@ class PowerC_Modified_Transform(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -381,6 +419,8 @@ class PowerLawExponentialCutoff(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'p(k)'
     _coefficientDesignators = ['C', 'T', 'K']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -418,6 +458,22 @@ class PowerLawExponentialCutoff(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        C = inCoeffs[0]
+        T = inCoeffs[1]
+        K = inCoeffs[2]
+
+        try:
+            powExp = numpy.power(x_in, -1.0 * T) * numpy.exp(-1.0 * x_in / K)
+            temp = C * powExp
+            jacobian = numpy.column_stack((powExp, -temp * numpy.log(x_in), temp * x_in / (K * K)))
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = C * pow(x_in, -1.0 * T) * exp(-1.0 * x_in / K);\n"
         return s
@@ -431,6 +487,7 @@ class PowerRoot(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -479,6 +536,8 @@ class SimplePower(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -514,6 +573,19 @@ class SimplePower(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        a = inCoeffs[0]
+
+        try:
+            temp = numpy.power(x_in, a)
+            jacobian = numpy.column_stack((temp * numpy.log(numpy.where(x_in > 0.0, x_in, 1.0)),)) # the limit at x = 0 is 0
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = pow(x_in, a);\n"
         return s
@@ -527,6 +599,7 @@ class StandardGeometric(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -576,6 +649,8 @@ class StandardPower(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -612,6 +687,21 @@ class StandardPower(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        a = inCoeffs[0]
+        b = inCoeffs[1]
+
+        try:
+            powXB = numpy.power(x_in, b)
+            temp = a * powXB
+            jacobian = numpy.column_stack((powXB, temp * numpy.log(numpy.where(x_in > 0.0, x_in, 1.0)))) # the limit at x = 0 is 0
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = a * pow(x_in, b);\n"
         return s
@@ -625,6 +715,8 @@ class XShiftedPower(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
+    _hasAnalyticJacobian = True
     
     webReferenceURL = ''
 
@@ -662,6 +754,22 @@ class XShiftedPower(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
             return numpy.ones(len(inDataCacheDictionary['DependentData'])) * 1.0E300
 
 
+    def CalculateModelJacobian(self, inCoeffs, inDataCacheDictionary):
+        x_in = inDataCacheDictionary['X'] # only need to perform this dictionary look-up once
+        
+        a = inCoeffs[0]
+        b = inCoeffs[1]
+        c = inCoeffs[2]
+
+        try:
+            powXBC = numpy.power((x_in-b), c)
+            temp = a * powXBC
+            jacobian = numpy.column_stack((powXBC, -a * c * numpy.power((x_in-b), c - 1.0), temp * numpy.log(x_in-b)))
+            return self.extendedVersionHandler.GetAdditionalModelJacobian(temp, jacobian, inCoeffs, inDataCacheDictionary, self)
+        except:
+            return numpy.ones((len(inDataCacheDictionary['DependentData']), len(inCoeffs))) * 1.0E300
+
+
     def SpecificCodeCPP(self):
         s = "\ttemp = a * pow((x_in-b), c);\n"
         return s
@@ -30,6 +30,7 @@ class BET_Sigmoidal_A(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -81,6 +82,7 @@ class BET_Sigmoidal_B(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -132,6 +134,7 @@ class BoltzmannSigmoid(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -183,6 +186,7 @@ class Chapman(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -233,6 +237,7 @@ class DonLevinSigmoid(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a1', 'b1', 'c1', 'a2', 'b2', 'c2', 'a3', 'b3', 'c3']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -289,6 +294,7 @@ class FiveParameterLogistic(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'e']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -341,6 +347,7 @@ class FourParameterLogistic(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -392,6 +399,7 @@ class GeneralisedLogistic(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['A', 'C', 'M', 'B', 'T']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = 'http://www.knowledgerush.com/kr/encyclopedia/Generalised_logistic_curve/'
 
@@ -444,6 +452,7 @@ class GompertzA(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -494,6 +503,7 @@ class GompertzB(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -544,6 +554,7 @@ class GompertzC(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -594,6 +605,7 @@ class Hill(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -649,6 +661,7 @@ class Janoschek(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'w'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = 'http://www.uni-leipzig.de/~vetana/growthe.htm'
 
@@ -699,6 +712,7 @@ class Janoschek_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'w'
     _coefficientDesignators = ['a', 'b', 'c', 'w0']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = 'http://www.uni-leipzig.de/~vetana/growthe.htm'
 
@@ -750,6 +764,7 @@ class LogisticA(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -800,6 +815,7 @@ class LogisticB(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -850,6 +866,7 @@ class MagneticSaturation(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -900,6 +917,7 @@ class MorganMercerFlodin(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -951,6 +969,7 @@ class PetersBaskin_YIII(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'yIII'
     _coefficientDesignators = ['b2', 'c1', 'd1', 'b1', 'c2', 'd2']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = 'http://www.plantmethods.com/content/2/1/11'
 
@@ -1011,6 +1030,7 @@ class PetersBaskin_YII(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'yII'
     _coefficientDesignators = ['b2', 'c1', 'd1', 'b1']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = 'http://www.plantmethods.com/content/2/1/11'
 
@@ -1062,6 +1082,7 @@ class PetersBaskin_YIV(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'yIV'
     _coefficientDesignators = ['b2', 'c1', 'd1', 'b1', 'c2', 'd2']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = 'http://www.plantmethods.com/content/2/1/11'
 
@@ -1128,6 +1149,7 @@ class PetersBaskin_YI(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'yI'
     _coefficientDesignators = ['b2', 'c1', 'd1']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = 'http://www.plantmethods.com/content/2/1/11'
 
@@ -1178,6 +1200,7 @@ class PetersBaskin_YV(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'yIV'
     _coefficientDesignators = ['b2', 'c1', 'd1', 'b1', 'c2', 'd2', 'q']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = 'http://www.plantmethods.com/content/2/1/11'
 
@@ -1245,6 +1268,7 @@ class PetersBaskin_YV_Scaled(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'yIV'
     _coefficientDesignators = ['b2', 'c1', 'd1', 'b1', 'c2', 'd2', 'q', 'scale']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = 'http://www.plantmethods.com/content/2/1/11'
 
@@ -1313,6 +1337,7 @@ class PetersBaskin_Y(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = 'http://www.plantmethods.com/content/2/1/11'
 
@@ -1363,6 +1388,7 @@ class Richards(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1414,6 +1440,7 @@ class SigmoidA(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1463,6 +1490,7 @@ class SigmoidA_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1513,6 +1541,7 @@ class SigmoidB(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1563,6 +1592,7 @@ class SigmoidB_Modified(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1614,6 +1644,7 @@ class Weibull(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1665,6 +1696,7 @@ class WeibullCDF(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -1714,6 +1746,7 @@ class WeibullPDF(pyeq2.Model_2D_BaseClass.Model_2D_BaseClass):
     _leftSideHTML = 'y'
     _coefficientDesignators = ['a', 'b']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
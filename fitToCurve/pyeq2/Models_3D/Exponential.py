@@ -30,6 +30,7 @@ class FullCubicExponential(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h', 'i', 'j', 'k']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -85,8 +86,7 @@ class FullCubicExponential(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
         k = inCoeffs[9]
 
         try:
-            temp = a
-            temp += b * ExpX
+            temp = a + b * ExpX
             temp += c * ExpY
             temp += d * PowExpX_2
             temp += f * PowExpY_2
@@ -122,6 +122,7 @@ class FullCubicExponentialTransform(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass)
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h', 'i', 'j', 'k', 'm', 'n', 'o', 'p']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -166,8 +167,7 @@ class FullCubicExponentialTransform(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass)
         p = inCoeffs[13]
 
         try:
-            temp = a
-            temp += b * numpy.exp(m * x_in + n)
+            temp = a + b * numpy.exp(m * x_in + n)
             temp += c * numpy.exp(o * y_in + p)
             temp += d * numpy.power(numpy.exp(m * x_in + n), 2.0)
             temp += f * numpy.power(numpy.exp(o * y_in + p), 2.0)
@@ -203,6 +203,7 @@ class FullQuadraticExponential(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -246,8 +247,7 @@ class FullQuadraticExponential(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
         g = inCoeffs[5]
 
         try:
-            temp = a
-            temp += b * ExpX
+            temp = a + b * ExpX
             temp += c * ExpY
             temp += d * PowExpX2
             temp += f * PowExpY2
@@ -275,6 +275,7 @@ class FullQuadraticExponentialTransform(pyeq2.Model_3D_BaseClass.Model_3D_BaseCl
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h', 'i', 'j', 'k']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -315,8 +316,7 @@ class FullQuadraticExponentialTransform(pyeq2.Model_3D_BaseClass.Model_3D_BaseCl
         k = inCoeffs[9]
 
         try:
-            temp = a
-            temp += b * numpy.exp(h * x_in + i)
+            temp = a + b * numpy.exp(h * x_in + i)
             temp += c * numpy.exp(j * y_in + k)
             temp += d * numpy.power(numpy.exp(h * x_in + i), 2.0)
             temp += f * numpy.power(numpy.exp(j * y_in + k), 2.0)
@@ -344,6 +344,7 @@ class LinearExponential(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -397,6 +398,7 @@ class LinearExponentialTransform(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -453,6 +455,7 @@ class SimplifiedCubicExponential(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -499,8 +502,7 @@ class SimplifiedCubicExponential(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
         h = inCoeffs[6]
 
         try:
-            temp = a
-            temp += b * ExpX
+            temp = a + b * ExpX
             temp += c * ExpY
             temp += d * PowExpX2
             temp += f * PowExpY2
@@ -530,6 +532,7 @@ class SimplifiedCubicExponentialTransform(pyeq2.Model_3D_BaseClass.Model_3D_Base
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h', 'i', 'j', 'k', 'm']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -571,8 +574,7 @@ class SimplifiedCubicExponentialTransform(pyeq2.Model_3D_BaseClass.Model_3D_Base
         m = inCoeffs[10]
 
         try:
-            temp = a
-            temp += b * numpy.exp(i * x_in + j)
+            temp = a + b * numpy.exp(i * x_in + j)
             temp += c * numpy.exp(k * y_in + m)
             temp += d * numpy.power(numpy.exp(i * x_in + j), 2.0)
             temp += f * numpy.power(numpy.exp(k * y_in + m), 2.0)
@@ -602,6 +604,7 @@ class SimplifiedQuadraticExponential(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -642,8 +645,7 @@ class SimplifiedQuadraticExponential(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass
         f = inCoeffs[4]
 
         try:
-            temp = a
-            temp += b * ExpX
+            temp = a + b * ExpX
             temp += c * ExpY
             temp += d * PowExpX2
             temp += f * PowExpY2
@@ -669,6 +671,7 @@ class SimplifiedQuadraticExponentialTransform(pyeq2.Model_3D_BaseClass.Model_3D_
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h', 'i', 'j']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -708,8 +711,7 @@ class SimplifiedQuadraticExponentialTransform(pyeq2.Model_3D_BaseClass.Model_3D_
         j = inCoeffs[8]
 
         try:
-            temp = a
-            temp += b * numpy.exp(g * x_in + h)
+            temp = a + b * numpy.exp(g * x_in + h)
             temp += c * numpy.exp(i * y_in + j)
             temp += d * numpy.power(numpy.exp(g * x_in + h), 2.0)
             temp += f * numpy.power(numpy.exp(i * y_in + j), 2.0)
@@ -30,6 +30,7 @@ class ExtremeValueA(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -86,6 +87,7 @@ class ExtremeValueB(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -140,6 +142,7 @@ class GaussianA(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -194,6 +197,7 @@ class GaussianB(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -250,6 +254,7 @@ class LogNormalA(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -304,6 +309,7 @@ class LogNormalB(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -360,6 +366,7 @@ class LogisticA(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -416,6 +423,7 @@ class LogisticB(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -470,6 +478,7 @@ class LorentzianA(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -524,6 +533,7 @@ class LorentzianB(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
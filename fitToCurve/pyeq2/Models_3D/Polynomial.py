@@ -30,6 +30,7 @@ class FullCubic(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h', 'i', 'j', 'k']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -85,8 +86,7 @@ class FullCubic(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
         k = inCoeffs[9]
 
         try:
-            temp = a
-            temp += b * x_in
+            temp = a + b * x_in
             temp += c * y_in
             temp += d * PowX_2
             temp += f * PowY_2
@@ -122,6 +122,7 @@ class FullQuadratic(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -165,8 +166,7 @@ class FullQuadratic(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
         g = inCoeffs[5]
 
         try:
-            temp = a
-            temp += b * x_in
+            temp = a + b * x_in
             temp += c * y_in
             temp += d * PowX_2
             temp += f * PowY_2
@@ -194,6 +194,7 @@ class Linear(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -247,6 +248,7 @@ class SimplifiedCubic(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -293,8 +295,7 @@ class SimplifiedCubic(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
         h = inCoeffs[6]
 
         try:
-            temp = a
-            temp += b * x_in
+            temp = a + b * x_in
             temp += c * y_in
             temp += d * PowX_2
             temp += f * PowY_2
@@ -324,6 +325,7 @@ class SimplifiedQuadratic(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -364,8 +366,7 @@ class SimplifiedQuadratic(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
         f = inCoeffs[4]
 
         try:
-            temp = a
-            temp += b * x_in
+            temp = a + b * x_in
             temp += c * y_in
             temp += d * PowX_2
             temp += f * PowY_2
@@ -388,6 +389,7 @@ class UserSelectablePolynomial(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     userSelectablePolynomialFlag = True
     _baseName = "User-Selectable Polynomial"
     _canLinearSolverBeUsedForSSQABS = True
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -30,6 +30,7 @@ class PowerA(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -82,6 +83,7 @@ class PowerA_Transform(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -138,6 +140,7 @@ class PowerB(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -190,6 +193,7 @@ class PowerB_Transform(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -246,6 +250,7 @@ class PowerC(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -298,6 +303,7 @@ class PowerC_Transform(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -354,6 +360,7 @@ class PowerD(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -407,6 +414,7 @@ class PowerD_Transform(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h', 'i']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -464,6 +472,7 @@ class PowerE(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -516,6 +525,7 @@ class PowerE_Transform(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f', 'g', 'h']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
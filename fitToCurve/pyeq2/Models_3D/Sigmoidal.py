@@ -30,6 +30,7 @@ class AndreaPrunottoSigmoidA(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a0', 'a1', 'a2', 'a3', 'a4', 'a5']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -86,6 +87,7 @@ class AndreaPrunottoSigmoidB(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a0', 'a1', 'a2', 'a3', 'a4', 'a5']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -142,6 +144,7 @@ class FraserSmithSigmoid(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -195,6 +198,7 @@ class Sigmoid(pyeq2.Model_3D_BaseClass.Model_3D_BaseClass):
     _leftSideHTML = 'z'
     _coefficientDesignators = ['a', 'b', 'c', 'd', 'f']
     _canLinearSolverBeUsedForSSQABS = False
+    _canCalculateModelPredictionsInBatches = True
     
     webReferenceURL = ''
 
@@ -147,13 +147,21 @@ class DataConverterService(object):
                 dataLists[1].append(a)
                 dataLists[2].append(b)
                 dataLists[3].append(c)
-                
+
+        self.CacheSortedData(dataLists, inModel, inUseWeightsFlag)
+
+
+    # dataLists is [weights, independent data 1, independent data 2, dependent data] as built by the converters above,
+    # for 1D data only dataLists[0] is used and holds the data
+    def CacheSortedData(self, dataLists, inModel, inUseWeightsFlag):
         if inModel.ShouldDataBeRejected(inModel) == True:
             raise Exception('The model you have chosen cannot accept this data set')
+
+        # the shared columns of the old data are not needed any more
+        inModel.dataCache.ReleaseSharedColumns()
             
         if inModel.GetDimensionality() == 1:
-            dataLists[0].sort()
-            inModel.dataCache.allDataCacheDictionary['IndependentData'] = [numpy.array(dataLists[0]), dataLists[1]]
+            inModel.dataCache.allDataCacheDictionary['IndependentData'] = [numpy.sort(dataLists[0]), [1.0] * len(dataLists[1])]
             return
             
         arrayLists = numpy.array(dataLists) # for sorting all data by values of dependent variable
@@ -172,9 +180,86 @@ class DataConverterService(object):
             inModel.dataCache.allDataCacheDictionary['Weights'] = []
 
 
-    def ConvertNumpyArrays(self, inRawData, inModel):
-        pass
+    # data is a 2D array with one row per data point and the columns in the same order as
+    # the columns of ConvertAndSortColumnarASCII(), extra columns are ignored.  The same
+    # rows are discarded, the same flags set and the data sorted the same way, but the
+    # values keep their full precision since nothing is formatted as text
+    def ConvertNumpyArrays(self, inRawData, inModel, inUseWeightsFlag = False):
+        inModel.dataCache.independentData1ContainsZeroFlag = False
+        inModel.dataCache.independentData2ContainsZeroFlag = False
+        inModel.dataCache.independentData1ContainsPositiveFlag = False
+        inModel.dataCache.independentData2ContainsPositiveFlag = False
+        inModel.dataCache.independentData1ContainsNegativeFlag = False
+        inModel.dataCache.independentData2ContainsNegativeFlag = False
+        inModel.dataCache.DependentDataContainsZeroFlag = False
+
+        dimensionality = inModel.GetDimensionality()
+        if inUseWeightsFlag:
+            minimumNumberOfColumns = dimensionality + 1
+        else:
+            minimumNumberOfColumns = dimensionality
 
+        rawData = numpy.array(inRawData, dtype = float, ndmin = 2)
+        if rawData.shape[1] < minimumNumberOfColumns: # the ASCII converter would skip every line
+            rawData = numpy.zeros((0, minimumNumberOfColumns))
+
+        # weights are only used for 2D and 3D data
+        if dimensionality == 1:
+            numberOfValueColumns = 1
+        else:
+            numberOfValueColumns = dimensionality
+
+        # NaN is not out of range, it only fails the comparisons, as with float('nan') in the ASCII converter
+        with numpy.errstate(invalid = 'ignore'):
+            keep = numpy.ones(len(rawData), dtype = bool)
+            for column in range(numberOfValueColumns):
+                keep &= ~((rawData[:,column] > 1.0E300) | (rawData[:,column] < -1.0E300))
+            rawData = rawData[keep]
+
+            a = rawData[:,0]
+            inModel.dataCache.independentData1ContainsNegativeFlag = bool(numpy.any(a < 0.0))
+            inModel.dataCache.independentData1ContainsPositiveFlag = bool(numpy.any(a > 0.0))
+            inModel.dataCache.independentData1ContainsZeroFlag = bool(numpy.any(~((a < 0.0) | (a > 0.0))))
+            if dimensionality == 3:
+                b = rawData[:,1]
+                inModel.dataCache.independentData2ContainsNegativeFlag = bool(numpy.any(b < 0.0))
+                inModel.dataCache.independentData2ContainsPositiveFlag = bool(numpy.any(b > 0.0))
+                inModel.dataCache.independentData2ContainsZeroFlag = bool(numpy.any(~((b < 0.0) | (b > 0.0))))
+            if dimensionality > 1:
+                inModel.dataCache.DependentDataContainsZeroFlag = bool(numpy.any(rawData[:,dimensionality - 1] == 0.0))
+
+        ones = numpy.ones(len(rawData))
+        if dimensionality == 1:
+            dataLists = [rawData[:,0], ones, ones, ones]
+        else:
+            if inUseWeightsFlag:
+                weights = rawData[:,dimensionality]
+            else:
+                weights = ones
+            if dimensionality == 2:
+                dataLists = [weights, ones, rawData[:,0], rawData[:,1]]
+            else:
+                dataLists = [weights, rawData[:,0], rawData[:,1], rawData[:,2]]
+
+        self.CacheSortedData(dataLists, inModel, inUseWeightsFlag)
+
+
+    # data is a sequence of rows, for example the result of a database cursor's fetchall(),
+    # with the columns in the same order as the columns of ConvertAndSortColumnarASCII().
+    # Rows that are too short or have a value that float() cannot convert are discarded
+    def ConvertPythonSequences(self, inRawData, inModel, inUseWeightsFlag = False):
+        if inUseWeightsFlag:
+            numberOfColumns = inModel.GetDimensionality() + 1
+        else:
+            numberOfColumns = inModel.GetDimensionality()
+
+        rows = []
+        for row in inRawData:
+            if len(row) < numberOfColumns:
+                continue
+            try:
+                rows.append([float(value) for value in row[:numberOfColumns]])
+            except:
+                continue
 
-    def ConvertPythonSequences(self, inRawData, inModel):
-        pass
+        self.ConvertNumpyArrays(numpy.array(rows, dtype = float).reshape(len(rows), numberOfColumns), inModel, inUseWeightsFlag)
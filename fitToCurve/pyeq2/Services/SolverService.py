@@ -39,6 +39,15 @@ class SolverService(object):
     
     def __init__(self):
         self.fminIterationLimit = 2500
+        self.matrixPencilSampleLimit = 200
+        # exponential rates closer than this, relative to the larger one, make nearly equal basis columns
+        self.minimumRelativeRateSeparation = 1.0E-03
+        # a refined estimate with distinct rates that leaves less than this fraction of the variance of the data unexplained
+        # skips DE if it reaches the value DE stops at, otherwise DE runs for at most generationsForGoodEstimates generations
+        self.sufficientUnexplainedVarianceForEstimates = 0.01
+        self.generationsForGoodEstimates = 5
+        # ProjectLinearCoefficients() rejects bases with a larger condition number once their columns are scaled to unit length
+        self.maximumLinearBasisConditionNumber = 1.0E04
 
 
     def SolveUsingLinear(self, inModel):
@@ -53,7 +62,7 @@ class SolverService(object):
         fmin_ftol = 1.0E-16
         fmin_FunctionLimit = 2500
         inModel.dataCache.FindOrCreateAllDataCache(inModel)
-        inModel.solvedCoefficients = scipy.optimize.fmin(inModel.CalculateAllDataFittingTarget, inModel.estimatedCoefficients, maxiter = len(inModel.estimatedCoefficients) * self.fminIterationLimit, maxfun = len(inModel.estimatedCoefficients) * fmin_FunctionLimit, disp = 0, xtol=fmin_xtol, ftol=fmin_ftol)
+        inModel.solvedCoefficients = scipy.optimize.fmin(inModel.GetAllDataFittingTarget(), inModel.estimatedCoefficients, maxiter = len(inModel.estimatedCoefficients) * self.fminIterationLimit, maxfun = len(inModel.estimatedCoefficients) * fmin_FunctionLimit, disp = 0, xtol=fmin_xtol, ftol=fmin_ftol)
         return inModel.solvedCoefficients
 
 
@@ -85,16 +94,254 @@ class SolverService(object):
         numpy.random.shuffle(pop0)
         pop0 = pop0.reshape(oneThirdOfPopulationSizeForGA * 3, numberOfCoefficients)
 
-        if inModel.estimatedCoefficients != []:
+        depData = inModel.dataCache.reducedDataCacheDictionary['DependentData']
+        sufficientSSQ = (max(depData) - min(depData)) / guessDivisorForGA
+        sufficientSolution = self.SufficientReducedDataFittingTarget(inModel, sufficientSSQ, guessDivisorForGA)
+
+        if len(inModel.estimatedCoefficients) > 0:
+            # DE stops at generation zero when its population reaches sufficientSolution, so an estimate that does
+            # is returned before the population is evaluated.  Nearly equal rates would cancel each other
+            estimate = numpy.array(inModel.estimatedCoefficients, dtype = float)
+            if self.AreExponentialRatesDistinct(estimate[inModel.GetExponentialRateIndices()]) and inModel.CalculateReducedDataFittingTarget(estimate.copy()) <= sufficientSolution:
+                return estimate
             pop0[0] = copy.deepcopy(inModel.estimatedCoefficients) # DE will overwrite these values, so use deepcopy
             
-        depData = inModel.dataCache.reducedDataCacheDictionary['DependentData']
-        sufficientSolution = (max(depData) - min(depData)) / guessDivisorForGA
-        de = diffev.DiffEvolver(inModel.CalculateReducedDataFittingTarget, pop0, crossover_rate = crossoverProbabilityForGA, scale = diffScaleForGA, strategy = ('best', 1, 'bin'), prng = custom_prng_for_diffev())
+        batchFunction = None
+        if inModel.CanCalculateModelPredictionsInBatches():
+            batchFunction = inModel.CalculateReducedDataFittingTargetBatch
+        de = diffev.DiffEvolver(inModel.CalculateReducedDataFittingTarget, pop0, crossover_rate = crossoverProbabilityForGA, scale = diffScaleForGA, strategy = ('best', 1, 'bin'), prng = custom_prng_for_diffev(), batch_func = batchFunction)
         de.solve(sufficientSolution, maxGenerationsForGA)
         return de.best_vector
 
 
+    # Variable projection for models that are linear in some of their coefficients (see
+    # IModel.GetLinearCoefficientIndices()), for example y = a * exp(bx) + c * exp(dx).
+    # Only the nonlinear coefficients are searched, first by differential evolution on the
+    # reduced data and then by Levenberg-Marquardt on all data.  For every trial value of
+    # the nonlinear coefficients the linear ones are found by linear least squares.  Estimated
+    # coefficients are refined by Levenberg-Marquardt first.  If the rates of the refined estimate
+    # are distinct DE is skipped when it reaches the value DE stops at on the reduced data, and
+    # shortened when it leaves little of the variance unexplained.  The estimate does not join the
+    # DE population, where it could draw DE away from a better minimum, Levenberg-Marquardt also
+    # starts from the DE result and the lowest SSQ of these starts and their solutions wins.
+    def SolveUsingVariableProjection(self, inModel):
+        linearIndices = inModel.GetLinearCoefficientIndices()
+        if linearIndices == []:
+            raise Exception, 'This equation does not declare any linear coefficients'
+
+        numberOfCoefficients = len(inModel.GetCoefficientDesignators())
+        nonlinearIndices = [i for i in range(numberOfCoefficients) if i not in linearIndices]
+
+        inModel.dataCache.FindOrCreateAllDataCache(inModel)
+        inModel.dataCache.FindOrCreateReducedDataCache(inModel)
+        allData = inModel.dataCache.allDataCacheDictionary
+        weights = allData['Weights']
+
+        if nonlinearIndices == []:
+            inModel.solvedCoefficients = self.ProjectLinearCoefficients(inModel, [], allData, weights)[0]
+            return inModel.solvedCoefficients
+
+        def reducedDataSSQ(inNonlinearCoeffs):
+            residuals = self.ProjectLinearCoefficients(inModel, inNonlinearCoeffs, inModel.dataCache.reducedDataCacheDictionary, [])[1]
+            if residuals is None:
+                return 1.0E300
+            return numpy.sum(numpy.square(residuals))
+
+        def allDataResiduals(inNonlinearCoeffs):
+            residuals = self.ProjectLinearCoefficients(inModel, inNonlinearCoeffs, allData, weights)[1]
+            if residuals is None:
+                return numpy.ones(len(allData['DependentData'])) * 1.0E150 # squares to 1.0E300
+            return residuals
+
+        # same population scheme as SolveUsingDE, but only for the nonlinear coefficients
+        crossoverProbabilityForGA = 0.6
+        diffScaleForGA = 0.9
+        oneThirdOfPopulationSizeForGA = min(25 * len(nonlinearIndices), 100)
+        maxGenerationsForGA = min(10 * len(nonlinearIndices), 25)
+        guessDivisorForGA = min(2.0 * numberOfCoefficients, 10.0)
+
+        numpy.random.seed(3) # yield repeatable results
+        largeValuesArray = numpy.random.random(oneThirdOfPopulationSizeForGA * len(nonlinearIndices)) * 2000.0 - 1000.0
+        smallValuesArray = numpy.random.random(oneThirdOfPopulationSizeForGA * len(nonlinearIndices)) * 2.0 - 1.0
+        tinyValuesArray = numpy.random.random(oneThirdOfPopulationSizeForGA * len(nonlinearIndices)) * .002 - .001
+        pop0 = numpy.append(largeValuesArray, numpy.append(smallValuesArray, tinyValuesArray))
+        numpy.random.shuffle(pop0)
+        pop0 = pop0.reshape(oneThirdOfPopulationSizeForGA * 3, len(nonlinearIndices))
+
+        depData = inModel.dataCache.reducedDataCacheDictionary['DependentData']
+        sufficientSolution = (max(depData) - min(depData)) / guessDivisorForGA
+
+        # a start and, if Levenberg-Marquardt succeeds, its solution
+        def refine(inStart):
+            try:
+                return [inStart, scipy.optimize.leastsq(allDataResiduals, inStart, maxfev = len(nonlinearIndices) * self.fminIterationLimit)[0]]
+            except:
+                return [inStart]
+
+        rateIndices = [nonlinearIndices.index(i) for i in inModel.GetExponentialRateIndices() if i in nonlinearIndices]
+        candidates = []
+        if len(inModel.estimatedCoefficients) > 0:
+            candidates = refine(numpy.array(inModel.estimatedCoefficients, dtype = float)[nonlinearIndices])
+        refined = candidates[-1:]
+        if refined != [] and self.AreExponentialRatesDistinct(refined[0][rateIndices]):
+            refinedSSQ = reducedDataSSQ(refined[0])
+            if refinedSSQ <= sufficientSolution:
+                maxGenerationsForGA = 0
+            elif refinedSSQ <= self.sufficientUnexplainedVarianceForEstimates * numpy.sum(numpy.square(depData - numpy.mean(depData))):
+                maxGenerationsForGA = min(maxGenerationsForGA, self.generationsForGoodEstimates)
+        if maxGenerationsForGA > 0:
+            de = diffev.DiffEvolver(reducedDataSSQ, pop0, crossover_rate = crossoverProbabilityForGA, scale = diffScaleForGA, strategy = ('best', 1, 'bin'), prng = custom_prng_for_diffev())
+            de.solve(sufficientSolution, maxGenerationsForGA)
+            candidates += refine(numpy.array(de.best_vector, dtype = float))
+
+        best = None
+        bestSSQ = 1.0E300
+        for candidate in candidates:
+            if not self.AreExponentialRatesDistinct(candidate[rateIndices]):
+                continue
+            candidateSSQ = numpy.sum(numpy.square(allDataResiduals(candidate)))
+            if candidateSSQ < bestSSQ:
+                best = candidate
+                bestSSQ = candidateSSQ
+        if best is None:
+            raise Exception, 'Variable projection did not find a usable solution'
+
+        coefficients = self.ProjectLinearCoefficients(inModel, best, allData, weights)[0]
+        if coefficients is None:
+            raise Exception, 'Variable projection did not find a usable solution'
+        inModel.solvedCoefficients = coefficients
+        return inModel.solvedCoefficients
+
+
+    # DE on the reduced data stops once its fitting target is at or below this value.  inSufficientSSQ is the value
+    # for SSQABS, relative errors have no units so the relative targets use 1.0 / inGuessDivisor instead.  The sums of
+    # absolute values and the peak absolute values stop where the sum of squares can be no larger than that, which
+    # is a sum of absolute values of its square root or a peak of the square root of its mean.  AIC and BIC are
+    # logarithms that can be negative, they never stop DE early
+    def SufficientReducedDataFittingTarget(self, inModel, inSufficientSSQ, inGuessDivisor):
+        reduction, relativeFlag = pyeq2.FittingTargets.reductionDictionary[inModel.fittingTarget]
+        if reduction in [pyeq2.FittingTargets.AkaikeInformationCriterion, pyeq2.FittingTargets.BayesianInformationCriterion]:
+            return -1.0E300
+        if relativeFlag:
+            sufficientSSQ = 1.0 / inGuessDivisor
+        else:
+            sufficientSSQ = inSufficientSSQ
+        if reduction is pyeq2.FittingTargets.SumOfAbsoluteValues:
+            return numpy.sqrt(sufficientSSQ)
+        if reduction is pyeq2.FittingTargets.PeakAbsoluteValue:
+            return numpy.sqrt(sufficientSSQ / len(inModel.dataCache.reducedDataCacheDictionary['DependentData']))
+        return sufficientSSQ
+
+
+    # Two nearly equal rates give two nearly equal exponentials, their amplitudes can then grow large with
+    # opposite signs and cancel each other, which fits the data poorly with meaningless coefficients
+    def AreExponentialRatesDistinct(self, inRates):
+        rates = numpy.sort(inRates)
+        if len(rates) < 2:
+            return True
+        return numpy.all(numpy.diff(rates) > self.minimumRelativeRateSeparation * numpy.maximum(numpy.abs(rates[:-1]), numpy.abs(rates[1:])))
+
+
+    # Non-iterative estimate for sums of exponentials, y = a * exp(bx) + c * exp(dx) + ... (+ offset), for models
+    # that declare which coefficients are the rates (see IModel.GetExponentialRateIndices()).  The data are
+    # resampled onto evenly spaced x values, the rates are found with the matrix pencil method and the linear
+    # coefficients with ProjectLinearCoefficients().  Linear coefficients without a rate are constant terms,
+    # the pencil has one pole for each of them, near 1.0.  Returns [] if no estimate can be made.
+    def EstimateCoefficientsUsingMatrixPencil(self, inModel):
+        rateIndices = inModel.GetExponentialRateIndices()
+        linearIndices = inModel.GetLinearCoefficientIndices()
+        if rateIndices == [] or linearIndices == [] or inModel.GetDimensionality() != 2:
+            return []
+
+        numberOfCoefficients = len(inModel.GetCoefficientDesignators())
+        nonlinearIndices = [i for i in range(numberOfCoefficients) if i not in linearIndices]
+        if sorted(rateIndices) != nonlinearIndices: # every other coefficient has to be linear
+            return []
+        numberOfConstants = len(linearIndices) - len(rateIndices)
+        numberOfPoles = len(rateIndices) + numberOfConstants
+
+        inModel.dataCache.FindOrCreateAllDataCache(inModel)
+        allData = inModel.dataCache.allDataCacheDictionary
+
+        try:
+            # average the points with equal x, then sample evenly
+            xData, inverse = numpy.unique(allData['IndependentData'][0], return_inverse = True)
+            yData = numpy.bincount(inverse, weights = allData['DependentData']) / numpy.bincount(inverse)
+            numberOfSamples = min(len(xData), self.matrixPencilSampleLimit)
+            if numberOfSamples < 2 * numberOfPoles:
+                return []
+            step = (xData[-1] - xData[0]) / (numberOfSamples - 1.0)
+            samples = numpy.interp(numpy.linspace(xData[0], xData[-1], numberOfSamples), xData, yData)
+
+            # the poles are the eigenvalues of the pencil formed from the dominant right singular vectors of the Hankel matrix
+            pencilParameter = numberOfSamples / 2
+            hankel = numpy.array([samples[i:i + pencilParameter + 1] for i in range(numberOfSamples - pencilParameter)])
+            signalVectors = numpy.linalg.svd(hankel)[2][:numberOfPoles].T
+            poles = numpy.linalg.eigvals(numpy.dot(numpy.linalg.pinv(signalVectors[:-1]), signalVectors[1:]))
+            poles = poles[numpy.argsort(numpy.abs(poles - 1.0))][numberOfConstants:]
+            rates = numpy.sort(numpy.log(numpy.abs(poles)) / step)
+        except:
+            return []
+
+        if not self.AreExponentialRatesDistinct(rates):
+            return []
+        coefficients = numpy.zeros(numberOfCoefficients)
+        coefficients[rateIndices] = rates
+        coefficients = self.ProjectLinearCoefficients(inModel, coefficients[nonlinearIndices], allData, allData['Weights'])[0]
+        if coefficients is None:
+            return []
+        return coefficients
+
+
+    # For fixed nonlinear coefficients the model is c0 + sum(linear coefficient * basis), the
+    # basis columns are found from model predictions with one linear coefficient set to 1.0.
+    # Returns (all coefficients, weighted residuals), or (None, None) if the model can't be
+    # evaluated at these nonlinear coefficients or they make its basis ill-conditioned
+    def ProjectLinearCoefficients(self, inModel, inNonlinearCoeffs, inDataCacheDictionary, inWeights):
+        linearIndices = inModel.GetLinearCoefficientIndices()
+        coefficients = numpy.zeros(len(inModel.GetCoefficientDesignators()))
+        coefficients[[i for i in range(len(coefficients)) if i not in linearIndices]] = inNonlinearCoeffs
+        depData = inDataCacheDictionary['DependentData']
+
+        try:
+            constantPart = inModel.CalculateModelPredictions(coefficients, inDataCacheDictionary)
+            basis = numpy.empty((len(depData), len(linearIndices)))
+            for column in range(len(linearIndices)):
+                unitCoefficients = coefficients.copy()
+                unitCoefficients[linearIndices[column]] = 1.0
+                basis[:,column] = inModel.CalculateModelPredictions(unitCoefficients, inDataCacheDictionary) - constantPart
+            # CalculateModelPredictions() returns 1.0E300 where the model cannot be evaluated
+            if not numpy.all(numpy.isfinite(basis)) or numpy.max(numpy.abs(constantPart)) >= 1.0E300 or numpy.max(numpy.abs(basis)) >= 1.0E300:
+                return None, None
+
+            target = depData - constantPart
+            weightedBasis = basis
+            if len(inWeights):
+                weightedBasis = basis * inWeights[:,numpy.newaxis]
+                target = target * inWeights
+            # nearly dependent columns make large linear coefficients that cancel each other.  Only the nonlinear
+            # coefficients can make them so, a basis that does not depend on any is left to the least squares.  The
+            # condition number comes from the singular values of the least squares on the columns scaled to unit length
+            if len(inNonlinearCoeffs):
+                columnNorms = numpy.sqrt(numpy.sum(numpy.square(weightedBasis), axis = 0))
+                if numpy.min(columnNorms) <= 0.0:
+                    return None, None
+                linearCoefficients, unused, unused, singularValues = numpy.linalg.lstsq(weightedBasis / columnNorms, target, rcond = -1)
+                if singularValues[-1] * self.maximumLinearBasisConditionNumber < singularValues[0]:
+                    return None, None
+                linearCoefficients = linearCoefficients / columnNorms
+            else:
+                linearCoefficients = numpy.linalg.lstsq(weightedBasis, target, rcond = -1)[0]
+            coefficients[linearIndices] = linearCoefficients
+
+            residuals = numpy.dot(weightedBasis, linearCoefficients) - target
+            if not numpy.all(numpy.isfinite(residuals)):
+                return None, None
+        except:
+            return None, None
+        return coefficients, residuals
+
+
     def SolveUsingLevenbergMarquardt(self, inModel):
         LM1 = None
         LM2 = None
@@ -104,9 +351,15 @@ class SolverService(object):
         inModel.dataCache.FindOrCreateAllDataCache(inModel)
         inModel.dataCache.FindOrCreateReducedDataCache(inModel)
 
+        # models without an analytic Jacobian get one by finite differences.  The wrappers ignore the
+        # independent data, it is passed because newer versions of scipy do not accept None
+        jacobian = None
+        if inModel.HasAnalyticJacobian():
+            jacobian = inModel.WrapperForScipyCurveFitJacobian
+
         # first try is with initial coefficients are equal to 1
         try:
-            LM1, unused = scipy.optimize.curve_fit(inModel.WrapperForScipyCurveFit, None, inModel.dataCache.allDataCacheDictionary['DependentData'], numpy.ones(len(inModel.GetCoefficientDesignators())), maxfev=1000000) # initial coefficients are all equal to 1
+            LM1, unused = scipy.optimize.curve_fit(inModel.WrapperForScipyCurveFit, inModel.dataCache.allDataCacheDictionary['IndependentData'], inModel.dataCache.allDataCacheDictionary['DependentData'], numpy.ones(len(inModel.GetCoefficientDesignators())), jac=jacobian, maxfev=1000000) # initial coefficients are all equal to 1
             SSQ1 = inModel.CalculateAllDataFittingTarget(LM1)
         except:
             LM1 = None
@@ -119,7 +372,7 @@ class SolverService(object):
                 LM2 = inModel.estimatedCoefficients
                 SSQ2 = inModel.CalculateAllDataFittingTarget(LM2)
                 try:
-                    LM2, unused = scipy.optimize.curve_fit(inModel.WrapperForScipyCurveFit, None, inModel.dataCache.allDataCacheDictionary['DependentData'], inModel.estimatedCoefficients, maxfev=1000000)
+                    LM2, unused = scipy.optimize.curve_fit(inModel.WrapperForScipyCurveFit, inModel.dataCache.allDataCacheDictionary['IndependentData'], inModel.dataCache.allDataCacheDictionary['DependentData'], inModel.estimatedCoefficients, jac=jacobian, maxfev=1000000)
                     SSQ2 = inModel.CalculateAllDataFittingTarget(LM2)
                 except:
                     LM2 = inModel.estimatedCoefficients
@@ -109,6 +109,10 @@ class DiffEvolver(object):
         with eps of each other, convergence has been achieved.
       prng -- a RandomState instance. By default, this is the global
         numpy.random instance.
+      batch_func -- optional vectorized version of func, takes an array with
+        one vector per row and returns the array of their function values.
+        If given (and no boundaries are set) every generation is built and
+        evaluated at once, see solve().
 
     DiffEvolver.frombounds(func, lbound, ubound, npop, crossover_rate=0.5,
         scale=None, strategy=('rand', 2, 'bin'), eps=1e-6)
@@ -121,7 +125,10 @@ class DiffEvolver(object):
     --------------
     solve(newgens=100)
       Run the minimizer for newgens more generations. Return the best parameter
-      vector from the whole run.
+      vector from the whole run. With a batch_func the trial vectors of a
+      generation are all built from the population and best vector at the start
+      of the generation and evaluated in one batch_func call, otherwise they are
+      built and evaluated one candidate at a time.
 
     Public Members
     --------------
@@ -135,8 +142,9 @@ class DiffEvolver(object):
     func, args, crossover_rate, scale, strategy, eps -- from constructor
     """
     def __init__(self, func, pop0, args=(), crossover_rate=0.5, scale=None,
-            strategy=('rand', 2, 'bin'), eps=1e-6, prng=numpy.random):
+            strategy=('rand', 2, 'bin'), eps=1e-6, prng=numpy.random, batch_func=None):
         self.func = func
+        self.batch_func = batch_func
         self.population = numpy.array(pop0)
         self.npop, self.ndim = self.population.shape
         self.args = args
@@ -145,7 +153,7 @@ class DiffEvolver(object):
         self.eps = eps
         self.prng = prng
 
-        self.pop_values = [self.func(m, *args) for m in self.population]
+        self.pop_values = self.evaluate_population()
         bestidx = numpy.argmin(self.pop_values)
         self.best_vector = self.population[bestidx]
         self.best_value = self.pop_values[bestidx]
@@ -174,7 +182,12 @@ class DiffEvolver(object):
         self.best_val_history = []
         self.best_vec_history = []
         self.generations = 0
-        self.pop_values = [self.func(m, *self.args) for m in self.population]
+        self.pop_values = self.evaluate_population()
+
+    def evaluate_population(self):
+        if self.batch_func is None:
+            return [self.func(m, *self.args) for m in self.population]
+        return numpy.array(self.batch_func(self.population, *self.args), dtype=float)
 
     def frombounds(self, cls, func, lbound, ubound, npop, crossover_rate=0.5,
             scale=None, strategy=('rand', 2, 'bin'), eps=1e-6, prng=numpy.random):
@@ -282,6 +295,56 @@ class DiffEvolver(object):
             chooser(candidate) + differ(candidate))
         return trial
 
+    def get_trials(self):
+        """Builds the trial vectors of the whole generation, one row per candidate.
+        The random numbers are drawn in the same order as by get_trial() for
+        candidate 0, 1, ..., so the rows are the trials get_trial() would build if
+        the population did not change during the generation.
+        """
+        base, ndiff, crossover = self.strategy
+        nchoose = 0
+        if base == 'rand':
+            nchoose = 1
+        samples = numpy.random.random_integers(0, self.npop-1, (self.npop, nchoose + 2*ndiff))
+
+        if base == 'best':
+            chosen = self.best_vector
+        elif base == 'rand':
+            chosen = self.population[samples[:,0]]
+        else:
+            chosen = (1-self.scale) * self.population + self.scale * self.best_vector
+
+        d = samples[:,nchoose:]
+        if ndiff == 1:
+            diff = self.scale * (self.population[d[:,0]] - self.population[d[:,1]])
+        else:
+            diff = self.scale * (self.population[d[:,0]] - self.population[d[:,1]] +
+                                 self.population[d[:,2]] - self.population[d[:,3]])
+
+        mask = numpy.array([self.prng.rand(self.ndim) for candidate in range(self.npop)]) < self.crossover_rate
+        return numpy.where(mask, chosen + diff, self.population)
+
+    def solve_batch(self, sufficientSolution, newgens):
+        """solve() for a batch_func, one batch_func call per generation"""
+        for gen in xrange(self.generations+1, self.generations+newgens+1):
+            trials = self.get_trials()
+            trial_values = numpy.array(self.batch_func(trials, *self.args), dtype=float)
+            improved = numpy.isfinite(trial_values) & numpy.isfinite(self.pop_values) & (trial_values < self.pop_values)
+            self.population[improved] = trials[improved]
+            self.pop_values[improved] = trial_values[improved]
+            bestidx = numpy.argmin(self.pop_values)
+            if self.pop_values[bestidx] < self.best_value:
+                self.best_vector = self.population[bestidx].copy()
+                self.best_value = self.pop_values[bestidx]
+            self.best_val_history.append(self.best_value)
+            self.best_vec_history.append(self.best_vector)
+            if self.converged():
+                break
+            if self.best_value <= sufficientSolution: ############### is current solution good enough?
+                break
+        self.generations = gen
+        return self.best_vector
+
     def converged(self):
         return max(self.pop_values) - min(self.pop_values) <= self.eps
 
@@ -296,6 +359,9 @@ class DiffEvolver(object):
 
         Return best parameter vector from the entire run.
         """
+        if self.batch_func is not None and self.bound is None:
+            return self.solve_batch(sufficientSolution, newgens)
+
         for gen in xrange(self.generations+1, self.generations+newgens+1):
             for candidate in range(self.npop):
                 
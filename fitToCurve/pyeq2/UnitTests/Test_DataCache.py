@@ -1,7 +1,7 @@
 #    Version info: $Id: Test_DataCache.py 1 2012-01-07 22:20:43Z zunzun.com@gmail.com $
 
 # the pyeq2 directory is located up one level from here
-import sys, os, unittest
+import sys, os, unittest, gc
 if os.path.join(sys.path[0][:sys.path[0].rfind(os.sep)], '..') not in sys.path:
     sys.path.append(os.path.join(sys.path[0][:sys.path[0].rfind(os.sep)], '..'))
 
@@ -102,6 +102,210 @@ class TestDataCache(unittest.TestCase):
         self.assertTrue(numpy.equal(model.dataCache.reducedDataCacheDictionary['Y'], cached_Y_ShouldBe).all())
 
 
+    def test_GenerateReducedRawData_3D(self):
+        # the first of any equal minimum and maximum values of each dimension plus evenly spaced points, in data order
+        rawData = numpy.column_stack(((numpy.arange(50) % 7) * 1.5, (numpy.arange(50) % 5) - 2.0, (numpy.arange(50) % 11) * 0.25, numpy.linspace(0.5, 1.5, 50)))
+        model = mockModel_3D('SSQABS')
+        service.ConvertNumpyArrays(rawData, model, True)
+        model.dataCache.FindOrCreateReducedDataCache(model)
+        allData = model.dataCache.allDataCacheDictionary
+        reducedData = model.dataCache.reducedDataCacheDictionary
+
+        indicesShouldBe = set([i * 50 / model.numberOfReducedDataPoints for i in range(model.numberOfReducedDataPoints)])
+        for values in [list(allData['IndependentData'][0]), list(allData['IndependentData'][1]), list(allData['DependentData'])]:
+            indicesShouldBe.add(values.index(min(values)))
+            indicesShouldBe.add(values.index(max(values)))
+        indicesShouldBe = sorted(indicesShouldBe)
+
+        self.assertTrue(numpy.equal(reducedData['IndependentData'], allData['IndependentData'][:,indicesShouldBe]).all())
+        self.assertTrue(numpy.equal(reducedData['DependentData'], allData['DependentData'][indicesShouldBe]).all())
+        self.assertTrue(numpy.equal(reducedData['Weights'], allData['Weights'][indicesShouldBe]).all())
+
+
+    def test_ReducedDataStrategies_2D(self):
+        x = numpy.linspace(0.1, 5.0, 300)
+        rawData = numpy.column_stack((x, 900.0 * numpy.exp(-2.0 * x) + 150.0 * numpy.exp(-0.05 * x)))
+        for strategy in pyeq2.DataCache.DataCache.DataCache.reducedDataStrategyDictionary.keys():
+            model = mockModel_2D('SSQABS')
+            model.reducedDataStrategy = strategy
+            service.ConvertNumpyArrays(rawData, model, False)
+            model.dataCache.FindOrCreateReducedDataCache(model)
+            allData = model.dataCache.allDataCacheDictionary
+            reducedData = model.dataCache.reducedDataCacheDictionary
+
+            # the extrema and up to numberOfReducedDataPoints more, each point once
+            self.assertTrue(model.numberOfReducedDataPoints / 2 <= len(reducedData['DependentData']) <= model.numberOfReducedDataPoints + 4)
+            self.assertEqual(len(set(reducedData['IndependentData'][0])), len(reducedData['DependentData']))
+            for values, reducedValues in [(allData['IndependentData'][0], reducedData['IndependentData'][0]), (allData['DependentData'], reducedData['DependentData'])]:
+                self.assertTrue(min(values) in reducedValues and max(values) in reducedValues)
+
+        # arc length and curvature draw more points from the early drop of a decay curve
+        counts = {}
+        for strategy in ['Even', 'ArcLength', 'Curvature']:
+            model = mockModel_2D('SSQABS')
+            model.reducedDataStrategy = strategy
+            service.ConvertNumpyArrays(rawData, model, False)
+            model.dataCache.FindOrCreateReducedDataCache(model)
+            counts[strategy] = numpy.sum(model.dataCache.reducedDataCacheDictionary['IndependentData'][0] < 1.0)
+        self.assertTrue(counts['ArcLength'] > counts['Even'])
+        self.assertTrue(counts['Curvature'] > counts['Even'])
+
+
+    def test_ReducedDataStrategyIsDrawnAgain_2D(self):
+        rawData = numpy.column_stack((numpy.linspace(0.1, 5.0, 300), numpy.linspace(10.0, 1.0, 300) ** 2))
+        model = mockModel_2D('SSQABS')
+        model.reducedDataStrategy = 'Random'
+        service.ConvertNumpyArrays(rawData, model, False)
+        model.dataCache.FindOrCreateReducedDataCache(model)
+        randomData = model.dataCache.reducedDataCacheDictionary['DependentData']
+
+        model.dataCache.FindOrCreateReducedDataCache(model) # same strategy and seed, the cache is kept
+        self.assertTrue(model.dataCache.reducedDataCacheDictionary['DependentData'] is randomData)
+
+        model.dataCache.reducedDataCacheDictionary = {} # the same seed draws the same points
+        model.dataCache.FindOrCreateReducedDataCache(model)
+        self.assertTrue(numpy.equal(model.dataCache.reducedDataCacheDictionary['DependentData'], randomData).all())
+
+        model.reducedDataRandomSeed = 4
+        model.dataCache.FindOrCreateReducedDataCache(model)
+        self.assertFalse(numpy.array_equal(model.dataCache.reducedDataCacheDictionary['DependentData'], randomData))
+
+        model.reducedDataStrategy = 'Even'
+        model.dataCache.FindOrCreateReducedDataCache(model)
+        self.assertEqual(model.dataCache.reducedDataCacheDictionary['ReducedDataStrategy'], ('Even', None))
+
+        model.reducedDataStrategy = 'Unknown'
+        self.assertRaises(Exception, model.dataCache.FindOrCreateReducedDataCache, model)
+
+
+
+    def test_SharedColumns_2D(self):
+        sharedColumnCache = pyeq2.DataCache.SharedColumnCache.SharedColumnCache()
+        rawData = numpy.column_stack((numpy.linspace(0.1, 5.0, 300), numpy.linspace(10.0, 1.0, 300) ** 2))
+        models = []
+        for i in range(3):
+            model = mockModel_2D('SSQABS')
+            model.dataCache.sharedColumnCache = sharedColumnCache
+            model.dataCache.minimumPointsForSharedColumns = 0
+            service.ConvertNumpyArrays(rawData, model, False)
+            model.dataCache.FindOrCreateAllDataCache(model)
+            models.append(model)
+
+        # the same data in other arrays, the columns are calculated once
+        self.assertTrue(models[1].dataCache.allDataCacheDictionary['ExpX'] is models[0].dataCache.allDataCacheDictionary['ExpX'])
+        self.assertTrue(models[2].dataCache.allDataCacheDictionary['ExpX'] is models[0].dataCache.allDataCacheDictionary['ExpX'])
+        self.assertEqual((sharedColumnCache.misses, sharedColumnCache.hits), (2, 4))
+        self.assertFalse(models[0].dataCache.allDataCacheDictionary['ExpX'].flags.writeable)
+
+        # other data have their own columns
+        model = mockModel_2D('SSQABS')
+        model.dataCache.sharedColumnCache = sharedColumnCache
+        model.dataCache.minimumPointsForSharedColumns = 0
+        service.ConvertNumpyArrays(rawData * 0.5, model, False)
+        model.dataCache.FindOrCreateAllDataCache(model)
+        self.assertTrue(numpy.equal(model.dataCache.allDataCacheDictionary['ExpX'], numpy.exp(model.dataCache.allDataCacheDictionary['IndependentData'][0])).all())
+        self.assertEqual(len(sharedColumnCache.referenceCounts), 2)
+
+        # a model that does not share calculates its own columns, and so does one with fewer points than minimumPointsForSharedColumns
+        for i in range(2):
+            model = mockModel_2D('SSQABS')
+            if i == 0:
+                model.dataCache.sharedColumnCache = None
+            else:
+                model.dataCache.sharedColumnCache = sharedColumnCache
+                model.dataCache.minimumPointsForSharedColumns = 301
+            service.ConvertNumpyArrays(rawData, model, False)
+            model.dataCache.FindOrCreateAllDataCache(model)
+            self.assertFalse(model.dataCache.allDataCacheDictionary['ExpX'] is models[0].dataCache.allDataCacheDictionary['ExpX'])
+            self.assertTrue(numpy.equal(model.dataCache.allDataCacheDictionary['ExpX'], models[0].dataCache.allDataCacheDictionary['ExpX']).all())
+        self.assertEqual((sharedColumnCache.misses, sharedColumnCache.hits), (4, 4))
+
+        # the reference to the data of the first three models is released with the last of them
+        key = models[0].dataCache.allDataCacheDictionary['SharedColumnCacheKey'][1]
+        self.assertEqual(sharedColumnCache.referenceCounts[key], 3)
+        del models[:2]
+        self.assertEqual(sharedColumnCache.referenceCounts[key], 1)
+        del models[:]
+        self.assertFalse(sharedColumnCache.referenceCounts.has_key(key))
+
+
+    def test_SharedColumnsAreReleasedWithoutGarbageCollection_2D(self):
+        sharedColumnCache = pyeq2.DataCache.SharedColumnCache.SharedColumnCache()
+        rawData = numpy.column_stack((numpy.linspace(0.1, 5.0, 300), numpy.linspace(10.0, 1.0, 300) ** 2))
+        gc.disable()
+        try:
+            model = pyeq2.Models_2D.Exponential.Exponential('SSQABS')
+            model.dataCache.sharedColumnCache = sharedColumnCache
+            model.dataCache.minimumPointsForSharedColumns = 0
+            service.ConvertNumpyArrays(rawData, model, False)
+            model.dataCache.FindOrCreateAllDataCache(model)
+            model.CalculateAllDataFittingTarget(numpy.array([1.0, -0.5])) # the fitting target refers to the model
+            key = model.dataCache.allDataCacheDictionary['SharedColumnCacheKey'][1]
+            self.assertEqual(sharedColumnCache.referenceCounts[key], 1)
+
+            # new data release the columns of the old data
+            model.dataCache.allDataCacheDictionary = {}
+            service.ConvertNumpyArrays(rawData * 0.5, model, False)
+            self.assertFalse(sharedColumnCache.referenceCounts.has_key(key))
+            model.dataCache.FindOrCreateAllDataCache(model)
+            model.CalculateAllDataFittingTarget(numpy.array([1.0, -0.5]))
+            self.assertEqual(len(sharedColumnCache.referenceCounts), 1)
+
+            # and the model itself releases them as soon as it is deleted
+            del model
+            self.assertEqual(sharedColumnCache.referenceCounts, {})
+        finally:
+            gc.enable()
+
+
+    def test_SharedColumnCacheEvictsLeastRecentlyUsed(self):
+        # 800 bytes for each copy of the data and each column
+        sharedColumnCache = pyeq2.DataCache.SharedColumnCache.SharedColumnCache(7 * 800)
+        keys = [sharedColumnCache.Key(numpy.arange(100.0) + i) for i in range(4)]
+        self.assertEqual(len(set(keys)), 4)
+        owner = pyeq2.DataCache.DataCache.DataCache()
+        reference = sharedColumnCache.Acquire(keys[0], owner)
+        for key in keys:
+            sharedColumnCache.Put(key, 'X', numpy.arange(100.0))
+        # over the limit, the least recently used column that is not referenced goes first, and with it the copy of its data
+        self.assertTrue(sharedColumnCache.Get(keys[0], 'X') is not None)
+        self.assertTrue(sharedColumnCache.Get(keys[1], 'X') is None)
+        self.assertFalse(sharedColumnCache.independentData.has_key(keys[1]))
+        self.assertEqual(sharedColumnCache.numberOfBytes, 6 * 800)
+
+        sharedColumnCache.Get(keys[2], 'X')
+        self.assertEqual(sharedColumnCache.Key(numpy.arange(100.0) + 1), keys[1])
+        sharedColumnCache.Put(keys[1], 'X', numpy.arange(100.0))
+        self.assertTrue(sharedColumnCache.Get(keys[3], 'X') is None)
+        self.assertTrue(sharedColumnCache.Get(keys[2], 'X') is not None)
+        self.assertEqual(sharedColumnCache.numberOfBytes, 6 * 800)
+
+        # the key in use keeps its column and data even when that is all there is room for
+        sharedColumnCache.maximumBytes = 0
+        sharedColumnCache.Evict()
+        self.assertEqual(sharedColumnCache.columns.keys(), [(keys[0], 'X')])
+        self.assertEqual(sharedColumnCache.numberOfBytes, 2 * 800)
+        sharedColumnCache.Release(reference)
+        self.assertEqual(sharedColumnCache.numberOfBytes, 0)
+        self.assertEqual(sharedColumnCache.independentData, {})
+        sharedColumnCache.Release(reference) # releasing again does nothing
+        del owner
+        self.assertEqual(sharedColumnCache.referenceCounts, {})
+
+
+    def test_SharedColumnCacheKeepsACopyOfTheData(self):
+        sharedColumnCache = pyeq2.DataCache.SharedColumnCache.SharedColumnCache()
+        data = numpy.arange(100.0)
+        key = sharedColumnCache.Key(data)
+        self.assertFalse(sharedColumnCache.independentData[key] is data)
+        self.assertFalse(sharedColumnCache.independentData[key].flags.writeable)
+        # changing the caller's array does not change the data of the key
+        data[-1] = -1.0
+        self.assertEqual(sharedColumnCache.Key(numpy.arange(100.0)), key)
+        self.assertEqual(sharedColumnCache.numberOfBytes, 800)
+        sharedColumnCache.Clear()
+        self.assertEqual(sharedColumnCache.numberOfBytes, 0)
+
 
 if __name__ == '__main__':
     unittest.main()
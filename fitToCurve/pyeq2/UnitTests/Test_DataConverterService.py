@@ -93,6 +93,71 @@ class TestConversions(unittest.TestCase):
         self.assertTrue(numpy.equal(model.dataCache.allDataCacheDictionary['Weights'], converted_Weights_ShouldBe).all())
 
 
+    def test_ConversionOfColumns_NumpyArrays_2D_NoWeights(self):
+        converted_IndepData_ShouldBe = numpy.array([[1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9],
+                                                  [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]])
+        converted_DepData_ShouldBe = numpy.array([2.0, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9])
+        model = mockModel('SSQABS')
+        model._dimensionality = 2
+        rawData = numpy.array([[1.9, 2.9], [1.0, 2.0], [1.1, 2.1], [1.2, 2.2], [1.3, 2.3], [1.4, 2.4], [1.5, 2.5], [1.6, 2.6], [1.7, 2.7], [1.8, 2.8]])
+        service.ConvertNumpyArrays(rawData, model, False)
+        self.assertTrue(numpy.equal(model.dataCache.allDataCacheDictionary['DependentData'], converted_DepData_ShouldBe).all())
+        self.assertTrue(numpy.equal(model.dataCache.allDataCacheDictionary['IndependentData'], converted_IndepData_ShouldBe).all())
+        self.assertEqual(model.dataCache.allDataCacheDictionary['Weights'], [])
+        self.assertTrue(model.dataCache.independentData1ContainsPositiveFlag)
+        self.assertFalse(model.dataCache.independentData1ContainsNegativeFlag)
+        self.assertFalse(model.dataCache.DependentDataContainsZeroFlag)
+
+
+    def test_ConversionOfColumns_NumpyArrays_3D_Weights(self):
+        converted_IndepData_ShouldBe = numpy.array([[1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9],
+                                                  [2.0, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9]])
+        converted_DepData_ShouldBe = numpy.array([3.0, 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 3.7, 3.8, 3.9])
+        converted_Weights_ShouldBe = numpy.array([4.0, 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8, 4.9])
+        model = mockModel('SSQABS')
+        model._dimensionality = 3
+        rawData = numpy.array([[float(token) for token in line.split()] for line in DataForUnitTests.asciiDataInFourColumns.split('\n') if len(line.split()) == 4])
+        service.ConvertNumpyArrays(rawData[::-1], model, True)
+        self.assertTrue(numpy.equal(model.dataCache.allDataCacheDictionary['DependentData'], converted_DepData_ShouldBe).all())
+        self.assertTrue(numpy.equal(model.dataCache.allDataCacheDictionary['IndependentData'], converted_IndepData_ShouldBe).all())
+        self.assertTrue(numpy.equal(model.dataCache.allDataCacheDictionary['Weights'], converted_Weights_ShouldBe).all())
+
+
+    def test_ConversionOfColumns_NumpyArrays_MatchASCII(self):
+        for dimensionality in [1, 2, 3]:
+            for useWeights in [False, True]:
+                modelASCII = mockModel('SSQABS')
+                modelASCII._dimensionality = dimensionality
+                service.ConvertAndSortColumnarASCII(DataForUnitTests.asciiDataInColumns_3D, modelASCII, useWeights)
+                modelArrays = mockModel('SSQABS')
+                modelArrays._dimensionality = dimensionality
+                rawData = numpy.array([[float(token) for token in line.split()] for line in DataForUnitTests.asciiDataInColumns_3D.split('\n') if len(line.split()) == 3])
+                service.ConvertNumpyArrays(rawData, modelArrays, useWeights)
+                for key in modelASCII.dataCache.allDataCacheDictionary:
+                    self.assertTrue(numpy.array_equal(modelASCII.dataCache.allDataCacheDictionary[key], modelArrays.dataCache.allDataCacheDictionary[key]))
+                for flag in ['independentData1ContainsZeroFlag', 'independentData1ContainsPositiveFlag', 'independentData1ContainsNegativeFlag',
+                             'independentData2ContainsZeroFlag', 'independentData2ContainsPositiveFlag', 'independentData2ContainsNegativeFlag', 'DependentDataContainsZeroFlag']:
+                    self.assertEqual(getattr(modelASCII.dataCache, flag), getattr(modelArrays.dataCache, flag))
+
+
+    def test_ConversionOfColumns_PythonSequences_2D_DiscardedRows(self):
+        converted_IndepData_ShouldBe = numpy.array([[0.0, -2.0, 1.0],
+                                                  [1.0, 1.0, 1.0]])
+        converted_DepData_ShouldBe = numpy.array([-1.0, 0.0, 3.0])
+        converted_Weights_ShouldBe = numpy.array([2.0, 5.0, 4.0])
+        model = mockModel('SSQABS')
+        model._dimensionality = 2
+        rawData = [(-2.0, 0.0, 5.0), (1.0, 3.0, 4.0), (0.0, -1.0, 2.0), (None, 1.0, 1.0), (2.0E301, 1.0, 1.0), (1.0, 1.0), ('text', 1.0, 1.0)]
+        service.ConvertPythonSequences(rawData, model, True)
+        self.assertTrue(numpy.equal(model.dataCache.allDataCacheDictionary['DependentData'], converted_DepData_ShouldBe).all())
+        self.assertTrue(numpy.equal(model.dataCache.allDataCacheDictionary['IndependentData'], converted_IndepData_ShouldBe).all())
+        self.assertTrue(numpy.equal(model.dataCache.allDataCacheDictionary['Weights'], converted_Weights_ShouldBe).all())
+        self.assertTrue(model.dataCache.independentData1ContainsZeroFlag)
+        self.assertTrue(model.dataCache.independentData1ContainsPositiveFlag)
+        self.assertTrue(model.dataCache.independentData1ContainsNegativeFlag)
+        self.assertTrue(model.dataCache.DependentDataContainsZeroFlag)
+
+
 
 if __name__ == '__main__':
     unittest.main()
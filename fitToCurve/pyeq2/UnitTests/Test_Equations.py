@@ -5,6 +5,7 @@ if os.path.join(sys.path[0][:sys.path[0].rfind(os.sep)], '..') not in sys.path:
     sys.path.append(os.path.join(sys.path[0][:sys.path[0].rfind(os.sep)], '..'))
 
 import pyeq2
+import numpy
 
 
 
@@ -34,6 +35,19 @@ class Test_Exponential2D(unittest.TestCase):
         self.assertTrue(8.30E-03 >= equation.CalculateAllDataFittingTarget(equation.Solve()))
 
 
+    def test_RadonProgenyAlphaAndBeta(self):
+        # activities up to 4 hours after collection from initial Po-218, Pb-214 and Bi-214 activities of 100, 60 and 40
+        xData = numpy.array([0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 4.0])
+        initialActivities = [100.0, 60.0, 40.0]
+        for kind in ['Alpha', 'Beta']:
+            equation = getattr(pyeq2.Models_2D.Exponential, 'RadonProgeny' + kind)('SSQABS')
+            basis = getattr(pyeq2.DataCache.DataCacheFunctions, 'RadonProgeny' + kind)
+            yData = sum([activity * basis([xData], [source]) for source, activity in enumerate(initialActivities)])
+            pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((xData, yData)), equation, False)
+            self.assertTrue(equation.CanLinearSolverBeUsedForSSQABS())
+            self.assertTrue(numpy.allclose(equation.Solve(), initialActivities, rtol=1.0E-08, atol=1.0E-300))
+
+
 
 class Test_LegendrePolynomial2D(unittest.TestCase):
 
@@ -121,6 +135,101 @@ class Test_InstantiationOfAllEquations(unittest.TestCase):
                         if equationClass[1].autoGenerateOffsetForm == True:
                             equationClass[1]('SSQABS', 'Offset') # offset forms
 
+
+
+
+class Test_CalculateModelPredictionsBatch(unittest.TestCase):
+
+    def assertBatchMatchesLoop(self, equation):
+        pyeq2.dataConvertorService().ConvertAndSortColumnarASCII(equation.exampleData, equation, False)
+        equation.dataCache.FindOrCreateAllDataCache(equation)
+        dataCacheDictionary = equation.dataCache.allDataCacheDictionary
+        randomState = numpy.random.RandomState(3)
+        numberOfCoefficients = len(equation.GetCoefficientDesignators())
+        population = numpy.vstack([randomState.uniform(-2.0, 2.0, (10, numberOfCoefficients)), randomState.uniform(-100.0, 100.0, (5, numberOfCoefficients))])
+        predictionsShouldBe = numpy.array([equation.CalculateModelPredictions(coeffs, dataCacheDictionary) for coeffs in population.copy()])
+        predictions = equation.CalculateModelPredictionsBatch(population, dataCacheDictionary)
+        self.assertTrue(numpy.allclose(predictions, predictionsShouldBe, rtol=1.0E-09, atol=1.0E-300), equation.GetDisplayName())
+
+
+    def test_BatchedModels(self):
+        for submodule in inspect.getmembers(pyeq2.Models_2D) + inspect.getmembers(pyeq2.Models_3D):
+            if inspect.ismodule(submodule[1]):
+                for equationClass in inspect.getmembers(submodule[1]):
+                    if inspect.isclass(equationClass[1]) and equationClass[1]._canCalculateModelPredictionsInBatches and not equationClass[1].userSelectablePolynomialFlag:
+                        self.assertBatchMatchesLoop(equationClass[1]('SSQABS'))
+                        if equationClass[1].autoGenerateOffsetForm == True:
+                            self.assertBatchMatchesLoop(equationClass[1]('SSQABS', 'Offset'))
+
+
+    def test_ExtendedVersions(self):
+        # every extended form, whether or not the model generates it automatically, with or without its own batch path
+        for extendedVersionName in Test_CalculateModelJacobian.extendedVersionNames:
+            for equationClass in [pyeq2.Models_2D.Exponential.DoubleExponential, pyeq2.Models_2D.Exponential.RadonProgenyAlpha, pyeq2.Models_2D.Exponential.RadonProgenyBeta,
+                                  pyeq2.Models_2D.Power.PowerLawExponentialCutoff, pyeq2.Models_2D.Sigmoidal.FourParameterLogistic, pyeq2.Models_3D.Polynomial.Linear]:
+                self.assertBatchMatchesLoop(equationClass('SSQABS', extendedVersionName))
+
+
+    def test_UserSelectablePolynomials(self):
+        self.assertBatchMatchesLoop(pyeq2.Models_2D.Polynomial.UserSelectablePolynomial('SSQABS', 'Default', 3))
+        self.assertBatchMatchesLoop(pyeq2.Models_3D.Polynomial.UserSelectablePolynomial('SSQABS', 'Default', 2, 2))
+
+
+    def test_LoopFallback(self):
+        equation = pyeq2.Models_2D.Logarithmic.LinearLogarithmic('SSQABS')
+        self.assertFalse(equation.CanCalculateModelPredictionsInBatches())
+        self.assertBatchMatchesLoop(equation)
+
+
+
+class Test_CalculateModelJacobian(unittest.TestCase):
+
+    extendedVersionNames = ['Default', 'Offset', 'Reciprocal', 'ReciprocalWithOffset', 'Inverse', 'InverseWithOffset',
+                            'LinearGrowth', 'LinearGrowthAndOffset', 'LinearDecay', 'LinearDecayAndOffset',
+                            'ExponentialGrowth', 'ExponentialGrowthAndOffset', 'ExponentialDecay', 'ExponentialDecayAndOffset']
+
+    def assertJacobianMatchesFiniteDifferences(self, equation):
+        x = numpy.linspace(1.0, 4.0, 25)
+        if equation.GetDimensionality() == 2:
+            pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((x, numpy.exp(-x) + x)), equation)
+        else:
+            pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((x, 0.7 * x[::-1] + 0.3, numpy.exp(-x) + x)), equation)
+        equation.dataCache.FindOrCreateAllDataCache(equation)
+        dataCacheDictionary = equation.dataCache.allDataCacheDictionary
+        coeffs = numpy.random.RandomState(3).uniform(0.3, 0.9, len(equation.GetCoefficientDesignators()))
+
+        jacobianShouldBe = numpy.empty((len(x), len(coeffs)))
+        for i in range(len(coeffs)):
+            step = numpy.zeros(len(coeffs))
+            step[i] = 1.0E-6
+            jacobianShouldBe[:,i] = (equation.CalculateModelPredictions(coeffs + step, dataCacheDictionary) - equation.CalculateModelPredictions(coeffs - step, dataCacheDictionary)) / 2.0E-6
+        jacobian = equation.CalculateModelJacobian(coeffs, dataCacheDictionary)
+        self.assertTrue(numpy.allclose(jacobian, jacobianShouldBe, rtol=1.0E-05, atol=1.0E-08), equation.GetDisplayName())
+
+
+    def test_ModelsWithAnalyticJacobians(self):
+        for submodule in [pyeq2.Models_2D.Exponential, pyeq2.Models_2D.Power, pyeq2.Models_2D.Polynomial, pyeq2.Models_3D.Polynomial]:
+            for equationClass in inspect.getmembers(submodule):
+                if inspect.isclass(equationClass[1]) and equationClass[1]._hasAnalyticJacobian:
+                    self.assertJacobianMatchesFiniteDifferences(equationClass[1]('SSQABS'))
+        self.assertJacobianMatchesFiniteDifferences(pyeq2.Models_2D.Polynomial.Quadratic('SSQABS'))
+        self.assertJacobianMatchesFiniteDifferences(pyeq2.Models_3D.Polynomial.FullCubic('SSQABS'))
+        self.assertJacobianMatchesFiniteDifferences(pyeq2.Models_2D.Polynomial.UserSelectablePolynomial('SSQABS', 'Default', 3))
+
+
+    def test_ExtendedVersionChainRule(self):
+        for extendedVersionName in self.extendedVersionNames:
+            self.assertJacobianMatchesFiniteDifferences(pyeq2.Models_2D.Exponential.DoubleExponential('SSQABS', extendedVersionName))
+            self.assertJacobianMatchesFiniteDifferences(pyeq2.Models_2D.Power.PowerLawExponentialCutoff('SSQABS', extendedVersionName)) # has a global multiplier
+            self.assertJacobianMatchesFiniteDifferences(pyeq2.Models_2D.Exponential.RadonProgenyAlpha('SSQABS', extendedVersionName))
+            self.assertJacobianMatchesFiniteDifferences(pyeq2.Models_2D.Exponential.RadonProgenyBeta('SSQABS', extendedVersionName))
+            self.assertJacobianMatchesFiniteDifferences(pyeq2.Models_3D.Polynomial.Linear('SSQABS', extendedVersionName))
+
+
+    def test_NoAnalyticJacobian(self):
+        equation = pyeq2.Models_2D.Sigmoidal.FourParameterLogistic('SSQABS')
+        self.assertFalse(equation.HasAnalyticJacobian())
+        self.assertEqual(equation.CalculateModelJacobian([1.0, 1.0, 1.0, 1.0], {}), None)
                     
         
 if __name__ == '__main__':
@@ -64,6 +64,98 @@ class TestModelSolveMethods(unittest.TestCase):
         self.assertTrue(numpy.allclose(result[1], resultShouldBe[1], rtol=1.0E-06, atol=1.0E-300))
         self.assertEqual(result[2], resultShouldBe[2])
 
+
+    def test_AllDataFittingTargets_2D(self):
+        coeffs = numpy.array([-7.9, 1.5])
+        weights = numpy.linspace(0.5, 1.5, 11)
+        for fittingTarget in ['SSQABS', 'SSQREL', 'ABSABS', 'ABSREL', 'PEAKABS', 'PEAKREL', 'AIC', 'BIC']:
+            model = pyeq2.Models_2D.Polynomial.Linear(fittingTarget)
+            pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((numpy.linspace(5.0, 10.0, 11), numpy.linspace(0.4, 7.1, 11) ** 1.1, weights)), model, True)
+            model.dataCache.FindOrCreateAllDataCache(model)
+            error = (model.CalculateModelPredictions(coeffs, model.dataCache.allDataCacheDictionary) - model.dataCache.allDataCacheDictionary['DependentData']) * weights
+            relativeError = error / model.dataCache.allDataCacheDictionary['DependentData']
+            ll = -5.5 * (1.0 + numpy.log(2.0 * numpy.pi)) - 5.5 * numpy.log(numpy.dot(error, error) / 11.0)
+            valueShouldBe = {'SSQABS': numpy.sum(numpy.square(error)), 'SSQREL': numpy.sum(numpy.square(relativeError)),
+                             'ABSABS': numpy.sum(numpy.abs(error)), 'ABSREL': numpy.sum(numpy.abs(relativeError)),
+                             'PEAKABS': numpy.max(numpy.abs(error)), 'PEAKREL': numpy.max(numpy.abs(relativeError)),
+                             'AIC': -2.0 * ll / 11.0 + 4.0 / 11.0, 'BIC': -2.0 * ll / 11.0 + 2.0 * numpy.log(11.0) / 11.0}[fittingTarget]
+            self.assertEqual(model.CalculateAllDataFittingTarget(coeffs), valueShouldBe)
+
+
+    def test_AllDataFittingTargetIsCompiledAgain(self):
+        model = pyeq2.Models_2D.Polynomial.Linear('SSQABS')
+        pyeq2.dataConvertorService().ConvertAndSortColumnarASCII(DataForUnitTests.asciiDataInColumns_2D_small, model, False)
+        model.dataCache.FindOrCreateAllDataCache(model)
+        fittingTarget = model.GetAllDataFittingTarget()
+        self.assertTrue(model.GetAllDataFittingTarget() is fittingTarget)
+        ssq = model.CalculateAllDataFittingTarget(numpy.array([-7.9, 1.5]))
+
+        model.fixedCoefficients = [None, 1.0] # the fixed coefficient is set in place
+        coeffs = numpy.array([-7.9, 1.5])
+        self.assertNotEqual(model.CalculateAllDataFittingTarget(coeffs), ssq)
+        self.assertEqual(coeffs[1], 1.0)
+        self.assertFalse(model.GetAllDataFittingTarget() is fittingTarget)
+
+        model.fixedCoefficients = []
+        model.fittingTarget = 'ABSABS'
+        error = model.CalculateModelPredictions(numpy.array([-7.9, 1.5]), model.dataCache.allDataCacheDictionary) - model.dataCache.allDataCacheDictionary['DependentData']
+        self.assertEqual(model.CalculateAllDataFittingTarget(numpy.array([-7.9, 1.5])), numpy.sum(numpy.abs(error)))
+
+
+    def test_ReducedDataFittingTargets_2D(self):
+        # the same values as the all data fitting targets of the reduced data, weights included
+        coeffs = numpy.array([-7.9, 1.5])
+        rawData = numpy.column_stack((numpy.linspace(5.0, 10.0, 40), numpy.linspace(0.4, 7.1, 40) ** 1.1, numpy.linspace(0.5, 1.5, 40)))
+        for fittingTarget in pyeq2.IModel.IModel.fittingTargetDictionary.keys():
+            model = pyeq2.Models_2D.Polynomial.Linear(fittingTarget)
+            pyeq2.dataConvertorService().ConvertNumpyArrays(rawData, model, True)
+            model.dataCache.FindOrCreateAllDataCache(model)
+            model.dataCache.FindOrCreateReducedDataCache(model)
+            reducedData = model.dataCache.reducedDataCacheDictionary
+            self.assertTrue(len(reducedData['DependentData']) < 40)
+
+            reducedModel = pyeq2.Models_2D.Polynomial.Linear(fittingTarget)
+            pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((reducedData['IndependentData'][0], reducedData['DependentData'], reducedData['Weights'])), reducedModel, True)
+            reducedModel.dataCache.FindOrCreateAllDataCache(reducedModel)
+            valueShouldBe = reducedModel.CalculateAllDataFittingTarget(coeffs.copy())
+            if fittingTarget == 'ODR': # calculated in closed form instead of by scipy.odr
+                self.assertAlmostEqual(model.CalculateReducedDataFittingTarget(coeffs.copy()) / valueShouldBe, 1.0, places = 12)
+            else:
+                self.assertEqual(model.CalculateReducedDataFittingTarget(coeffs.copy()), valueShouldBe)
+
+
+    def test_ReducedDataFittingTargetBatch_2D(self):
+        population = numpy.array([[-7.9, 1.5], [-8.0, 1.4], [1.0E200, 1.0E200], [0.0, 0.0]])
+        rawData = numpy.column_stack((numpy.linspace(5.0, 10.0, 40), numpy.linspace(0.4, 7.1, 40) ** 1.1, numpy.linspace(0.5, 1.5, 40)))
+        for fittingTarget in pyeq2.IModel.IModel.fittingTargetDictionary.keys():
+            model = pyeq2.Models_2D.Polynomial.Linear(fittingTarget)
+            pyeq2.dataConvertorService().ConvertNumpyArrays(rawData, model, True)
+            model.dataCache.FindOrCreateReducedDataCache(model)
+            self.assertTrue(model.CanCalculateModelPredictionsInBatches())
+            valuesShouldBe = [model.CalculateReducedDataFittingTarget(coeffs.copy()) for coeffs in population]
+            self.assertTrue(numpy.allclose(model.CalculateReducedDataFittingTargetBatch(population.copy()), valuesShouldBe, rtol = 1.0E-12, atol = 0.0))
+
+
+
+    def test_SolveKeepsTheCallersEstimatedCoefficients_2D(self):
+        xData = numpy.linspace(0.1, 6.0, 30)
+        otherModel = pyeq2.Models_2D.Exponential.DoubleExponential('SSQABS')
+        pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((xData, 50.0 * numpy.exp(-2.0 * xData) + 5.0 * numpy.exp(-0.1 * xData))), otherModel, False)
+        coefficientsShouldBe = otherModel.Solve()
+
+        # solved first with other data, the estimate for those data is not kept
+        model = pyeq2.Models_2D.Exponential.DoubleExponential('SSQABS')
+        pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((xData, 700.0 * numpy.exp(-0.9 * xData) + 60.0 * numpy.exp(-0.4 * xData))), model, False)
+        model.Solve()
+        self.assertEqual(model.estimatedCoefficients, [])
+        pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((xData, 50.0 * numpy.exp(-2.0 * xData) + 5.0 * numpy.exp(-0.1 * xData))), model, False)
+        self.assertTrue(numpy.equal(model.Solve(), coefficientsShouldBe).all())
+
+        # estimates given by the caller are kept
+        model.estimatedCoefficients = [40.0, -1.0, 4.0, -0.2]
+        model.Solve()
+        self.assertEqual(model.estimatedCoefficients, [40.0, -1.0, 4.0, -0.2])
+
         
 if __name__ == '__main__':
     unittest.main()
@@ -52,6 +52,18 @@ class TestSolverService(unittest.TestCase):
         self.assertTrue(numpy.allclose(coefficients, coefficientsShouldBe, rtol=1.0E-06, atol=1.0E-300))
 
 
+    def test_SolveUsingLevenbergMarquardt_AnalyticJacobian_2D(self):
+        model = pyeq2.Models_2D.Exponential.Exponential('SSQABS', 'Offset')
+        self.assertTrue(model.HasAnalyticJacobian())
+        pyeq2.dataConvertorService().ConvertAndSortColumnarASCII(DataForUnitTests.asciiDataInColumns_2D, model, False)
+        model.estimatedCoefficients = numpy.array([1.0, 0.1, -1.0])
+        coefficients = pyeq2.solverService().SolveUsingLevenbergMarquardt(model)
+
+        model._hasAnalyticJacobian = False # the same fit with finite differences
+        coefficientsShouldBe = pyeq2.solverService().SolveUsingLevenbergMarquardt(model)
+        self.assertTrue(numpy.allclose(model.CalculateAllDataFittingTarget(coefficients), model.CalculateAllDataFittingTarget(coefficientsShouldBe), rtol=1.0E-06, atol=1.0E-300))
+
+
     def test_SolveUsingSimplex_3D(self):
         coefficientsShouldBe = numpy.array([0.28658383, -0.90215775, 1.15483864])
         model = pyeq2.Models_3D.Polynomial.Linear('SSQABS')
@@ -95,6 +107,31 @@ class TestSolverService(unittest.TestCase):
         self.assertTrue(numpy.allclose(coefficients, coefficientsShouldBe, rtol=1.0E-06, atol=1.0E-300))
         
         
+    def test_CalculateReducedDataFittingTargetBatch_2D(self):
+        model = pyeq2.Models_2D.Exponential.DoubleExponential('SSQABS', 'Offset')
+        pyeq2.dataConvertorService().ConvertAndSortColumnarASCII(DataForUnitTests.asciiDataInColumns_2D, model, False)
+        model.dataCache.FindOrCreateReducedDataCache(model)
+        self.assertTrue(model.CanCalculateModelPredictionsInBatches())
+        population = numpy.array([[1.0, 0.1, 2.0, -0.1, 3.0], [-4.0, 0.01, 8.0, 0.02, -1.0], [1.0, 1000.0, 1.0, 1.0, 1.0]]) # the last one overflows
+        valuesShouldBe = numpy.array([model.CalculateReducedDataFittingTarget(coeffs) for coeffs in population.copy()])
+        self.assertEqual(valuesShouldBe[2], 1.0E300)
+        self.assertTrue(numpy.allclose(model.CalculateReducedDataFittingTargetBatch(population), valuesShouldBe, rtol=1.0E-12, atol=1.0E-300))
+
+
+    def test_DiffEvolverBatchTrials(self):
+        # with a batch_func a generation's trials are the ones get_trial() builds for an unchanged population
+        population = numpy.random.RandomState(1).rand(30, 4)
+        function = lambda v: numpy.sum(numpy.square(v))
+        batchFunction = lambda p: numpy.sum(numpy.square(p), axis=1)
+        for strategy in [('best', 1, 'bin'), ('best', 2, 'bin'), ('rand', 1, 'bin'), ('rand', 2, 'bin'), ('rand-to-best', 1, 'bin')]:
+            serial = pyeq2.Services.SolverService.diffev.DiffEvolver(function, population, scale = 0.9, strategy = strategy, prng = pyeq2.Services.SolverService.custom_prng_for_diffev())
+            numpy.random.seed(7)
+            trialsShouldBe = numpy.array([serial.get_trial(candidate) for candidate in range(len(population))])
+            batch = pyeq2.Services.SolverService.diffev.DiffEvolver(function, population, scale = 0.9, strategy = strategy, prng = pyeq2.Services.SolverService.custom_prng_for_diffev(), batch_func = batchFunction)
+            numpy.random.seed(7)
+            self.assertTrue(numpy.array_equal(batch.get_trials(), trialsShouldBe))
+        
+        
     def test_SolveUsingSpline_3D(self):
         xKnotPointsShouldBe = numpy.array([0.607, 0.607, 0.607, 3.017, 3.017, 3.017])
         yKnotPointsShouldBe = numpy.array([1.984, 1.984, 1.984, 3.153, 3.153, 3.153])
@@ -149,6 +186,67 @@ class TestSolverService(unittest.TestCase):
         self.assertTrue(numpy.allclose(coefficients, coefficientsShouldBe, rtol=1.0E-10, atol=1.0E-300))
 
 
+    def test_SolveUsingVariableProjection_2D(self):
+        xData = numpy.linspace(0.0, 40.0, 41)
+        yData = 3.0 * numpy.exp(-0.5 * xData) + 1.0 * numpy.exp(-0.05 * xData)
+        model = pyeq2.Models_2D.Exponential.DoubleExponential('SSQABS')
+        pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((xData, yData)), model, False)
+        coefficients = pyeq2.solverService().SolveUsingVariableProjection(model)
+        # the two terms can come back in either order
+        terms = sorted([(coefficients[1], coefficients[0]), (coefficients[3], coefficients[2])])
+        self.assertTrue(numpy.allclose(terms, [(-0.5, 3.0), (-0.05, 1.0)], rtol=1.0E-06, atol=1.0E-300))
+
+
+    def test_SolveUsingVariableProjection_RadnetFilter218Alpha_2D(self):
+        # alpha activity of radnet filter 218.  The matrix pencil estimate leaves little of the variance unexplained, but
+        # Levenberg-Marquardt from there alone ends on two nearly equal rates with amplitudes of about +-1E7 cancelling
+        # each other, SSQ 3328.94.  DE and Levenberg-Marquardt from its result find SSQ 963.66
+        xData = numpy.array([0.135, 0.3775, 0.7844444444444445, 1.2733333333333334, 2.283611111111112, 3.2622222222222224, 4.238055555555553, 5.868055555555555])
+        yData = numpy.array([725.35, 635.7, 396.09, 251.02, 70.09, 26.08, 24.45, 21.19])
+        model = pyeq2.Models_2D.Exponential.DoubleExponential('SSQABS')
+        pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((xData, yData)), model, False)
+        coefficients = model.Solve()
+        self.assertTrue(model.CalculateAllDataFittingTarget(coefficients) <= 963.67)
+
+        # the degenerate solution is rejected
+        self.assertEqual(pyeq2.solverService().ProjectLinearCoefficients(model, [-0.757445, -0.757433], model.dataCache.allDataCacheDictionary, []), (None, None))
+
+
+    def test_SolveUsingVariableProjection_Offset_2D(self):
+        xData = numpy.linspace(0.0, 40.0, 41)
+        yData = 3.0 * numpy.exp(-0.2 * xData) + 0.5
+        model = pyeq2.Models_2D.Exponential.Exponential('SSQABS', 'Offset')
+        self.assertEqual(model.GetLinearCoefficientIndices(), [0, 2])
+        pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((xData, yData)), model, False)
+        coefficients = pyeq2.solverService().SolveUsingVariableProjection(model)
+        self.assertTrue(numpy.allclose(coefficients, [3.0, -0.2, 0.5], rtol=1.0E-06, atol=1.0E-300))
+
+
+    def test_EstimateCoefficientsUsingMatrixPencil_2D(self):
+        xData = numpy.array([0.0, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 10.0, 15.0, 20.0, 30.0, 40.0])
+        yData = 3.0 * numpy.exp(-0.5 * xData) + 1.0 * numpy.exp(-0.05 * xData)
+        model = pyeq2.Models_2D.Exponential.DoubleExponential('SSQABS')
+        pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((xData, yData)), model, False)
+        coefficients = pyeq2.solverService().EstimateCoefficientsUsingMatrixPencil(model)
+        # the data are not evenly spaced, so this is an estimate only
+        self.assertTrue(numpy.allclose(coefficients, [3.0, -0.5, 1.0, -0.05], rtol=1.0E-01, atol=1.0E-300))
+
+
+    def test_EstimateCoefficientsUsingMatrixPencil_Offset_2D(self):
+        xData = numpy.linspace(0.0, 40.0, 41)
+        yData = 3.0 * numpy.exp(-0.2 * xData) + 0.5
+        model = pyeq2.Models_2D.Exponential.Exponential('SSQABS', 'Offset')
+        pyeq2.dataConvertorService().ConvertNumpyArrays(numpy.column_stack((xData, yData)), model, False)
+        coefficients = pyeq2.solverService().EstimateCoefficientsUsingMatrixPencil(model)
+        self.assertTrue(numpy.allclose(coefficients, [3.0, -0.2, 0.5], rtol=1.0E-06, atol=1.0E-300))
+
+
+    def test_EstimateCoefficientsUsingMatrixPencil_NoRates(self):
+        model = pyeq2.Models_2D.Polynomial.Linear('SSQABS')
+        pyeq2.dataConvertorService().ConvertAndSortColumnarASCII(DataForUnitTests.asciiDataInColumns_2D, model, False)
+        self.assertEqual(pyeq2.solverService().EstimateCoefficientsUsingMatrixPencil(model), [])
+
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -13,6 +13,7 @@
 import DataCache
 import Services
 import ExtendedVersionHandlers
+import FittingTargets
 import IModel
 import Models_2D
 import Models_3D
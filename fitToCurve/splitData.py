@@ -1,6 +1,7 @@
 # This python program takes data from the full *Activity files generated by the calculate.c program and calculates the coefficients for a double exponential function using that data. It will print the numbers to screen as well as appending the data to two files: alphaCoefficients and betaCoefficients.
 
 import os, sys, inspect
+import numpy
 
 # ensure pyeq2 can be imported
 if os.path.join(sys.path[0][:sys.path[0].rfind(os.sep)], '../..') not in sys.path:
@@ -10,27 +11,13 @@ import pyeq2
 def fitToCurve(fileName):
 	equation = pyeq2.Models_2D.Exponential.DoubleExponential()
 
-# What this section does is reads the data from the file given from the initial argument and formats it so the zunzun.com code can read it. We need two separate Strings so we can have two equations found.
-	alpha = 'X\tY\n'
-	beta = 'X\tY\n'
-	f = open(fileName,'r')
-	while f:
-		line = f.readline()
-		if len(line) != 0:
-			if line[0] != '#':
-# Instead of doing character by character as in the C code of calculate.c, this next line simply splits the numbers according to a delimiter and assigns the data* variables those numbers.
-				data1,data2,data3,data4 = line.split(',')
-# Append the data to the alpha and beta variables (will be used for the y values later)
-				alpha = alpha + data1 + "\t" + data2 + "\n"
-				beta = beta + data3 + "\t" + data4 + "\n"
-		else:
-			break
+# What this section does is reads the data from the file given from the initial argument into an array with the columns time, alpha, time, beta (comment lines are skipped). We need two separate column pairs so we can have two equations found.
+	data = numpy.loadtxt(fileName, delimiter = ',', comments = '#', ndmin = 2)
 
 
 #fit plot to alpha data 
 #This is where the magic happens for fitting the data. As you can see, it uses many calls from the zunzun code while printing and storing the data. I mostly reused an example code from the zunzun source to do this part.
-	data = alpha
-	pyeq2.dataConvertorService().ConvertAndSortColumnarASCII(data, equation, False)
+	pyeq2.dataConvertorService().ConvertNumpyArrays(data[:, [0, 1]], equation, False)
 	equation.Solve()
     
 	print("This is for alpha data:\n")
@@ -50,8 +37,7 @@ def fitToCurve(fileName):
 	alphaFile.write('\n')
 
 #fit plot to beta data
-	data = beta
-	pyeq2.dataConvertorService().ConvertAndSortColumnarASCII(data, equation, False)
+	pyeq2.dataConvertorService().ConvertNumpyArrays(data[:, [2, 3]], equation, False)
 	equation.Solve()
     
 	print("\nThis is for beta data:\n")
@@ -69,7 +55,6 @@ def fitToCurve(fileName):
 
 	alphaFile.close()
 	betaFile.close()
-	f.close()
 
 if __name__ == "__main__":
 	fitToCurve(sys.argv[1])
@@ -0,0 +1,26 @@
+"""
+Vectorized activity calculation. Works on whole columns of readings at once, for one filter or for
+many filters stacked together, so the whole archive can be recalculated without a Python loop per row.
+"""
+import numpy
+
+
+def computeActivity(time, det1, det2, cfc, timeStart, alphaCal, betaCal):
+	"""
+	Returns the (DeltaT, AlphaAct, BetaAct) arrays for the readings.
+	time, det1, det2 and cfc are the reading columns (time in decimal hours). timeStart, alphaCal and
+	betaCal are the filter's t_stop and calibration numbers, either scalars for a single filter or
+	arrays with one value per reading when several filters are stacked.
+	det1 is the alpha reading, det2 is beta+alpha and cfc the clean filter count.
+	"""
+	time = numpy.asarray(time, dtype = float)
+	det1 = numpy.asarray(det1)
+	timeStart = numpy.asarray(timeStart, dtype = float)
+
+	netBeta = numpy.asarray(det2) - numpy.asarray(cfc) - det1
+	alphaAct = det1 * numpy.asarray(alphaCal, dtype = float)
+	betaAct = netBeta * numpy.asarray(betaCal, dtype = float)
+
+	#readings taken on the day after the stop time (eg. if timeStart is 23:00:00 and the reading is 00:25:00)
+	deltaT = numpy.where(time < timeStart, time + 24.0, time) - timeStart
+	return deltaT, alphaAct, betaAct
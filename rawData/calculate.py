@@ -1,21 +1,80 @@
-"""This module allows the user to convert a file to a SQLite3 database (../sql/radnet.db) It will also calculate the activity from the alpha/beta calibration numbers as well as insert that data into the database"""
+"""This module allows the user to convert a file to a SQLite3 database (../sql/radnet.db unless radnetDB is pointed elsewhere, see radnetDB.databasePath()) It will also calculate the activity from the alpha/beta calibration numbers as well as insert that data into the database"""
 import sys
-import sqlite3
+import os
 import datetime
 
+from radnetParser import timeToHours, readRecords, groupFilters, ALPHACALIBRATION, BETACALIBRATION
+from activity import computeActivity
 
-def timeToHours(timeString):
-	"""This function converts a string with the format HHMMSS to a decimal hour representation. This makes it easier to find the time difference in hours between two times"""
-	time = float(timeString[0:2]) + float(timeString[2:4])/60.0 + float(timeString[4:6])/3600
-	return time
+# radnetDB lives next to the schema in ../sql
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'sql'))
+import radnetDB
 
 
-# set calibration numbers if not in the data table
-ALPHACALIBRATION = 1.63
-BETACALIBRATION = 1.15
+class IDCache(object):
+	"""
+	Keeps the AlphaEfficiency/BetaEfficiency coefficient -> ID and Filter FilterNum -> FilterID
+	lookups in memory. The tables are read once, after that only new values go to the database.
+	Call clear() if a transaction that added rows was rolled back.
+	"""
+
+	def __init__(self):
+		self.loaded = False
+
+	def load(self, cur):
+		if self.loaded:
+			return
+		cur.execute("""SELECT Coefficient, AlphaCoeffID FROM AlphaEfficiency""")
+		self.alphaIDs = dict(cur.fetchall())
+		cur.execute("""SELECT Coefficient, BetaCoeffID FROM BetaEfficiency""")
+		self.betaIDs = dict(cur.fetchall())
+		cur.execute("""SELECT FilterNum, FilterID FROM Filter""")
+		self.filterIDs = dict((str(filterNum), filterID) for filterNum, filterID in cur.fetchall())
+		self.loaded = True
+
+	def clear(self):
+		self.loaded = False
+
+	def alphaID(self, cur, coefficient):
+		"""Returns the AlphaCoeffID for coefficient, adding it to AlphaEfficiency if it is new"""
+		self.load(cur)
+		if coefficient not in self.alphaIDs:
+			cur.execute("""INSERT INTO AlphaEfficiency (Coefficient) VALUES (?)""", (coefficient,))
+			self.alphaIDs[coefficient] = cur.lastrowid
+		return self.alphaIDs[coefficient]
+
+	def betaID(self, cur, coefficient):
+		"""Returns the BetaCoeffID for coefficient, adding it to BetaEfficiency if it is new"""
+		self.load(cur)
+		if coefficient not in self.betaIDs:
+			cur.execute("""INSERT INTO BetaEfficiency (Coefficient) VALUES (?)""", (coefficient,))
+			self.betaIDs[coefficient] = cur.lastrowid
+		return self.betaIDs[coefficient]
+
+	def filterID(self, cur, filterNum):
+		"""Returns the FilterID for filterNum or None if the filter isn't in the database"""
+		self.load(cur)
+		return self.filterIDs.get(str(filterNum))
+
+	def addFilter(self, cur, filterRow):
+		"""Inserts a (FilterNum, StartDate, EndDate, SampleTime, SampleVolume, TimeStart, AlphaCoeffID, BetaCoeffID) row and returns its FilterID"""
+		self.load(cur)
+		cur.execute("""INSERT INTO Filter (FilterNum, StartDate, EndDate, SampleTime, SampleVolume,TimeStart,AlphaCoeffID,BetaCoeffID) VALUES (?,?,?,?,?,?,?,?)""", filterRow)
+		self.filterIDs[str(filterRow[0])] = cur.lastrowid
+		return cur.lastrowid
+
+
+idCaches = {}
+
+def getIDCache(database = None):
+	"""Returns the process wide IDCache for a database file"""
+	database = radnetDB.databasePath(database)
+	if database not in idCaches:
+		idCaches[database] = IDCache()
+	return idCaches[database]
 
 
-def calculate(filename):
+def calculate(filename, database = None):
 	"""
 	This method calculates the rest of the columns for the radnet data (format for the first few lines):
 	#Filter
@@ -25,134 +84,206 @@ def calculate(filename):
 	# sample volumen
 	"""
 	#open connection to database file
-	conn = sqlite3.connect("../sql/radnet.db")
+	conn = radnetDB.getConnection(database)
 	cur = conn.cursor()
-	with open(filename,'r') as f:
-		#get initial values
-		filterNum = f.readline().rstrip()
-		startDate = f.readline().rstrip()
-		endDate = f.readline().rstrip()
-		sampleTime = f.readline().rstrip()
-		sampleVol = f.readline().rstrip()
-		
-		for line in f:
-			#check if no line if len(line) != 0:
-				#check for comment lines
-				if line[0] != '#':
-					#Check if it's the initial value for time and set it
-					#this part is for the legacy typed data which didn't have the calibration numbers in the data textfile
-					if ',' not in line:
-						timeStart = timeToHours(line)
-						alphaCal = ALPHACALIBRATION
-						betaCal = BETACALIBRATION
-					elif len(line.split(',')) == 3:
-						timeStart,alphaCal,betaCal = line.rstrip().split(',')
-						timeStart = timeToHours(timeStart)
-						alphaCal = float(alphaCal)
-						betaCal = float(betaCal)
-
-
-					if ',' not in line or len(line.split(',')) == 3:
-						#check database to see if alphaCal is in already
-						cur.execute("""SELECT * FROM AlphaEfficiency WHERE coefficient = ?""", (alphaCal,))
-						check = cur.fetchall()
-						if check == []:
-							cur.execute("""INSERT INTO AlphaEfficiency (Coefficient) VALUES (?)""", (alphaCal,))
-							conn.commit()
-
-						#get alphaCalID
-						cur.execute("""SELECT AlphaCoeffID from AlphaEfficiency WHERE Coefficient = ?""", (alphaCal,))
-						check = cur.fetchone()
-						alphaCalID = check[0]
-
-						#check database to see if betaCal is in already
-						cur.execute("""SELECT * FROM BetaEfficiency WHERE coefficient = ?""", (betaCal,))
-						check = cur.fetchall()
-						if check == []:
-							cur.execute("""INSERT INTO BetaEfficiency (Coefficient) VALUES (?)""", (betaCal,))
-							conn.commit()
-
-						#get betaCalID
-						cur.execute("""SELECT BetaCoeffID from BetaEfficiency WHERE Coefficient = ?""",(betaCal,))
-						check = cur.fetchone()
-						betaCalID = check[0]
-
-
-						
-						#INSERT new filter row if no previous filter was there
-						cur.execute("""SELECT * FROM Filter WHERE filterNum = ?""", (filterNum,))
-						if cur.fetchall() == []:
-							for i in [(filterNum,startDate,endDate,sampleTime,sampleVol,timeStart,alphaCalID,betaCalID)]:
-								cur.execute("""INSERT INTO Filter (FilterNum, StartDate, EndDate, SampleTime, SampleVolume,TimeStart,AlphaCoeffID,BetaCoeffID) VALUES (?,?,?,?,?,?,?,?)""",i)
-							conn.commit()
-						else:
-							print "No filter entry was created for " + startDate + "-" + endDate
-
-						#get filterID
-						cur.execute("""SELECT FilterID FROM Filter WHERE filterNum = ?""", (filterNum,))
-						filterID = cur.fetchone()
-						filterID = filterID[0]
-
-						stuff = '# Date: ' + sys.argv[1] + '\n# t_stop = ' + str(timeStart) + '\n# Alpha Calibration: ' + str(alphaCal) + '\n# Beta Calibration: ' + str(betaCal) + '\n'
-						print stuff
-
-					else:
-						#Set the values for each line
-						#det2 is beta+Alpha reading
-						#det1 is alpha reading
-						#cfc is clean filter count
-						time,det2,cfc,det1 = line.rstrip().split(',')
-						time = timeToHours(time)
-						det2 = int(det2)
-						cfc = int(cfc)
-						det1 = int(det1)
-
-						#write this line into the database
-						for i in [(filterID, time)]:
-							cur.execute("""SELECT * FROM RawData WHERE FilterID = ? AND Time = ?""", i)
-						if cur.fetchall() == []:
-							for i in [(filterID, time, det1, det2, cfc)]:
-								cur.execute("""INSERT INTO RawData (FilterID, Time, AlphaReading, BetaReading, CleanFilterCount) VALUES (?,?,?,?,?)""", i)
-								conn.commit()
-
-						#get rawDataID
-						for i in [(filterID, time)]:
-							cur.execute("""SELECT RawDataID FROM RawData WHERE FilterID = ? AND Time = ?""", i)
-						rawDataID = cur.fetchone()
-						rawDataID = rawDataID[0]
-
-
-
-						#Calculate the other variables for each reading
-						netAB = det2 - cfc
-						netBeta = netAB - det1
-						alphaActivity = det1 * alphaCal
-						betaActivity = netBeta * betaCal
-
-						#This is incase the readings were taken on the next day after the initial stop time (eg. if timeStart is 23:00:00 and the reading is 00:25:00)
-						if time < timeStart:
-							time += 24.0
-
-						timeDiff = time - timeStart
-
-						#set the string for print to screen
-
-						#write to database
-						for i in [(filterID, rawDataID)]:
-							cur.execute("""SELECT * FROM Activity WHERE FilterID = ? AND RawDataID = ?""", i)
-						if cur.fetchall() == []:
-							for i in [(filterID, rawDataID, timeDiff, alphaActivity, betaActivity)]:
-								cur.execute("""INSERT INTO Activity(FilterID, RawDataID, DeltaT, AlphaAct, BetaAct) VALUES (?,?,?,?,?)""",i)
-								conn.commit()
-								printStuff = str(alphaActivity) + ' , ' + str(betaActivity) + ' , ' + str(timeDiff)
-								print printStuff
-						else:
-							print 'blrrrrrg'
-
-
-		print "File processed succesfully"
-		conn.close()
+	idCache = getIDCache(database)
+	for header, calibration, readings in groupFilters(readRecords(filename)):
+		if calibration is None:
+			print "No t_stop line found for filter " + str(header.filterNum)
+			continue
+		timeStart = calibration.timeStart
+		alphaCal = calibration.alphaCal
+		betaCal = calibration.betaCal
+
+		#get the calibration IDs, new coefficients are added to the database
+		alphaCalID = idCache.alphaID(cur, alphaCal)
+		betaCalID = idCache.betaID(cur, betaCal)
+
+		#INSERT new filter row if no previous filter was there
+		filterID = idCache.filterID(cur, header.filterNum)
+		if filterID is None:
+			filterID = idCache.addFilter(cur, (header.filterNum,header.startDate,header.endDate,header.sampleTime,header.sampleVolume,timeStart,alphaCalID,betaCalID))
+			conn.commit()
+		else:
+			print "No filter entry was created for " + str(header.startDate) + "-" + str(header.endDate)
+
+		stuff = '# Date: ' + sys.argv[1] + '\n# t_stop = ' + str(timeStart) + '\n# Alpha Calibration: ' + str(alphaCal) + '\n# Beta Calibration: ' + str(betaCal) + '\n'
+		print stuff
+
+		for reading in readings:
+			#det2 is beta+Alpha reading
+			#det1 is alpha reading
+			#cfc is clean filter count
+			time = reading.time
+			det1 = reading.det1
+			det2 = reading.det2
+			cfc = reading.cfc
+
+			#write this line into the database
+			for i in [(filterID, time)]:
+				cur.execute("""SELECT * FROM RawData WHERE FilterID = ? AND Time = ?""", i)
+			if cur.fetchall() == []:
+				for i in [(filterID, time, det1, det2, cfc)]:
+					cur.execute("""INSERT INTO RawData (FilterID, Time, AlphaReading, BetaReading, CleanFilterCount) VALUES (?,?,?,?,?)""", i)
+					conn.commit()
+
+			#get rawDataID
+			for i in [(filterID, time)]:
+				cur.execute("""SELECT RawDataID FROM RawData WHERE FilterID = ? AND Time = ?""", i)
+			rawDataID = cur.fetchone()
+			rawDataID = rawDataID[0]
+
+
+
+			#Calculate the other variables for each reading
+			netAB = det2 - cfc
+			netBeta = netAB - det1
+			alphaActivity = det1 * alphaCal
+			betaActivity = netBeta * betaCal
+
+			#This is incase the readings were taken on the next day after the initial stop time (eg. if timeStart is 23:00:00 and the reading is 00:25:00)
+			if time < timeStart:
+				time += 24.0
+
+			timeDiff = time - timeStart
+
+			#write to database
+			for i in [(filterID, rawDataID)]:
+				cur.execute("""SELECT * FROM Activity WHERE FilterID = ? AND RawDataID = ?""", i)
+			if cur.fetchall() == []:
+				for i in [(filterID, rawDataID, timeDiff, alphaActivity, betaActivity)]:
+					cur.execute("""INSERT INTO Activity(FilterID, RawDataID, DeltaT, AlphaAct, BetaAct) VALUES (?,?,?,?,?)""",i)
+					conn.commit()
+					printStuff = str(alphaActivity) + ' , ' + str(betaActivity) + ' , ' + str(timeDiff)
+					print printStuff
+			else:
+				print 'blrrrrrg'
+
+	conn.commit()
+	print "File processed succesfully"
+
+
+def parseFile(filename):
+	"""
+	Reads a whole datafile with radnetParser without touching the database. Returns a list with one tuple of
+	(filterNum, startDate, endDate, sampleTime, sampleVol, timeStart, alphaCal, betaCal, readings)
+	per filter in the file, readings is a list of (time, det1, det2, cfc) tuples with the time in decimal hours.
+	timeStart, alphaCal and betaCal are None for a filter without a t_stop line.
+	"""
+	parsed = []
+	for header, calibration, readings in groupFilters(readRecords(filename)):
+		if calibration is None:
+			parsed.append((header.filterNum, header.startDate, header.endDate, header.sampleTime, header.sampleVolume, None, None, None, []))
+		else:
+			parsed.append((header.filterNum, header.startDate, header.endDate, header.sampleTime, header.sampleVolume,
+				calibration.timeStart, calibration.alphaCal, calibration.betaCal, [(r.time, r.det1, r.det2, r.cfc) for r in readings]))
+	return parsed
+
+
+def listDataFiles(paths):
+	"""Expands the given files and directories into a sorted list of datafiles, skipping the shell scripts kept next to the data"""
+	files = []
+	for path in paths:
+		if os.path.isdir(path):
+			for name in sorted(os.listdir(path)):
+				fullName = os.path.join(path, name)
+				if os.path.isfile(fullName) and not name.endswith('.sh'):
+					files.append(fullName)
+		else:
+			files.append(path)
+	return files
+
+
+def writeParsed(conn, parsed, idCache):
+	"""
+	Writes the Filter, RawData and Activity rows for a list of parseFile() results in a single
+	transaction using executemany. Rows that are already in the database are left alone, so
+	rerunning over the same files is safe. Coefficient and filter IDs come from idCache.
+	Returns the number of rows written.
+	"""
+	try:
+		with conn:
+			return writeParsedRows(conn.cursor(), parsed, idCache)
+	except:
+		# IDs handed out inside the rolled back transaction are gone again
+		idCache.clear()
+		raise
+
+
+def writeParsedRows(cur, parsed, idCache):
+	"""Does the inserts for writeParsed() inside its transaction"""
+	rowsWritten = 0
+
+	#existing filters are skipped
+	filterIDs = {}
+	for p in parsed:
+		alphaCalID = idCache.alphaID(cur, p[6])
+		betaCalID = idCache.betaID(cur, p[7])
+		filterID = idCache.filterID(cur, p[0])
+		if filterID is None:
+			filterID = idCache.addFilter(cur, (p[0], p[1], p[2], p[3], p[4], p[5], alphaCalID, betaCalID))
+			rowsWritten += 1
+		filterIDs[p[0]] = filterID
+
+	rawRows = []
+	for p in parsed:
+		filterID = filterIDs[p[0]]
+		for time, det1, det2, cfc in p[8]:
+			rawRows.append((filterID, time, det1, det2, cfc, filterID, time))
+	cur.executemany("""INSERT INTO RawData (FilterID, Time, AlphaReading, BetaReading, CleanFilterCount) SELECT ?,?,?,?,? WHERE NOT EXISTS (SELECT 1 FROM RawData WHERE FilterID = ? AND Time = ?)""", rawRows)
+	rowsWritten += cur.rowcount
+
+	#all the readings of the batch go through computeActivity() in one call
+	readingFilterIDs = []
+	rawDataIDs = []
+	columns = []
+	for p in parsed:
+		filterID = filterIDs[p[0]]
+		cur.execute("""SELECT Time, RawDataID FROM RawData WHERE FilterID = ?""", (filterID,))
+		filterRawDataIDs = dict(cur.fetchall())
+		for time, det1, det2, cfc in p[8]:
+			readingFilterIDs.append(filterID)
+			rawDataIDs.append(filterRawDataIDs[time])
+			columns.append((time, det1, det2, cfc, p[5], p[6], p[7]))
+	activityRows = []
+	if columns:
+		time, det1, det2, cfc, timeStart, alphaCal, betaCal = zip(*columns)
+		deltaT, alphaAct, betaAct = computeActivity(time, det1, det2, cfc, timeStart, alphaCal, betaCal)
+		activityRows = zip(readingFilterIDs, rawDataIDs, deltaT.tolist(), alphaAct.tolist(), betaAct.tolist(), readingFilterIDs, rawDataIDs)
+	cur.executemany("""INSERT INTO Activity(FilterID, RawDataID, DeltaT, AlphaAct, BetaAct) SELECT ?,?,?,?,? WHERE NOT EXISTS (SELECT 1 FROM Activity WHERE FilterID = ? AND RawDataID = ?)""", activityRows)
+	rowsWritten += cur.rowcount
+	return rowsWritten
+
+
+def printThroughput(filters, readings, rowsWritten, elapsed):
+	"""Prints the ingest throughput so it can be tracked as the archive grows"""
+	print "Processed %d filters (%d readings), wrote %d rows in %.3f s" % (filters, readings, rowsWritten, elapsed)
+	if elapsed > 0:
+		print "Throughput: %.0f readings/s, %.0f rows written/s" % (readings / elapsed, rowsWritten / elapsed)
+
+
+def bulkCalculate(paths, database = None):
+	"""
+	Bulk ingest mode. Parses every datafile in paths (files or directories) first and then writes
+	all of them in one transaction with writeParsed(). Returns the number of rows written.
+	"""
+	begin = datetime.datetime.now()
+	parsed = []
+	for filename in listDataFiles(paths):
+		for p in parseFile(filename):
+			if p[5] is None:
+				print "No t_stop line found for filter " + str(p[0]) + " in " + filename + ", skipping it"
+			else:
+				parsed.append(p)
+
+	rowsWritten = writeParsed(radnetDB.getConnection(database), parsed, getIDCache(database))
+
+	printThroughput(len(parsed), sum(len(p[8]) for p in parsed), rowsWritten, (datetime.datetime.now() - begin).total_seconds())
+	return rowsWritten
 
 
 if __name__ == "__main__":
-	calculate(sys.argv[1])
+	if sys.argv[1] == '--bulk':
+		bulkCalculate(sys.argv[2:])
+	else:
+		calculate(sys.argv[1])
@@ -0,0 +1,73 @@
+"""
+Rebuilds the database from a directory of datafiles (replaces running calculate.py once per file).
+The files are parsed in a pool of worker processes and the parsed files are handed, in order,
+to this process which is the only one writing to the database. Writes are batched so each
+transaction covers many files, and the workers keep parsing while a batch is being written.
+
+	python ingestAll.py [-j processes] [-b batch size] [directory or file ...]
+
+With no paths completedData is ingested.
+"""
+import sys
+import datetime
+import multiprocessing
+
+from calculate import parseFile, listDataFiles, writeParsed, printThroughput, getIDCache
+import radnetDB
+
+
+def ingestAll(paths, database = None, processes = None, batchSize = 32):
+	"""Parses every datafile in paths with a process pool and writes them in batches of batchSize files. Returns the number of rows written"""
+	begin = datetime.datetime.now()
+	files = listDataFiles(paths)
+	if processes is None:
+		processes = multiprocessing.cpu_count()
+
+	pool = multiprocessing.Pool(processes)
+	conn = radnetDB.getConnection(database)
+	idCache = getIDCache(database)
+	rowsWritten = 0
+	readings = 0
+	ingested = 0
+	try:
+		batch = []
+		# imap keeps the results in file order, so IDs are handed out the same way on every rebuild
+		for i, parsedFile in enumerate(pool.imap(parseFile, files, max(1, len(files) / (4 * processes)))):
+			for p in parsedFile:
+				if p[5] is None:
+					print "No t_stop line found for filter " + str(p[0]) + " in " + files[i] + ", skipping it"
+				else:
+					batch.append(p)
+			if len(batch) >= batchSize:
+				rowsWritten += writeParsed(conn, batch, idCache)
+				readings += sum(len(b[8]) for b in batch)
+				ingested += len(batch)
+				batch = []
+		if batch:
+			rowsWritten += writeParsed(conn, batch, idCache)
+			readings += sum(len(b[8]) for b in batch)
+			ingested += len(batch)
+		pool.close()
+	except:
+		pool.terminate()
+		raise
+	finally:
+		pool.join()
+
+	printThroughput(ingested, readings, rowsWritten, (datetime.datetime.now() - begin).total_seconds())
+	return rowsWritten
+
+
+if __name__ == "__main__":
+	args = sys.argv[1:]
+	processes = None
+	batchSize = 32
+	while args and args[0] in ['-j', '-b']:
+		if args[0] == '-j':
+			processes = int(args[1])
+		else:
+			batchSize = int(args[1])
+		args = args[2:]
+	if not args:
+		args = ['completedData']
+	ingestAll(args, processes = processes, batchSize = batchSize)
@@ -0,0 +1,183 @@
+"""
+Streaming parser for the raw notebook datafiles (format in README). It only reads text, nothing is
+written to the database, so ingest, validation and fitting can all share it.
+
+readRecords() yields a FilterHeader, then a Calibration, then one Reading per line. Files with
+several filters concatenated one after the other are fine, every filter starts a new FilterHeader.
+Only the current line is held in memory, so any size of archive can be read.
+
+Besides the plain format this understands:
+	the legacy form where the t_stop line has no calibration numbers (ALPHACALIBRATION/BETACALIBRATION are used)
+	headers written as comments, e.g. '# Filter        267' (comment headers without a value are skipped)
+"""
+
+# set calibration numbers if not in the data table
+ALPHACALIBRATION = 1.63
+BETACALIBRATION = 1.15
+
+# the order of the header lines and their labels when written as comments
+HEADERLABELS = ['filter', 'start date', 'end date', 'sample time', 'sample volume']
+
+
+def timeToHours(timeString):
+	"""This function converts a string with the format HHMMSS to a decimal hour representation. This makes it easier to find the time difference in hours between two times"""
+	time = float(timeString[0:2]) + float(timeString[2:4])/60.0 + float(timeString[4:6])/3600
+	return time
+
+
+class FilterHeader(object):
+	"""The first five lines of a filter: filter number, start and end date (YYYYMMDD), sample time (hours) and sample volume (m^3)"""
+	__slots__ = ['filterNum', 'startDate', 'endDate', 'sampleTime', 'sampleVolume']
+
+	def __init__(self, filterNum, startDate, endDate, sampleTime, sampleVolume):
+		self.filterNum = filterNum
+		self.startDate = startDate
+		self.endDate = endDate
+		self.sampleTime = sampleTime
+		self.sampleVolume = sampleVolume
+
+	def __repr__(self):
+		return 'FilterHeader(%r, %r, %r, %r, %r)' % (self.filterNum, self.startDate, self.endDate, self.sampleTime, self.sampleVolume)
+
+
+class Calibration(object):
+	"""The t_stop line: stop time in decimal hours and the alpha/beta calibration numbers"""
+	__slots__ = ['timeStart', 'alphaCal', 'betaCal']
+
+	def __init__(self, timeStart, alphaCal, betaCal):
+		self.timeStart = timeStart
+		self.alphaCal = alphaCal
+		self.betaCal = betaCal
+
+	def __repr__(self):
+		return 'Calibration(%r, %r, %r)' % (self.timeStart, self.alphaCal, self.betaCal)
+
+
+class Reading(object):
+	"""One counter reading: time in decimal hours, DET1 (alpha), DET2 (beta + alpha) and the clean filter count"""
+	__slots__ = ['time', 'det1', 'det2', 'cfc']
+
+	def __init__(self, time, det1, det2, cfc):
+		self.time = time
+		self.det1 = det1
+		self.det2 = det2
+		self.cfc = cfc
+
+	def __repr__(self):
+		return 'Reading(%r, %r, %r, %r)' % (self.time, self.det1, self.det2, self.cfc)
+
+
+def headerValue(value, convert):
+	"""Header lines are sometimes left empty in the notebook, those become None"""
+	if value == '':
+		return None
+	return convert(value)
+
+
+def makeHeader(values):
+	return FilterHeader(int(values[0]), headerValue(values[1], str), headerValue(values[2], str), headerValue(values[3], float), headerValue(values[4], float))
+
+
+def commentHeaderValue(line):
+	"""Returns (index, value) for a commented header line like '# Sample Time   70.32', otherwise None"""
+	text = line.lstrip('#').strip()
+	for index in range(len(HEADERLABELS)):
+		rest = text[len(HEADERLABELS[index]):]
+		if text.lower().startswith(HEADERLABELS[index]) and (rest == '' or rest[0].isspace()):
+			if rest.strip() != '':
+				return (index, rest.strip())
+			return None
+	return None
+
+
+def parseRecords(lines):
+	"""Generator yielding FilterHeader, Calibration and Reading records for an iterable of lines (e.g. an open file)"""
+	header = []
+	inReadings = False
+	lineNumber = 0
+	for line in lines:
+		lineNumber += 1
+		line = line.strip()
+		if len(line) == 0:
+			# the header is positional, so an empty header line still counts
+			if 0 < len(header) < len(HEADERLABELS):
+				header.append('')
+				if len(header) == len(HEADERLABELS):
+					yield makeHeader(header)
+			continue
+
+		if line[0] == '#':
+			found = commentHeaderValue(line)
+			if found is None:
+				continue
+			index, value = found
+			if inReadings or index < len(header):
+				# a new filter in a concatenated archive
+				header = []
+				inReadings = False
+			if index != len(header):
+				raise ValueError('line %d: expected the %s header but found %s' % (lineNumber, HEADERLABELS[len(header)], HEADERLABELS[index]))
+			header.append(value)
+			if len(header) == len(HEADERLABELS):
+				yield makeHeader(header)
+			continue
+
+		values = line.split(',')
+		try:
+			if len(header) < len(HEADERLABELS) or (inReadings and len(values) == 1):
+				if inReadings:
+					# a new filter in a concatenated archive
+					header = []
+					inReadings = False
+				header.append(line)
+				if len(header) == len(HEADERLABELS):
+					yield makeHeader(header)
+			elif len(values) == 1:
+				inReadings = True
+				yield Calibration(timeToHours(values[0]), ALPHACALIBRATION, BETACALIBRATION)
+			elif len(values) == 3:
+				inReadings = True
+				yield Calibration(timeToHours(values[0]), float(values[1]), float(values[2]))
+			elif len(values) == 4 and inReadings:
+				time, det2, cfc, det1 = values
+				yield Reading(timeToHours(time), int(det1), int(det2), int(cfc))
+			else:
+				raise ValueError('unexpected line')
+		except ValueError, e:
+			raise ValueError('line %d: %s (%s)' % (lineNumber, line, e))
+
+
+def readRecords(filename):
+	"""Generator yielding the records of a datafile"""
+	with open(filename, 'r') as f:
+		for record in parseRecords(f):
+			yield record
+
+
+def groupFilters(records):
+	"""
+	Groups a record stream into (FilterHeader, Calibration, [Reading, ...]) tuples, one per calibration.
+	A filter without a t_stop line comes out as (FilterHeader, None, []).
+	Only the readings of the current filter are kept in memory.
+	"""
+	header = None
+	calibration = None
+	readings = []
+	for record in records:
+		if isinstance(record, Reading):
+			readings.append(record)
+			continue
+		if calibration is not None:
+			yield (header, calibration, readings)
+		elif header is not None and isinstance(record, FilterHeader):
+			yield (header, None, [])
+		readings = []
+		calibration = None
+		if isinstance(record, FilterHeader):
+			header = record
+		else:
+			calibration = record
+	if calibration is not None:
+		yield (header, calibration, readings)
+	elif header is not None:
+		yield (header, None, [])
@@ -0,0 +1,80 @@
+"""
+Recalculates the Activity table from RawData without re-reading the datafiles, e.g. after a calibration
+coefficient in AlphaEfficiency/BetaEfficiency or a filter's AlphaCoeffID/BetaCoeffID was corrected.
+The readings of all affected filters are read with one query, recalculated with computeActivity() and
+written back in a single transaction. Readings that have no Activity row yet get one.
+
+	python recalculate.py                        every filter
+	python recalculate.py -f [FilterID ...]      only these filters
+	python recalculate.py -a [AlphaCoeffID ...]  filters using these alpha coefficients
+	python recalculate.py -b [BetaCoeffID ...]   filters using these beta coefficients
+"""
+import sys
+import datetime
+
+import calculate # puts ../sql on sys.path
+import radnetDB
+from activity import computeActivity
+
+
+def recalculate(database = None, filterIDs = None, alphaCoeffIDs = None, betaCoeffIDs = None):
+	"""Recalculates Activity for the selected filters (all of them if nothing is selected). Returns the number of Activity rows written"""
+	begin = datetime.datetime.now()
+	conditions = []
+	parameters = []
+	for column, values in [('f.FilterID', filterIDs), ('f.AlphaCoeffID', alphaCoeffIDs), ('f.BetaCoeffID', betaCoeffIDs)]:
+		if values:
+			conditions.append(column + ' IN (' + ','.join('?' * len(values)) + ')')
+			parameters.extend(values)
+	query = """SELECT a.ActivityID, r.FilterID, r.RawDataID, r.Time, r.AlphaReading, r.BetaReading, r.CleanFilterCount, f.TimeStart, ae.Coefficient, be.Coefficient
+		FROM RawData r
+		JOIN Filter f ON f.FilterID = r.FilterID
+		JOIN AlphaEfficiency ae ON ae.AlphaCoeffID = f.AlphaCoeffID
+		JOIN BetaEfficiency be ON be.BetaCoeffID = f.BetaCoeffID
+		LEFT JOIN Activity a ON a.FilterID = r.FilterID AND a.RawDataID = r.RawDataID"""
+	if conditions:
+		query += ' WHERE ' + ' OR '.join(conditions)
+
+	conn = radnetDB.getConnection(database)
+	with conn:
+		cur = conn.cursor()
+		cur.execute(query, parameters)
+		rows = cur.fetchall()
+		if not rows:
+			print "No readings found for the selected filters"
+			return 0
+		activityIDs, filters, rawDataIDs, time, det1, det2, cfc, timeStart, alphaCal, betaCal = zip(*rows)
+		deltaT, alphaAct, betaAct = computeActivity(time, det1, det2, cfc, timeStart, alphaCal, betaCal)
+		deltaT = deltaT.tolist()
+		alphaAct = alphaAct.tolist()
+		betaAct = betaAct.tolist()
+
+		# DeltaT of existing rows is kept: it was calculated from the t_stop line of the file the reading came from,
+		# which is not always Filter.TimeStart (e.g. two datafiles that were typed in with the same filter number)
+		updates = []
+		inserts = []
+		for i in range(len(rows)):
+			if activityIDs[i] is None:
+				inserts.append((filters[i], rawDataIDs[i], deltaT[i], alphaAct[i], betaAct[i]))
+			else:
+				updates.append((alphaAct[i], betaAct[i], activityIDs[i]))
+		cur.executemany("""UPDATE Activity SET AlphaAct = ?, BetaAct = ? WHERE ActivityID = ?""", updates)
+		cur.executemany("""INSERT INTO Activity(FilterID, RawDataID, DeltaT, AlphaAct, BetaAct) VALUES (?,?,?,?,?)""", inserts)
+
+	elapsed = (datetime.datetime.now() - begin).total_seconds()
+	print "Recalculated %d readings of %d filters (%d updated, %d added) in %.3f s" % (len(rows), len(set(filters)), len(updates), len(inserts), elapsed)
+	return len(rows)
+
+
+if __name__ == "__main__":
+	selected = {'-f': [], '-a': [], '-b': []}
+	option = None
+	for arg in sys.argv[1:]:
+		if arg in selected:
+			option = arg
+		elif option is None:
+			print __doc__
+			sys.exit(1)
+		else:
+			selected[option].append(int(arg))
+	recalculate(filterIDs = selected['-f'], alphaCoeffIDs = selected['-a'], betaCoeffIDs = selected['-b'])
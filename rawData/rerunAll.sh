@@ -1,5 +1,3 @@
 #!/bin/bash
-for i in $(\ls -d completedData/*)
-do
-	python calculate.py $i
-done
+# parses completedData in parallel and writes it with a single database writer
+python ingestAll.py completedData
@@ -0,0 +1,60 @@
+"""
+Tests for exportColumns on a scratch database filled from completedData, radnet.db is never touched.
+
+	python Test_exportColumns.py
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+import radnetDB
+import exportColumns
+from Test_radnetDB import createDatabase, DATADIR
+
+
+class Test_exportColumns(unittest.TestCase):
+
+	def setUp(self):
+		import calculate
+		self.directory = tempfile.mkdtemp()
+		self.database = os.path.join(self.directory, 'radnet.db')
+		createDatabase(self.database)
+		conn = radnetDB.connect(self.database)
+		calculate.writeParsed(conn, [p for f in calculate.listDataFiles([DATADIR])[:20] for p in calculate.parseFile(f) if p[5] is not None], calculate.IDCache())
+		conn.execute("""INSERT INTO AlphaCurve (FilterID, Alpha1, Alpha1Lambda, Alpha2, Alpha2Lambda) VALUES (5, 1.0, -0.5, NULL, 0.25)""")
+		conn.commit()
+		self.conn = conn
+		self.columns = os.path.join(self.directory, 'columns')
+		exportColumns.exportColumns(self.columns, self.database)
+
+	def tearDown(self):
+		self.conn.close()
+		shutil.rmtree(self.directory)
+
+	def test_FilterRowsMatchDatabase(self):
+		archive = exportColumns.ColumnArchive(self.columns)
+		for filterID in [row[0] for row in self.conn.execute("""SELECT FilterID FROM Filter""")]:
+			rows = archive.filterRows('Activity', filterID, ['ActivityID', 'RawDataID', 'DeltaT', 'AlphaAct', 'BetaAct'])
+			expected = self.conn.execute("""SELECT ActivityID, RawDataID, DeltaT, AlphaAct, BetaAct FROM Activity WHERE FilterID = ? ORDER BY ActivityID""", (filterID,)).fetchall()
+			self.assertEqual(zip(*[rows[c].tolist() for c in ['ActivityID', 'RawDataID', 'DeltaT', 'AlphaAct', 'BetaAct']]), expected)
+			self.assertEqual(archive.filterRows('RawData', filterID)['Time'].tolist(), [row[0] for row in self.conn.execute("""SELECT Time FROM RawData WHERE FilterID = ? ORDER BY RawDataID""", (filterID,))])
+
+	def test_ColumnsAreMemoryMapped(self):
+		archive = exportColumns.ColumnArchive(self.columns)
+		self.assertTrue(isinstance(archive.column('Activity', 'DeltaT'), numpy.memmap))
+		self.assertTrue(isinstance(archive.filterRows('Activity', 1)['DeltaT'], numpy.memmap))
+		self.assertEqual(archive.column('Activity', 'FilterID').dtype, numpy.int64)
+
+	def test_MissingFilterAndNull(self):
+		archive = exportColumns.ColumnArchive(self.columns)
+		self.assertEqual(len(archive.filterRows('Activity', 100000)['DeltaT']), 0)
+		self.assertEqual(archive.filterIDs('AlphaCurve').tolist(), [5])
+		self.assertTrue(numpy.isnan(archive.filterRows('AlphaCurve', 5)['Alpha2'][0]))
+		self.assertEqual(len(archive.column('BetaCurve', 'Beta1')), 0)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,163 @@
+"""
+Tests for the radnetDB connection profile. They run on a scratch copy of the schema, radnet.db is never touched.
+
+	python Test_radnetDB.py
+"""
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import multiprocessing
+
+import radnetDB
+import migrate
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, '..', 'rawData'))
+sys.path.append(os.path.join(HERE, '..', 'fitToCurve'))
+
+DATADIR = os.path.join(HERE, '..', 'rawData', 'completedData')
+
+
+def createDatabase(database):
+	"""Creates an empty, fully migrated database like clearDatabase.sh does"""
+	conn = sqlite3.connect(database)
+	with open(os.path.join(HERE, 'intial.sql'), 'r') as f:
+		conn.executescript(f.read())
+	conn.execute("""PRAGMA foreign_keys = OFF""")
+	migrate.migrate(conn)
+	conn.close()
+
+
+def quiet():
+	"""Sends a child process' prints to /dev/null"""
+	sys.stdout = open(os.devnull, 'w')
+
+
+def ingestFiles(database, files, start, refitDone):
+	"""Writes every file in its own transaction, going over the files again until the refit is finished"""
+	quiet()
+	import calculate
+	start.wait()
+	passes = 0
+	while passes == 0 or not refitDone.is_set():
+		conn = radnetDB.connect(database)
+		idCache = calculate.IDCache()
+		for filename in files:
+			calculate.writeParsed(conn, [p for p in calculate.parseFile(filename) if p[5] is not None], idCache)
+		conn.close()
+		passes += 1
+
+
+def refitFilters(database, filterIDs, start, refitDone):
+	"""Fits the alpha and beta curves of the filters while the ingest is running"""
+	quiet()
+	import fitToCurve
+	start.wait()
+	try:
+		for filterID in filterIDs:
+			fitToCurve.fitToCurve(filterID, database)
+	finally:
+		refitDone.set()
+
+
+class Test_radnetDB(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.database = os.path.join(self.directory, 'radnet.db')
+		createDatabase(self.database)
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def test_PragmaProfile(self):
+		conn = radnetDB.connect(self.database)
+		self.assertEqual(conn.execute("""PRAGMA journal_mode""").fetchone()[0], 'wal')
+		self.assertEqual(conn.execute("""PRAGMA synchronous""").fetchone()[0], 1) # NORMAL
+		self.assertEqual(conn.execute("""PRAGMA cache_size""").fetchone()[0], -16000)
+		self.assertEqual(conn.execute("""PRAGMA busy_timeout""").fetchone()[0], int(radnetDB.BUSYTIMEOUT * 1000))
+		self.assertEqual(conn.execute("""PRAGMA foreign_keys""").fetchone()[0], 0)
+		conn.close()
+
+	def test_ReaderDoesNotBlockWriter(self):
+		reader = radnetDB.connect(self.database)
+		reader.isolation_level = None
+		reader.execute("""BEGIN""")
+		self.assertEqual(reader.execute("""SELECT COUNT(*) FROM Filter""").fetchone()[0], 0)
+
+		# without WAL this commit has to wait for the reader's transaction to end
+		writer = radnetDB.connect(self.database)
+		writer.execute("""PRAGMA busy_timeout = 0""")
+		with writer:
+			writer.execute("""INSERT INTO Filter (FilterNum) VALUES (1)""")
+
+		# the reader keeps its snapshot until its transaction ends
+		self.assertEqual(reader.execute("""SELECT COUNT(*) FROM Filter""").fetchone()[0], 0)
+		reader.execute("""COMMIT""")
+		self.assertEqual(reader.execute("""SELECT COUNT(*) FROM Filter""").fetchone()[0], 1)
+		reader.close()
+		writer.close()
+
+	def test_DatabasePath(self):
+		configFile = radnetDB.CONFIGFILE
+		environment = os.environ.pop(radnetDB.ENVIRONMENTVARIABLE, None)
+		try:
+			radnetDB.CONFIGFILE = os.path.join(self.directory, 'radnet.cfg')
+			self.assertEqual(radnetDB.databasePath(), radnetDB.DEFAULTDATABASE)
+
+			with open(radnetDB.CONFIGFILE, 'w') as f:
+				f.write('[database]\npath = ' + self.database + '\n')
+			self.assertEqual(radnetDB.databasePath(), self.database)
+
+			os.environ[radnetDB.ENVIRONMENTVARIABLE] = os.path.join(self.directory, 'other.db')
+			self.assertEqual(radnetDB.databasePath(), os.path.join(self.directory, 'other.db'))
+			self.assertEqual(radnetDB.databasePath(self.database), self.database)
+		finally:
+			radnetDB.CONFIGFILE = configFile
+			os.environ.pop(radnetDB.ENVIRONMENTVARIABLE, None)
+			if environment is not None:
+				os.environ[radnetDB.ENVIRONMENTVARIABLE] = environment
+
+	def test_SharedConnection(self):
+		conn = radnetDB.getConnection(self.database)
+		self.assertTrue(radnetDB.getConnection(os.path.join(self.directory, '.', 'radnet.db')) is conn)
+		radnetDB.closeConnections()
+		self.assertFalse(radnetDB.getConnection(self.database) is conn)
+		radnetDB.closeConnections()
+
+	def test_IngestAndRefitSideBySide(self):
+		import calculate
+		files = calculate.listDataFiles([DATADIR])
+		expected = sum(len(p[8]) for f in files for p in calculate.parseFile(f) if p[5] is not None)
+
+		# the first files are in the database before the refit starts, the rest come in while it runs
+		conn = radnetDB.connect(self.database)
+		calculate.writeParsed(conn, [p for f in files[:10] for p in calculate.parseFile(f) if p[5] is not None], calculate.IDCache())
+		filterIDs = [row[0] for row in conn.execute("""SELECT FilterID FROM Filter ORDER BY FilterID LIMIT 3""")]
+		conn.close()
+
+		start = multiprocessing.Event()
+		refitDone = multiprocessing.Event()
+		ingest = multiprocessing.Process(target = ingestFiles, args = (self.database, files[10:], start, refitDone))
+		refit = multiprocessing.Process(target = refitFilters, args = (self.database, filterIDs, start, refitDone))
+		ingest.start()
+		refit.start()
+		start.set()
+		refit.join()
+		ingest.join()
+		self.assertEqual(refit.exitcode, 0)
+		self.assertEqual(ingest.exitcode, 0)
+
+		conn = radnetDB.connect(self.database)
+		self.assertEqual(conn.execute("""SELECT COUNT(*) FROM RawData""").fetchone()[0], expected)
+		self.assertEqual(conn.execute("""SELECT COUNT(*) FROM Activity""").fetchone()[0], expected)
+		self.assertEqual(conn.execute("""SELECT COUNT(*) FROM AlphaCurve""").fetchone()[0], len(filterIDs))
+		self.assertEqual(conn.execute("""SELECT COUNT(*) FROM BetaCurve""").fetchone()[0], len(filterIDs))
+		conn.close()
+
+
+if __name__ == '__main__':
+	unittest.main()
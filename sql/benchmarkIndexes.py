@@ -0,0 +1,116 @@
+"""
+Benchmarks the lookups done by calculate.py and fitToCurve.py with and without the migrations.
+Synthetic databases are built at 1x, 10x and 100x the size of the current archive
+(117 filters with about 8 readings each) and every query is timed against the plain
+intial.sql schema and again after migrate.py has been applied.
+
+	python benchmarkIndexes.py [number of queries per test]
+"""
+import os
+import sys
+import random
+import sqlite3
+import tempfile
+import timeit
+
+import migrate
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FILTERS = 117
+READINGSPERFILTER = 8
+
+QUERIES = [
+	('AlphaEfficiency by Coefficient', """SELECT AlphaCoeffID FROM AlphaEfficiency WHERE Coefficient = ?""", 'coefficient'),
+	('RawData by FilterID, Time', """SELECT RawDataID FROM RawData WHERE FilterID = ? AND Time = ?""", 'reading'),
+	('Activity by FilterID, RawDataID', """SELECT * FROM Activity WHERE FilterID = ? AND RawDataID = ?""", 'activity'),
+	('Activity curve for FilterID', """SELECT DeltaT, AlphaAct, BetaAct FROM Activity WHERE FilterID = ?""", 'filter'),
+]
+
+
+def buildDatabase(path, scale):
+	"""Fills a fresh intial.sql database with scale times the current number of filters"""
+	random.seed(scale)
+	conn = sqlite3.connect(path)
+	with open(os.path.join(HERE, 'intial.sql'), 'r') as f:
+		conn.executescript(f.read())
+	# intial.sql turns foreign keys on, calculate.py and fitToCurve.py run with them off
+	conn.execute("""PRAGMA foreign_keys = OFF""")
+	with conn:
+		# a few coefficients get re-entered every time a calibration changes
+		coefficients = [round(1.0 + 0.01 * i, 2) for i in range(10 * scale)]
+		conn.executemany("""INSERT INTO AlphaEfficiency (Coefficient) VALUES (?)""", [(c,) for c in coefficients])
+		conn.executemany("""INSERT INTO BetaEfficiency (Coefficient) VALUES (?)""", [(c,) for c in coefficients])
+		filters = FILTERS * scale
+		conn.executemany("""INSERT INTO Filter (FilterID, FilterNum, StartDate, EndDate, SampleTime, SampleVolume, TimeStart, AlphaCoeffID, BetaCoeffID) VALUES (?,?,?,?,?,?,?,?,?)""",
+			[(i, i, 20110824, 20110828, 72.0, 4300.0, 13.5, 1, 1) for i in range(1, filters + 1)])
+		rawRows = []
+		activityRows = []
+		rawDataID = 0
+		for filterID in range(1, filters + 1):
+			for reading in range(READINGSPERFILTER):
+				rawDataID += 1
+				time = 13.5 + 0.25 * (reading + 1)
+				rawRows.append((rawDataID, filterID, time, random.randint(200, 2000), random.randint(3000, 25000), 500))
+				activityRows.append((filterID, rawDataID, time - 13.5, random.random() * 3000.0, random.random() * 20000.0))
+		conn.executemany("""INSERT INTO RawData (RawDataID, FilterID, Time, AlphaReading, BetaReading, CleanFilterCount) VALUES (?,?,?,?,?,?)""", rawRows)
+		conn.executemany("""INSERT INTO Activity (FilterID, RawDataID, DeltaT, AlphaAct, BetaAct) VALUES (?,?,?,?,?)""", activityRows)
+	conn.close()
+	return coefficients, rawRows
+
+
+def makeParameters(kind, coefficients, rawRows, count):
+	"""Random query parameters for one of the QUERIES"""
+	parameters = []
+	for i in range(count):
+		row = random.choice(rawRows)
+		if kind == 'coefficient':
+			parameters.append((random.choice(coefficients),))
+		elif kind == 'reading':
+			parameters.append((row[1], row[2]))
+		elif kind == 'activity':
+			parameters.append((row[1], row[0]))
+		else:
+			parameters.append((row[1],))
+	return parameters
+
+
+def timeQueries(path, parameterSets):
+	"""Returns the mean latency in microseconds of every query in QUERIES"""
+	conn = sqlite3.connect(path)
+	cur = conn.cursor()
+	latencies = []
+	for (name, sql, kind), parameters in zip(QUERIES, parameterSets):
+		start = timeit.default_timer()
+		for p in parameters:
+			cur.execute(sql, p)
+			cur.fetchall()
+		latencies.append((timeit.default_timer() - start) / len(parameters) * 1.0E6)
+	conn.close()
+	return latencies
+
+
+def benchmark(queryCount):
+	print "%-34s %6s %10s %14s %14s %8s" % ('query', 'scale', 'rows', 'no index (us)', 'indexed (us)', 'speedup')
+	for scale in [1, 10, 100]:
+		handle, path = tempfile.mkstemp(suffix = '.db')
+		os.close(handle)
+		try:
+			coefficients, rawRows = buildDatabase(path, scale)
+			parameterSets = [makeParameters(kind, coefficients, rawRows, queryCount) for name, sql, kind in QUERIES]
+			before = timeQueries(path, parameterSets)
+			conn = sqlite3.connect(path)
+			migrate.migrate(conn)
+			conn.close()
+			after = timeQueries(path, parameterSets)
+		finally:
+			os.remove(path)
+		for (name, sql, kind), b, a in zip(QUERIES, before, after):
+			print "%-34s %5dx %10d %14.1f %14.1f %7.1fx" % (name, scale, len(rawRows), b, a, b / a)
+
+
+if __name__ == "__main__":
+	if len(sys.argv) > 1:
+		benchmark(int(sys.argv[1]))
+	else:
+		benchmark(200)
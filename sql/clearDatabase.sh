@@ -1,4 +1,5 @@
 #!/bin/bash
 rm radnet.db
 sqlite3 radnet.db < intial.sql
+python migrate.py radnet.db
 sqlite3 radnet.db
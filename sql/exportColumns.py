@@ -0,0 +1,150 @@
+"""
+Exports RawData, Activity, AlphaCurve and BetaCurve to one .npy file per column, so analysis code can
+memory map them (numpy.load(mmap_mode='r')) instead of querying the database row by row.
+
+	python exportColumns.py [directory]
+
+With no directory the files go to columns/ next to this script. Every table is written sorted by
+FilterID (then by its primary key) and gets an index file of (FilterID, first row, last row + 1), so
+the rows of one filter are a contiguous slice of every column:
+	columns/Activity.DeltaT.npy
+	columns/Activity.AlphaAct.npy
+	...
+	columns/Activity.FilterIndex.npy
+
+Reading them back:
+	archive = ColumnArchive('columns')
+	activity = archive.filterRows('Activity', 12)
+	activity['DeltaT'], activity['AlphaAct']
+Only the pages of the requested filter are read from disk.
+"""
+import os
+import sys
+import datetime
+
+import numpy
+from numpy.lib.format import open_memmap
+
+import radnetDB
+
+
+DEFAULTDIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'columns')
+
+# exported tables and their columns, FilterID has to be first
+TABLES = [
+	('RawData', ['FilterID', 'RawDataID', 'Time', 'AlphaReading', 'BetaReading', 'CleanFilterCount']),
+	('Activity', ['FilterID', 'ActivityID', 'RawDataID', 'DeltaT', 'AlphaAct', 'BetaAct']),
+	('AlphaCurve', ['FilterID', 'AlphaCurveID', 'Alpha1', 'Alpha1Lambda', 'Alpha2', 'Alpha2Lambda']),
+	('BetaCurve', ['FilterID', 'BetaCurveID', 'Beta1', 'Beta1Lambda', 'Beta2', 'Beta2Lambda']),
+]
+
+# rows fetched from the database at a time
+CHUNKSIZE = 10000
+
+
+def columnFile(directory, table, column):
+	return os.path.join(directory, table + '.' + column + '.npy')
+
+
+def columnType(column):
+	"""IDs are stored as integers, every measurement as a double"""
+	if column.endswith('ID'):
+		return numpy.int64
+	return numpy.float64
+
+
+def exportTable(conn, directory, table, columns):
+	"""Writes one table to its column files and index. Returns the number of rows"""
+	rows = conn.execute("""SELECT COUNT(*) FROM """ + table).fetchone()[0]
+	arrays = [open_memmap(columnFile(directory, table, column), mode = 'w+', dtype = columnType(column), shape = (rows,)) for column in columns]
+
+	# the table is streamed into the column files, it never has to fit in memory
+	cur = conn.execute("""SELECT """ + ', '.join(columns) + """ FROM """ + table + """ ORDER BY FilterID, """ + columns[1])
+	start = 0
+	while True:
+		chunk = cur.fetchmany(CHUNKSIZE)
+		if not chunk:
+			break
+		for array, values in zip(arrays, zip(*chunk)):
+			# NULLs become nan (only possible in the float columns)
+			array[start:start + len(chunk)] = [numpy.nan if v is None else v for v in values]
+		start += len(chunk)
+	if start != rows:
+		raise ValueError(table + ' changed during the export')
+
+	filterIDs = numpy.asarray(arrays[0])
+	uniqueIDs, first, counts = numpy.unique(filterIDs, return_index = True, return_counts = True)
+	numpy.save(columnFile(directory, table, 'FilterIndex'), numpy.column_stack((uniqueIDs, first, first + counts)).astype(numpy.int64))
+	for array in arrays:
+		array.flush()
+	del arrays
+	return rows
+
+
+def exportColumns(directory = DEFAULTDIRECTORY, database = None):
+	"""Exports every table in TABLES to directory, all from the same snapshot of the database. Returns {table: rows}"""
+	begin = datetime.datetime.now()
+	if not os.path.isdir(directory):
+		os.makedirs(directory)
+	# a connection of its own for one read transaction, so the tables are consistent with each other even if an ingest is running
+	conn = radnetDB.connect(radnetDB.databasePath(database))
+	conn.isolation_level = None
+	exported = {}
+	try:
+		conn.execute("""BEGIN""")
+		for table, columns in TABLES:
+			exported[table] = exportTable(conn, directory, table, columns)
+		conn.execute("""COMMIT""")
+	finally:
+		conn.close()
+	elapsed = (datetime.datetime.now() - begin).total_seconds()
+	print "Exported " + ', '.join('%s (%d rows)' % (table, exported[table]) for table, columns in TABLES) + " to %s in %.3f s" % (directory, elapsed)
+	return exported
+
+
+class ColumnArchive(object):
+	"""Read access to a directory written by exportColumns(). Columns are memory mapped, nothing is loaded until it is sliced"""
+
+	def __init__(self, directory = DEFAULTDIRECTORY):
+		self.directory = directory
+		self.mapped = {}
+
+	def column(self, table, column):
+		"""Returns the whole column as a read only memory map"""
+		key = (table, column)
+		if key not in self.mapped:
+			self.mapped[key] = numpy.load(columnFile(self.directory, table, column), mmap_mode = 'r')
+		return self.mapped[key]
+
+	def columns(self, table):
+		"""Returns the names of the exported columns of a table"""
+		for name, columns in TABLES:
+			if name == table:
+				return columns
+		raise KeyError(table)
+
+	def filterIDs(self, table):
+		"""Returns the FilterIDs that have rows in the table"""
+		return self.column(table, 'FilterIndex')[:, 0]
+
+	def filterSlice(self, table, filterID):
+		"""Returns the slice of the table's rows that belong to the filter (an empty slice if there are none)"""
+		index = self.column(table, 'FilterIndex')
+		i = numpy.searchsorted(index[:, 0], filterID)
+		if i == len(index) or index[i, 0] != filterID:
+			return slice(0, 0)
+		return slice(int(index[i, 1]), int(index[i, 2]))
+
+	def filterRows(self, table, filterID, columns = None):
+		"""Returns {column: array} with the rows of one filter, the arrays are views into the memory maps"""
+		if columns is None:
+			columns = self.columns(table)
+		rows = self.filterSlice(table, filterID)
+		return dict((column, self.column(table, column)[rows]) for column in columns)
+
+
+if __name__ == "__main__":
+	if len(sys.argv) > 1:
+		exportColumns(sys.argv[1])
+	else:
+		exportColumns()
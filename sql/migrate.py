@@ -0,0 +1,77 @@
+"""
+Upgrades radnet database files in place. Every file in the migrations folder is named NNN_description.sql
+and is applied once, in order. The number of the last applied migration is kept in the database's
+PRAGMA user_version, so running this again only applies the new ones.
+
+	python migrate.py [database ...]
+
+With no arguments radnet.db and test.db next to this script are upgraded.
+"""
+import os
+import sys
+import sqlite3
+
+import radnetDB
+
+
+MIGRATIONDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+
+
+def listMigrations():
+	"""Returns a sorted list of (version, path) tuples for every migration script"""
+	migrations = []
+	for name in os.listdir(MIGRATIONDIR):
+		if name.endswith('.sql') and name[0:3].isdigit():
+			migrations.append((int(name[0:3]), os.path.join(MIGRATIONDIR, name)))
+	migrations.sort()
+	return migrations
+
+
+def schemaVersion(conn):
+	"""Returns the number of the last migration applied to the database"""
+	return conn.execute("""PRAGMA user_version""").fetchone()[0]
+
+
+def migrate(conn):
+	"""Applies every migration newer than the database's schema version. Each migration runs in its own transaction. Returns the new schema version"""
+	version = schemaVersion(conn)
+	for migrationVersion, path in listMigrations():
+		if migrationVersion <= version:
+			continue
+		with open(path, 'r') as f:
+			script = f.read()
+		try:
+			conn.executescript("BEGIN;\n" + script + "\nPRAGMA user_version = %d;\nCOMMIT;" % migrationVersion)
+		except sqlite3.Error, e:
+			# the BEGIN inside the script is invisible to the sqlite3 module, so roll back by hand
+			try:
+				conn.execute("""ROLLBACK""")
+			except sqlite3.Error:
+				pass
+			raise sqlite3.DatabaseError(os.path.basename(path) + ' failed: ' + str(e))
+		version = migrationVersion
+	return version
+
+
+def migrateFile(database):
+	"""Opens the database file, upgrades it and closes it again"""
+	conn = radnetDB.connect(database)
+	try:
+		before = schemaVersion(conn)
+		after = migrate(conn)
+	finally:
+		conn.close()
+	if before == after:
+		print database + " is up to date (version " + str(after) + ")"
+	else:
+		print database + " upgraded from version " + str(before) + " to " + str(after)
+
+
+if __name__ == "__main__":
+	if len(sys.argv) > 1:
+		databases = sys.argv[1:]
+	else:
+		here = os.path.dirname(os.path.abspath(__file__))
+		databases = [os.path.join(here, 'radnet.db'), os.path.join(here, 'test.db')]
+	for database in databases:
+		migrateFile(database)
@@ -0,0 +1,28 @@
+-- Indexes and UNIQUE constraints for the lookups done by calculate.py and fitToCurve.py.
+-- Any duplicate rows left behind by old reruns are removed first, otherwise the UNIQUE indexes can't be built.
+
+-- efficiencies: point filters at the first copy of a coefficient, then drop the other copies
+UPDATE Filter SET AlphaCoeffID = (SELECT MIN(a2.AlphaCoeffID) FROM AlphaEfficiency a1, AlphaEfficiency a2 WHERE a1.AlphaCoeffID = Filter.AlphaCoeffID AND a2.Coefficient = a1.Coefficient)
+	WHERE AlphaCoeffID IS NOT NULL;
+UPDATE Filter SET BetaCoeffID = (SELECT MIN(b2.BetaCoeffID) FROM BetaEfficiency b1, BetaEfficiency b2 WHERE b1.BetaCoeffID = Filter.BetaCoeffID AND b2.Coefficient = b1.Coefficient)
+	WHERE BetaCoeffID IS NOT NULL;
+DELETE FROM AlphaEfficiency WHERE AlphaCoeffID NOT IN (SELECT MIN(AlphaCoeffID) FROM AlphaEfficiency GROUP BY Coefficient);
+DELETE FROM BetaEfficiency WHERE BetaCoeffID NOT IN (SELECT MIN(BetaCoeffID) FROM BetaEfficiency GROUP BY Coefficient);
+
+-- readings: keep the first reading for each filter/time and its activity row
+DELETE FROM Activity WHERE RawDataID NOT IN (SELECT MIN(RawDataID) FROM RawData GROUP BY FilterID, Time);
+DELETE FROM RawData WHERE RawDataID NOT IN (SELECT MIN(RawDataID) FROM RawData GROUP BY FilterID, Time);
+DELETE FROM Activity WHERE ActivityID NOT IN (SELECT MIN(ActivityID) FROM Activity GROUP BY FilterID, RawDataID);
+
+-- calculate.py: coefficient -> ID lookups
+CREATE UNIQUE INDEX IF NOT EXISTS AlphaEfficiencyCoefficient ON AlphaEfficiency(Coefficient);
+CREATE UNIQUE INDEX IF NOT EXISTS BetaEfficiencyCoefficient ON BetaEfficiency(Coefficient);
+
+-- calculate.py: (FilterID, Time) -> RawDataID, RawDataID is the rowid so the index covers the lookup
+CREATE UNIQUE INDEX IF NOT EXISTS RawDataFilterTime ON RawData(FilterID, Time);
+
+-- calculate.py: existence check for (FilterID, RawDataID)
+CREATE UNIQUE INDEX IF NOT EXISTS ActivityFilterRawData ON Activity(FilterID, RawDataID);
+
+-- fitToCurve.py: SELECT DeltaT, AlphaAct, BetaAct FROM Activity WHERE FilterID = ? is answered from the index alone
+CREATE INDEX IF NOT EXISTS ActivityFilterCurve ON Activity(FilterID, DeltaT, AlphaAct, BetaAct);
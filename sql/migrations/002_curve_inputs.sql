@@ -0,0 +1,14 @@
+-- One curve per filter and curve table, and a record of what each curve was fitted from.
+-- InputHash is set by fitToCurve.py (a hash of the Activity data and the fit settings), a curve whose hash no
+-- longer matches its filter's data is refitted. Curves from before this migration have no hash and get refitted once.
+
+-- rerunning addCurved.sh added a row per run, keep the newest curve of every filter
+DELETE FROM AlphaCurve WHERE AlphaCurveID NOT IN (SELECT MAX(AlphaCurveID) FROM AlphaCurve GROUP BY FilterID);
+DELETE FROM BetaCurve WHERE BetaCurveID NOT IN (SELECT MAX(BetaCurveID) FROM BetaCurve GROUP BY FilterID);
+
+ALTER TABLE AlphaCurve ADD COLUMN InputHash TEXT;
+ALTER TABLE BetaCurve ADD COLUMN InputHash TEXT;
+
+-- fitToCurve.py: INSERT ... ON CONFLICT(FilterID) DO UPDATE
+CREATE UNIQUE INDEX IF NOT EXISTS AlphaCurveFilter ON AlphaCurve(FilterID);
+CREATE UNIQUE INDEX IF NOT EXISTS BetaCurveFilter ON BetaCurve(FilterID);
@@ -0,0 +1,127 @@
+"""
+Connection factory for the radnet database. Every program should open the database with connect() so
+they all run with the same settings:
+	journal_mode = WAL   readers never block the writer and the writer never blocks readers, so an
+	                     ingest can run while curves are being refitted
+	synchronous = NORMAL safe with WAL, only the checkpoint waits for the disk
+	cache_size/mmap_size keep the whole database in memory at its current size
+	busy timeout         a second writer waits for the lock instead of failing straight away
+
+Programs don't need to know where the database is. databasePath() picks, in this order, the path they
+pass in, the RADNET_DB environment variable, the path under [database] in radnet.cfg next to this
+module (relative paths are relative to this folder) and finally radnet.db next to this module:
+	[database]
+	path = test.db
+
+getConnection() hands out one shared connection per database and process, so a run over many filters
+or a program calling calculate and fitToCurve one after the other connects once. The query helpers at
+the bottom always send the same SQL text, so sqlite3's statement cache keeps them prepared.
+"""
+import os
+import atexit
+import operator
+import itertools
+import sqlite3
+import ConfigParser
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULTDATABASE = os.path.join(HERE, 'radnet.db')
+CONFIGFILE = os.path.join(HERE, 'radnet.cfg')
+ENVIRONMENTVARIABLE = 'RADNET_DB'
+
+
+# seconds a connection waits for another writer before giving up
+BUSYTIMEOUT = 30.0
+
+PRAGMAS = [
+	('journal_mode', 'WAL'),
+	('synchronous', 'NORMAL'),
+	('cache_size', '-16000'),		# in KiB when negative, 16 MB
+	('mmap_size', '268435456'),		# 256 MB
+	('temp_store', 'MEMORY'),
+	('busy_timeout', str(int(BUSYTIMEOUT * 1000))),
+]
+
+
+def connect(database):
+	"""Opens database with the PRAGMAS profile applied"""
+	conn = sqlite3.connect(database, timeout = BUSYTIMEOUT)
+	for name, value in PRAGMAS:
+		conn.execute("""PRAGMA %s = %s""" % (name, value))
+	return conn
+
+
+def databasePath(database = None):
+	"""Returns the absolute path of the database file to use, see the module docstring for the order"""
+	if database is None:
+		database = os.environ.get(ENVIRONMENTVARIABLE) or None
+	if database is None and os.path.isfile(CONFIGFILE):
+		config = ConfigParser.SafeConfigParser()
+		config.read(CONFIGFILE)
+		if config.has_option('database', 'path'):
+			database = os.path.join(HERE, config.get('database', 'path'))
+	if database is None:
+		database = DEFAULTDATABASE
+	return os.path.abspath(database)
+
+
+# (database path, process id) -> open connection
+connections = {}
+
+def getConnection(database = None):
+	"""Returns this process' shared connection to the database, opening it on first use. Don't close it, that happens at exit"""
+	key = (databasePath(database), os.getpid())
+	if key not in connections:
+		connections[key] = connect(key[0])
+	return connections[key]
+
+
+def closeConnections():
+	"""Closes the shared connections this process opened (connections inherited through fork are only forgotten)"""
+	for key in connections.keys():
+		if key[1] == os.getpid():
+			connections[key].close()
+		del connections[key]
+
+atexit.register(closeConnections)
+
+
+def filterID(conn, filterNum):
+	"""Returns the FilterID of a filter number or None if it isn't in the database"""
+	row = conn.execute("""SELECT FilterID FROM Filter WHERE FilterNum = ?""", (filterNum,)).fetchone()
+	if row is None:
+		return None
+	return row[0]
+
+
+def filterActivity(conn, filterID):
+	"""Returns the (DeltaT, AlphaAct, BetaAct) rows of a filter"""
+	return conn.execute("""SELECT DeltaT, AlphaAct, BetaAct FROM Activity WHERE FilterID = ?""", (filterID,)).fetchall()
+
+
+def activityByFilter(conn):
+	"""Generator yielding (FilterID, [(DeltaT, AlphaAct, BetaAct), ...]) for every filter, with one query for all of them"""
+	cur = conn.execute("""SELECT FilterID, DeltaT, AlphaAct, BetaAct FROM Activity ORDER BY FilterID""")
+	for filterID, rows in itertools.groupby(cur, operator.itemgetter(0)):
+		yield filterID, [row[1:] for row in rows]
+
+
+def curveHashes(conn):
+	"""Returns ({FilterID: InputHash} of AlphaCurve, {FilterID: InputHash} of BetaCurve)"""
+	return (dict(conn.execute("""SELECT FilterID, InputHash FROM AlphaCurve""").fetchall()),
+		dict(conn.execute("""SELECT FilterID, InputHash FROM BetaCurve""").fetchall()))
+
+
+def saveAlphaCurves(conn, rows):
+	"""Adds or replaces the AlphaCurve of each (FilterID, Alpha1, Alpha1Lambda, Alpha2, Alpha2Lambda, InputHash) row"""
+	conn.executemany("""INSERT INTO AlphaCurve (FilterID, Alpha1, Alpha1Lambda, Alpha2, Alpha2Lambda, InputHash) VALUES (?,?,?,?,?,?)
+		ON CONFLICT(FilterID) DO UPDATE SET Alpha1 = excluded.Alpha1, Alpha1Lambda = excluded.Alpha1Lambda,
+			Alpha2 = excluded.Alpha2, Alpha2Lambda = excluded.Alpha2Lambda, InputHash = excluded.InputHash""", rows)
+
+
+def saveBetaCurves(conn, rows):
+	"""Adds or replaces the BetaCurve of each (FilterID, Beta1, Beta1Lambda, Beta2, Beta2Lambda, InputHash) row"""
+	conn.executemany("""INSERT INTO BetaCurve (FilterID, Beta1, Beta1Lambda, Beta2, Beta2Lambda, InputHash) VALUES (?,?,?,?,?,?)
+		ON CONFLICT(FilterID) DO UPDATE SET Beta1 = excluded.Beta1, Beta1Lambda = excluded.Beta1Lambda,
+			Beta2 = excluded.Beta2, Beta2Lambda = excluded.Beta2Lambda, InputHash = excluded.InputHash""", rows)
@@ -4,8 +4,8 @@ import calculate
 from calculate import *
 
 sys.path.append('./fitToCurve')
-import splitData
-from splitData import *
+import fitToCurve
+import radnetDB
 
 def checkInput():
 	bla = raw_input('Do these numbers match up with data book? [y,n]: ')
@@ -24,8 +24,11 @@ def checkInput():
 			return False
 	
 calculate(sys.argv[1])
+#checkInput() moves the file, so read its filter numbers now
+filterNums = [p[0] for p in parseFile(sys.argv[1])]
 
 if checkInput() == True:
-	#run the fit curve program
-	fitToCurve(sys.argv[1] + 'Activity')
-	os.system('mv ' + sys.argv[1] + 'Activity ' + './fitToCurve')
+	#run the fit curve program on the filters of the file, calculate and fitToCurve share one connection
+	conn = radnetDB.getConnection()
+	for filterNum in filterNums:
+		fitToCurve.fitToCurve(radnetDB.filterID(conn, filterNum))